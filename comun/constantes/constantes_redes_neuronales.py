@@ -1,4 +1,6 @@
 TAMAÑO_ENTRADA_DIGITOS = 35
+FILAS_DIGITO = 7
+COLUMNAS_DIGITO = 5
 NUMERO_CLASES_DIGITOS = 10
 TAMAÑO_ENTRADA_XOR = 2
 TAMAÑO_SALIDA_XOR = 1
@@ -7,8 +9,51 @@ TASA_APRENDIZAJE_DEFECTO = 0.1
 EPOCAS_MAXIMAS_DEFECTO = 10000
 ERROR_OBJETIVO_DEFECTO = 0.01
 INTERVALO_IMPRESION_DEFECTO = 1000
+INTERVALO_ERROR_DEFECTO = 1
+PACIENCIA_DETENCION_DEFECTO = 100
+PACIENCIA_MESETA_DEFECTO = 50
+FACTOR_REDUCCION_TASA_DEFECTO = 0.5
+TASA_APRENDIZAJE_MINIMA_DEFECTO = 1e-6
+EPOCAS_PERFILADO_DEFECTO = 200
+DIVISIONES_POR_GRUPO_DEFECTO = 64
+
+TIPOS_METRICAS = ('binaria', 'multiclase')
+
+MODOS_ENTRENAMIENTO_PERCEPTRON = ('online', 'lote')
+CAPACIDAD_HUELLAS_CICLO = 1024
+DECIMALES_HUELLA_PESOS = 8
+INICIALIZACIONES_PERCEPTRON = ('aleatoria', 'minimos_cuadrados')
+TAMAÑO_BLOQUE_DEFECTO = 4096
+CAPACIDAD_HISTORIAL_DEFECTO = 1024
+TAMAÑO_BLOQUE_CORPUS = 65536
+LIMITE_VALORES_UNICOS = 1000
+
+MOMENTO_DEFECTO = 0.9
+DECAIMIENTO_RMSPROP_DEFECTO = 0.9
+BETA1_ADAM_DEFECTO = 0.9
+BETA2_ADAM_DEFECTO = 0.999
+EPSILON_OPTIMIZADOR = 1e-8
+PASO_INICIAL_RPROP = 0.1
+PASO_MINIMO_RPROP = 1e-6
+PASO_MAXIMO_RPROP = 50.0
+FACTOR_AUMENTO_RPROP = 1.2
+FACTOR_DISMINUCION_RPROP = 0.5
+
+ITERACIONES_MAXIMAS_LM = 200
+AMORTIGUAMIENTO_INICIAL_LM = 1e-3
+FACTOR_AMORTIGUAMIENTO_LM = 10.0
+AMORTIGUAMIENTO_MAXIMO_LM = 1e10
+
+TIPOS_DATOS_DISPONIBLES = ('float32', 'float64')
+TIPO_DATOS_DEFECTO = 'float32'
+
+FUNCIONES_PERDIDA = ('error_cuadratico_medio', 'entropia_cruzada')
+ACTIVACIONES_SALIDA_ENTROPIA_CRUZADA = ('softmax', 'sigmoide')
 
 PROBABILIDAD_RUIDO_DEFECTO = 0.02
+PROBABILIDADES_CURVA_RUIDO = (0.0, 0.02, 0.05, 0.1, 0.15, 0.2, 0.3)
+ENSAYOS_RUIDO_DEFECTO = 50
+NIVEL_CONFIANZA_DEFECTO = 0.95
 PORCENTAJE_ENTRENAMIENTO = 0.8
 PORCENTAJE_PRUEBA = 0.2
 
@@ -45,8 +90,12 @@ PATRONES_OR_SALIDA = [1, 1, -1, 1]
 ARCHIVO_DATOS_DIGITOS = "numeros_decimales.txt"
 ARCHIVO_ENTRENAMIENTO_TP1 = "TP1-ej2-Conjunto-entrenamiento.txt"
 ARCHIVO_SALIDA_TP1 = "TP1-ej2-Salida-deseada.txt"
+DIRECTORIO_CACHE_COMPARACION = "cache_comparacion"
+ARCHIVO_ENUMERACION_DIVISIONES = "enumeracion_divisiones.csv"
 
 MENSAJE_CONVERGENCIA = "¡Convergencia alcanzada!"
 MENSAJE_NO_CONVERGENCIA = "No se alcanzó la convergencia en el número máximo de épocas."
+MENSAJE_SOLUCION_CERRADA = "Solución cerrada por mínimos cuadrados calculada."
+MENSAJE_CICLO_DETECTADO = "Ciclo de pesos detectado: el problema no es linealmente separable."
 MENSAJE_INICIO_ENTRENAMIENTO = "Iniciando entrenamiento..."
 MENSAJE_FIN_ENTRENAMIENTO = "Entrenamiento completado."
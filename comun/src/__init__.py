@@ -1,9 +1,21 @@
 from .funciones_activacion import FuncionesActivacion
 from .utilidades_matematicas import UtilidadesMatematicas
-from .evaluador_rendimiento import EvaluadorRendimiento
+from .historial_entrenamiento import HistorialEntrenamiento
+from .evaluador_rendimiento import EvaluadorRendimiento, AcumuladorMetricas
+from .cache_datos import CacheDatos
+from .callbacks_entrenamiento import (
+    CallbackEntrenamiento, RegistroProgreso, DetencionTemprana, ReduccionTasaEnMeseta
+)
 
 __all__ = [
     'FuncionesActivacion',
     'UtilidadesMatematicas', 
-    'EvaluadorRendimiento'
+    'HistorialEntrenamiento',
+    'EvaluadorRendimiento',
+    'AcumuladorMetricas',
+    'CacheDatos',
+    'CallbackEntrenamiento',
+    'RegistroProgreso',
+    'DetencionTemprana',
+    'ReduccionTasaEnMeseta'
 ]
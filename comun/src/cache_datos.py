@@ -0,0 +1,90 @@
+import os
+import json
+import hashlib
+import numpy as np
+from typing import Callable, Dict, Optional
+
+class CacheDatos:
+
+    SUFIJO_ARREGLO = '.cache.npy'
+    SUFIJO_METADATOS = '.cache.json'
+    
+    @staticmethod
+    def calcular_clave(ruta_origen: str) -> str:
+
+        estado = os.stat(ruta_origen)
+        identificador = f"{os.path.abspath(ruta_origen)}|{estado.st_size}|{estado.st_mtime_ns}"
+        return hashlib.sha1(identificador.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def obtener_ruta_arreglo(cls, ruta_origen: str, nombre: str) -> str:
+
+        return f"{ruta_origen}.{nombre}{cls.SUFIJO_ARREGLO}"
+    
+    @classmethod
+    def obtener_ruta_metadatos(cls, ruta_origen: str) -> str:
+
+        return f"{ruta_origen}{cls.SUFIJO_METADATOS}"
+    
+    @classmethod
+    def _leer_cache(cls, ruta_origen: str, clave: str,
+                   mmap_mode: Optional[str]) -> Optional[Dict[str, np.ndarray]]:
+
+        ruta_metadatos = cls.obtener_ruta_metadatos(ruta_origen)
+        
+        try:
+            with open(ruta_metadatos, 'r', encoding='utf-8') as archivo:
+                metadatos = json.load(archivo)
+            
+            if metadatos.get('clave') != clave:
+                return None
+            
+            return {
+                nombre: np.load(cls.obtener_ruta_arreglo(ruta_origen, nombre), mmap_mode=mmap_mode)
+                for nombre in metadatos['arreglos']
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    @classmethod
+    def _escribir_cache(cls, ruta_origen: str, clave: str, arreglos: Dict[str, np.ndarray]) -> None:
+
+        try:
+            for nombre, arreglo in arreglos.items():
+                ruta_arreglo = cls.obtener_ruta_arreglo(ruta_origen, nombre)
+                ruta_temporal = f"{ruta_arreglo}.{os.getpid()}.tmp"
+                with open(ruta_temporal, 'wb') as archivo:
+                    np.save(archivo, np.ascontiguousarray(arreglo))
+                os.replace(ruta_temporal, ruta_arreglo)
+            
+            ruta_metadatos = cls.obtener_ruta_metadatos(ruta_origen)
+            ruta_temporal = f"{ruta_metadatos}.{os.getpid()}.tmp"
+            with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+                json.dump({'clave': clave, 'arreglos': list(arreglos.keys())}, archivo)
+            os.replace(ruta_temporal, ruta_metadatos)
+        except OSError:
+            pass
+    
+    @classmethod
+    def cargar_o_generar(cls, ruta_origen: str,
+                         generar_arreglos: Callable[[], Dict[str, np.ndarray]],
+                         mmap_mode: Optional[str] = 'r') -> Dict[str, np.ndarray]:
+
+        clave = cls.calcular_clave(ruta_origen)
+        
+        arreglos = cls._leer_cache(ruta_origen, clave, mmap_mode)
+        if arreglos is not None:
+            return arreglos
+        
+        arreglos = generar_arreglos()
+        cls._escribir_cache(ruta_origen, clave, arreglos)
+        
+        return arreglos
+    
+    @classmethod
+    def invalidar(cls, ruta_origen: str) -> None:
+
+        try:
+            os.remove(cls.obtener_ruta_metadatos(ruta_origen))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,227 @@
+import time
+import numpy as np
+from typing import List, Optional
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from comun.constantes.constantes_redes_neuronales import (
+    INTERVALO_IMPRESION_DEFECTO, PACIENCIA_DETENCION_DEFECTO, PACIENCIA_MESETA_DEFECTO,
+    FACTOR_REDUCCION_TASA_DEFECTO, TASA_APRENDIZAJE_MINIMA_DEFECTO
+)
+
+class CallbackEntrenamiento:
+
+    def requiere_error(self, epoca: int) -> bool:
+
+        return False
+    
+    def al_iniciar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        pass
+    
+    def al_finalizar_epoca(self, modelo, epoca: int, registro: dict) -> bool:
+
+        return False
+    
+    def al_finalizar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        pass
+    
+    @staticmethod
+    def notificar_fin_epoca(callbacks: List['CallbackEntrenamiento'], modelo, epoca: int,
+                            registro: dict) -> bool:
+
+        solicitudes_detencion = [callback.al_finalizar_epoca(modelo, epoca, registro)
+                                 for callback in callbacks]
+        return any(solicitudes_detencion)
+
+class RegistroProgreso(CallbackEntrenamiento):
+
+    def __init__(self, intervalo: int = INTERVALO_IMPRESION_DEFECTO,
+                 intervalo_segundos: Optional[float] = None):
+
+        self.intervalo = intervalo
+        self.intervalo_segundos = intervalo_segundos
+        self.ultimo_registro = 0.0
+    
+    def requiere_error(self, epoca: int) -> bool:
+
+        return epoca % self.intervalo == 0
+    
+    def al_iniciar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        self.ultimo_registro = 0.0
+    
+    def al_finalizar_epoca(self, modelo, epoca: int, registro: dict) -> bool:
+
+        if epoca % self.intervalo != 0 or registro.get('error') is None:
+            return False
+        
+        ahora = time.perf_counter()
+        if self.intervalo_segundos is not None and ahora - self.ultimo_registro < self.intervalo_segundos:
+            return False
+        
+        self.ultimo_registro = ahora
+        print(f"Época {epoca:>6}: Error = {registro['error']:.6f} | "
+              f"Tasa de aprendizaje = {registro['tasa_aprendizaje']:.6g}")
+        return False
+    
+    def al_finalizar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        motivo = registro.get('motivo_detencion')
+        if motivo is not None:
+            print(f"Entrenamiento detenido: {motivo}")
+
+class DetencionTemprana(CallbackEntrenamiento):
+
+    def __init__(self, entradas_validacion: Optional[np.ndarray] = None,
+                 salidas_validacion: Optional[np.ndarray] = None,
+                 paciencia: int = PACIENCIA_DETENCION_DEFECTO,
+                 delta_minimo: float = 0.0,
+                 intervalo_evaluacion: int = 1,
+                 restaurar_mejores_pesos: bool = True):
+
+        if (entradas_validacion is None) != (salidas_validacion is None):
+            raise ValueError("Deben indicarse tanto las entradas como las salidas de validación")
+        
+        self.entradas_validacion = entradas_validacion
+        self.salidas_validacion = salidas_validacion
+        self.paciencia = paciencia
+        self.delta_minimo = delta_minimo
+        self.intervalo_evaluacion = intervalo_evaluacion
+        self.restaurar_mejores_pesos = restaurar_mejores_pesos
+        self._reiniciar()
+    
+    def _reiniciar(self) -> None:
+
+        self.mejor_error = np.inf
+        self.mejor_epoca = -1
+        self.mejores_parametros = None
+        self._parametros_previos = None
+        self.epocas_sin_mejora = 0
+        self.detenido = False
+        self.historial_validacion: List[float] = []
+    
+    def requiere_error(self, epoca: int) -> bool:
+
+        return self.entradas_validacion is None and epoca % self.intervalo_evaluacion == 0
+    
+    def _usa_error_entrenamiento(self) -> bool:
+
+        return self.entradas_validacion is None
+    
+    def al_iniciar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        self._reiniciar()
+        if self.restaurar_mejores_pesos and self._usa_error_entrenamiento():
+            self._parametros_previos = modelo.obtener_parametros()
+    
+    def al_finalizar_epoca(self, modelo, epoca: int, registro: dict) -> bool:
+
+        if epoca % self.intervalo_evaluacion != 0:
+            self._guardar_parametros_previos(modelo, epoca)
+            return False
+        
+        if self._usa_error_entrenamiento():
+            error = registro.get('error')
+            parametros_evaluados = self._parametros_previos
+            self._guardar_parametros_previos(modelo, epoca)
+            if error is None:
+                return False
+        else:
+            error = modelo.calcular_error_conjunto(self.entradas_validacion, self.salidas_validacion)
+            self.historial_validacion.append(error)
+            registro['error_validacion'] = error
+            parametros_evaluados = None
+        
+        if error < self.mejor_error - self.delta_minimo:
+            self.mejor_error = error
+            self.mejor_epoca = epoca
+            self.epocas_sin_mejora = 0
+            if self.restaurar_mejores_pesos:
+                self.mejores_parametros = (parametros_evaluados if parametros_evaluados is not None
+                                           else modelo.obtener_parametros())
+            return False
+        
+        self.epocas_sin_mejora += self.intervalo_evaluacion
+        if self.epocas_sin_mejora >= self.paciencia:
+            self.detenido = True
+            registro['motivo_detencion'] = (f"detención temprana (mejor época: {self.mejor_epoca}, "
+                                            f"mejor error: {self.mejor_error:.6f})")
+            return True
+        
+        return False
+    
+    def _guardar_parametros_previos(self, modelo, epoca: int) -> None:
+
+        if (self.restaurar_mejores_pesos and self._usa_error_entrenamiento()
+                and (epoca + 1) % self.intervalo_evaluacion == 0):
+            self._parametros_previos = modelo.obtener_parametros()
+    
+    def al_finalizar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        if (self.restaurar_mejores_pesos and self.mejores_parametros is not None
+                and not registro.get('convergencia', False)):
+            modelo.establecer_parametros(self.mejores_parametros)
+
+class ReduccionTasaEnMeseta(CallbackEntrenamiento):
+
+    def __init__(self, factor: float = FACTOR_REDUCCION_TASA_DEFECTO,
+                 paciencia: int = PACIENCIA_MESETA_DEFECTO,
+                 delta_minimo: float = 0.0,
+                 tasa_minima: float = TASA_APRENDIZAJE_MINIMA_DEFECTO,
+                 detener_en_tasa_minima: bool = True):
+
+        if not 0 < factor < 1:
+            raise ValueError("El factor de reducción debe estar entre 0 y 1")
+        
+        self.factor = factor
+        self.paciencia = paciencia
+        self.delta_minimo = delta_minimo
+        self.tasa_minima = tasa_minima
+        self.detener_en_tasa_minima = detener_en_tasa_minima
+        self.mejor_error = np.inf
+        self.epocas_sin_mejora = 0
+        self.reducciones: List[int] = []
+    
+    def requiere_error(self, epoca: int) -> bool:
+
+        return True
+    
+    def al_iniciar_entrenamiento(self, modelo, registro: dict) -> None:
+
+        self.mejor_error = np.inf
+        self.epocas_sin_mejora = 0
+        self.reducciones = []
+    
+    def al_finalizar_epoca(self, modelo, epoca: int, registro: dict) -> bool:
+
+        error = registro.get('error')
+        if error is None:
+            return False
+        
+        if error < self.mejor_error - self.delta_minimo:
+            self.mejor_error = error
+            self.epocas_sin_mejora = 0
+            return False
+        
+        self.epocas_sin_mejora += 1
+        if self.epocas_sin_mejora < self.paciencia:
+            return False
+        
+        self.epocas_sin_mejora = 0
+        tasa_actual = registro['tasa_aprendizaje']
+        nueva_tasa = max(tasa_actual * self.factor, self.tasa_minima)
+        
+        if nueva_tasa < tasa_actual:
+            registro['tasa_aprendizaje'] = nueva_tasa
+            self.reducciones.append(epoca)
+            return False
+        
+        if self.detener_en_tasa_minima:
+            registro['motivo_detencion'] = f"meseta con tasa de aprendizaje mínima ({tasa_actual:.6g})"
+            return True
+        
+        return False
@@ -1,17 +1,40 @@
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from statistics import NormalDist
+from typing import Dict, Iterable, List, Tuple, Optional
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
 from .utilidades_matematicas import UtilidadesMatematicas
+from .historial_entrenamiento import HistorialEntrenamiento
+from comun.constantes.constantes_redes_neuronales import (
+    TIPOS_METRICAS, CAPACIDAD_HISTORIAL_DEFECTO, ENSAYOS_RUIDO_DEFECTO, NIVEL_CONFIANZA_DEFECTO
+)
 
 class EvaluadorRendimiento:
 
-    def __init__(self):
-        self.historial_errores: List[float] = []
-        self.historial_precision: List[float] = []
+    def __init__(self, capacidad_historial: int = CAPACIDAD_HISTORIAL_DEFECTO,
+                 ventana_historial: Optional[int] = None,
+                 factor_diezmado: Optional[int] = None):
+        self.historial_errores = HistorialEntrenamiento(capacidad_historial, ventana_historial,
+                                                        factor_diezmado)
+        self.historial_precision = HistorialEntrenamiento(capacidad_historial, ventana_historial,
+                                                          factor_diezmado)
+    
+    @staticmethod
+    def _alinear_tipo_datos(predicciones: np.ndarray, valores_reales: np.ndarray) -> np.ndarray:
+
+        if np.issubdtype(predicciones.dtype, np.floating):
+            return np.asarray(valores_reales, dtype=predicciones.dtype)
+        return valores_reales
     
     def evaluar_clasificacion_binaria(self, predicciones: np.ndarray, 
                                     valores_reales: np.ndarray,
                                     umbral: float = 0.0) -> Dict[str, float]:
 
+        valores_reales = self._alinear_tipo_datos(predicciones, valores_reales)
+        
         pred_binarias = (predicciones > umbral).astype(int)
         real_binarias = (valores_reales > umbral).astype(int)
         
@@ -42,6 +65,8 @@ class EvaluadorRendimiento:
     def evaluar_clasificacion_multiclase(self, predicciones: np.ndarray,
                                        valores_reales: np.ndarray) -> Dict[str, float]:
 
+        valores_reales = self._alinear_tipo_datos(predicciones, valores_reales)
+        
         clases_predichas = np.argmax(predicciones, axis=1)
         clases_reales = np.argmax(valores_reales, axis=1)
         
@@ -56,43 +81,56 @@ class EvaluadorRendimiento:
             'clases_reales': clases_reales
         }
     
-    def generar_matriz_confusion(self, clases_predichas: np.ndarray,
+    @staticmethod
+    def generar_matriz_confusion(clases_predichas: np.ndarray,
                                clases_reales: np.ndarray,
                                num_clases: int) -> np.ndarray:
 
-        matriz = np.zeros((num_clases, num_clases), dtype=int)
-        
-        for real, predicha in zip(clases_reales, clases_predichas):
-            matriz[real, predicha] += 1
+        indices = (np.asarray(clases_reales, dtype=np.intp).ravel() * num_clases
+                   + np.asarray(clases_predichas, dtype=np.intp).ravel())
         
-        return matriz
+        return np.bincount(indices, minlength=num_clases * num_clases).reshape(num_clases, num_clases)
     
     def registrar_error(self, error: float) -> None:
 
-        self.historial_errores.append(error)
+        self.historial_errores.agregar(error)
     
     def registrar_precision(self, precision: float) -> None:
 
-        self.historial_precision.append(precision)
+        self.historial_precision.agregar(precision)
     
     def obtener_estadisticas_entrenamiento(self) -> Dict[str, float]:
 
-        if not self.historial_errores:
+        estadisticas = self.historial_errores.obtener_estadisticas()
+        if not estadisticas:
             return {}
         
         return {
-            'error_inicial': self.historial_errores[0],
-            'error_final': self.historial_errores[-1],
-            'error_minimo': min(self.historial_errores),
-            'error_maximo': max(self.historial_errores),
-            'reduccion_error': (self.historial_errores[0] - self.historial_errores[-1]) / self.historial_errores[0] * 100,
-            'epocas_entrenamiento': len(self.historial_errores)
+            'error_inicial': estadisticas['inicial'],
+            'error_final': estadisticas['final'],
+            'error_minimo': estadisticas['minimo'],
+            'error_maximo': estadisticas['maximo'],
+            'error_medio': estadisticas['media'],
+            'reduccion_error': (estadisticas['inicial'] - estadisticas['final']) / estadisticas['inicial'] * 100,
+            'epocas_entrenamiento': estadisticas['num_registros']
         }
     
     def limpiar_historial(self) -> None:
 
-        self.historial_errores.clear()
-        self.historial_precision.clear()
+        self.historial_errores.limpiar()
+        self.historial_precision.limpiar()
+    
+    def evaluar_por_lotes(self, red_neuronal,
+                          bloques: Iterable[Tuple[np.ndarray, np.ndarray]],
+                          tipo: str = 'binaria', umbral: float = 0.0,
+                          num_clases: Optional[int] = None) -> Dict[str, float]:
+
+        acumulador = AcumuladorMetricas(tipo, umbral, num_clases)
+        
+        for entradas_bloque, reales_bloque in bloques:
+            acumulador.actualizar(red_neuronal.predecir(entradas_bloque), reales_bloque)
+        
+        return acumulador.resultado()
     
     def evaluar_robustez_ruido(self, red_neuronal, datos_limpios: np.ndarray,
                              datos_con_ruido: np.ndarray, 
@@ -112,3 +150,139 @@ class EvaluadorRendimiento:
             'degradacion_precision': degradacion_precision,
             'robustez_porcentaje': (1 - degradacion_precision) * 100
         }
+    
+    @staticmethod
+    def _calcular_aciertos(predicciones: np.ndarray, etiquetas: np.ndarray,
+                           tipo: str, umbral: float) -> np.ndarray:
+
+        if tipo == 'binaria':
+            return (predicciones[..., 0] > umbral) == (np.ravel(etiquetas) > umbral)
+        
+        clases_reales = np.argmax(etiquetas, axis=1) if np.ndim(etiquetas) == 2 else np.ravel(etiquetas)
+        return np.argmax(predicciones, axis=-1) == clases_reales
+    
+    def calcular_curva_robustez(self, red_neuronal, datos: np.ndarray, etiquetas: np.ndarray,
+                                probabilidades: List[float], num_ensayos: int = ENSAYOS_RUIDO_DEFECTO,
+                                tipo: str = 'binaria', umbral: float = 0.0,
+                                nivel_confianza: float = NIVEL_CONFIANZA_DEFECTO,
+                                semilla: Optional[int] = None) -> Dict[str, np.ndarray]:
+
+        if tipo not in TIPOS_METRICAS:
+            raise ValueError(f"Tipo de métrica '{tipo}' no válido. "
+                           f"Opciones: {list(TIPOS_METRICAS)}")
+        
+        datos = np.asarray(datos)
+        probabilidades = np.asarray(probabilidades, dtype=float)
+        
+        datos_con_ruido = UtilidadesMatematicas.generar_ruido_binario_multinivel(
+            datos, probabilidades, num_ensayos, np.random.default_rng(semilla)
+        )
+        
+        predicciones = red_neuronal.predecir(datos_con_ruido.reshape(-1, datos.shape[-1]))
+        predicciones = predicciones.reshape(datos_con_ruido.shape[:3] + (-1,))
+        
+        precisiones = np.mean(self._calcular_aciertos(predicciones, etiquetas, tipo, umbral), axis=2)
+        precision_sin_ruido = float(np.mean(self._calcular_aciertos(
+            np.reshape(red_neuronal.predecir(datos), (len(datos), -1)), etiquetas, tipo, umbral
+        )))
+        
+        media = precisiones.mean(axis=1)
+        desviacion = precisiones.std(axis=1, ddof=1) if num_ensayos > 1 else np.zeros_like(media)
+        margen = NormalDist().inv_cdf(0.5 + nivel_confianza / 2) * desviacion / np.sqrt(num_ensayos)
+        
+        return {
+            'probabilidades': probabilidades,
+            'num_ensayos': num_ensayos,
+            'precision_sin_ruido': precision_sin_ruido,
+            'precisiones': precisiones,
+            'precision_media': media,
+            'precision_desviacion': desviacion,
+            'banda_inferior': np.clip(media - margen, 0.0, 1.0),
+            'banda_superior': np.clip(media + margen, 0.0, 1.0),
+            'percentil_inferior': np.percentile(precisiones, 100 * (1 - nivel_confianza) / 2, axis=1),
+            'percentil_superior': np.percentile(precisiones, 100 * (1 + nivel_confianza) / 2, axis=1),
+            'degradacion_media': precision_sin_ruido - media
+        }
+
+class AcumuladorMetricas:
+
+    def __init__(self, tipo: str = 'binaria', umbral: float = 0.0,
+                 num_clases: Optional[int] = None):
+
+        if tipo not in TIPOS_METRICAS:
+            raise ValueError(f"Tipo de métrica '{tipo}' no válido. "
+                           f"Opciones: {list(TIPOS_METRICAS)}")
+        
+        self.tipo = tipo
+        self.umbral = umbral
+        self.num_clases = 2 if tipo == 'binaria' else num_clases
+        self.reiniciar()
+    
+    def reiniciar(self) -> None:
+
+        self.matriz_confusion = (np.zeros((self.num_clases, self.num_clases), dtype=np.int64)
+                                 if self.num_clases is not None else None)
+        self.suma_errores_cuadraticos = 0.0
+        self.num_elementos = 0
+        self.num_muestras = 0
+    
+    def _obtener_clases(self, valores: np.ndarray) -> np.ndarray:
+
+        if self.tipo == 'binaria':
+            return (np.ravel(valores) > self.umbral).astype(np.intp)
+        return np.argmax(valores, axis=1)
+    
+    def actualizar(self, predicciones_lote: np.ndarray, reales_lote: np.ndarray) -> None:
+
+        predicciones_lote = np.asarray(predicciones_lote)
+        reales_lote = EvaluadorRendimiento._alinear_tipo_datos(predicciones_lote, reales_lote)
+        reales_lote = np.asarray(reales_lote).reshape(predicciones_lote.shape)
+        
+        if self.matriz_confusion is None:
+            self.num_clases = predicciones_lote.shape[1]
+            self.matriz_confusion = np.zeros((self.num_clases, self.num_clases), dtype=np.int64)
+        
+        self.matriz_confusion += EvaluadorRendimiento.generar_matriz_confusion(
+            self._obtener_clases(predicciones_lote), self._obtener_clases(reales_lote),
+            self.num_clases
+        )
+        
+        diferencias = reales_lote - predicciones_lote
+        self.suma_errores_cuadraticos += float(np.dot(diferencias.ravel(), diferencias.ravel()))
+        self.num_elementos += diferencias.size
+        self.num_muestras += len(predicciones_lote)
+    
+    def resultado(self) -> Dict[str, float]:
+
+        if self.num_muestras == 0:
+            return {}
+        
+        matriz = self.matriz_confusion
+        error_cuadratico = self.suma_errores_cuadraticos / self.num_elementos
+        precision = np.trace(matriz) / self.num_muestras
+        
+        if self.tipo == 'multiclase':
+            return {
+                'precision': precision,
+                'error_cuadratico_medio': error_cuadratico,
+                'matriz_confusion': matriz.copy(),
+                'num_muestras': self.num_muestras
+            }
+        
+        verdaderos_negativos, falsos_positivos = matriz[0]
+        falsos_negativos, verdaderos_positivos = matriz[1]
+        
+        sensibilidad = verdaderos_positivos / (verdaderos_positivos + falsos_negativos) if (verdaderos_positivos + falsos_negativos) > 0 else 0
+        especificidad = verdaderos_negativos / (verdaderos_negativos + falsos_positivos) if (verdaderos_negativos + falsos_positivos) > 0 else 0
+        
+        return {
+            'precision': precision,
+            'error_cuadratico_medio': error_cuadratico,
+            'sensibilidad': sensibilidad,
+            'especificidad': especificidad,
+            'verdaderos_positivos': verdaderos_positivos,
+            'verdaderos_negativos': verdaderos_negativos,
+            'falsos_positivos': falsos_positivos,
+            'falsos_negativos': falsos_negativos,
+            'num_muestras': self.num_muestras
+        }
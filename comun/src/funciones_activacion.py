@@ -1,48 +1,114 @@
 import numpy as np
-from typing import Callable
+from typing import Callable, Optional
 
 class FuncionesActivacion:
 
+    LIMITE_EXPONENTE_DEFECTO = 500
+    LIMITES_EXPONENTE = {np.dtype(np.float32): 88, np.dtype(np.float16): 11}
+    
+    @classmethod
+    def _obtener_limite_exponente(cls, x: np.ndarray) -> float:
+
+        return cls.LIMITES_EXPONENTE.get(np.result_type(x), cls.LIMITE_EXPONENTE_DEFECTO)
+    
     @staticmethod
-    def escalon(x: np.ndarray) -> np.ndarray:
+    def escalon(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        return np.where(x >= 0, 1, -1)
+        if salida is None:
+            return np.where(x >= 0, 1, -1)
+        
+        np.greater_equal(x, 0, out=salida)
+        salida *= 2
+        salida -= 1
+        return salida
     
     @staticmethod
-    def escalon_derivada(x: np.ndarray) -> np.ndarray:
+    def escalon_derivada(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        return np.zeros_like(x)
+        if salida is None:
+            return np.zeros_like(x)
+        
+        salida.fill(0)
+        return salida
+    
+    @classmethod
+    def sigmoide(cls, x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
+
+        limite = cls._obtener_limite_exponente(x if salida is None else salida)
+        
+        if salida is None:
+            x_clipped = np.clip(x, -limite, limite)
+            return 1 / (1 + np.exp(-x_clipped))
+        
+        np.clip(x, -limite, limite, out=salida)
+        np.negative(salida, out=salida)
+        np.exp(salida, out=salida)
+        salida += 1
+        np.reciprocal(salida, out=salida)
+        return salida
     
     @staticmethod
-    def sigmoide(x: np.ndarray) -> np.ndarray:
+    def sigmoide_derivada(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        x_clipped = np.clip(x, -500, 500)
-        return 1 / (1 + np.exp(-x_clipped))
+        if salida is None:
+            return x * (1 - x)
+        
+        np.subtract(1, x, out=salida)
+        salida *= x
+        return salida
+    
+    @staticmethod
+    def tanh(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
+
+        return np.tanh(x, out=salida)
+    
+    @staticmethod
+    def tanh_derivada(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
+
+        if salida is None:
+            return 1 - x * x
+        
+        np.multiply(x, x, out=salida)
+        np.subtract(1, salida, out=salida)
+        return salida
     
     @staticmethod
-    def sigmoide_derivada(x: np.ndarray) -> np.ndarray:
+    def softmax(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        return x * (1 - x)
+        maximo = np.max(x, axis=-1, keepdims=True)
+        salida = np.exp(np.subtract(x, maximo, out=salida), out=salida)
+        salida /= np.sum(salida, axis=-1, keepdims=True)
+        return salida
     
     @staticmethod
-    def tanh(x: np.ndarray) -> np.ndarray:
+    def softmax_derivada(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        return np.tanh(x)
+        raise ValueError("La derivada de softmax no es elemento a elemento: softmax solo está "
+                         "soportada en la capa de salida combinada con la pérdida 'entropia_cruzada'")
     
     @staticmethod
-    def tanh_derivada(x: np.ndarray) -> np.ndarray:
+    def log_softmax(x: np.ndarray) -> np.ndarray:
 
-        return 1 - x * x
+        desplazado = x - np.max(x, axis=-1, keepdims=True)
+        return desplazado - np.log(np.sum(np.exp(desplazado), axis=-1, keepdims=True))
     
     @staticmethod
-    def lineal(x: np.ndarray) -> np.ndarray:
+    def lineal(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        return x
+        if salida is None:
+            return x
+        
+        np.copyto(salida, x)
+        return salida
     
     @staticmethod
-    def lineal_derivada(x: np.ndarray) -> np.ndarray:
+    def lineal_derivada(x: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
 
-        return np.ones_like(x)
+        if salida is None:
+            return np.ones_like(x)
+        
+        salida.fill(1)
+        return salida
     
     @classmethod
     def obtener_funcion_y_derivada(cls, nombre_funcion: str) -> tuple[Callable, Callable]:
@@ -51,6 +117,7 @@ class FuncionesActivacion:
             'escalon': (cls.escalon, cls.escalon_derivada),
             'sigmoide': (cls.sigmoide, cls.sigmoide_derivada),
             'tanh': (cls.tanh, cls.tanh_derivada),
+            'softmax': (cls.softmax, cls.softmax_derivada),
             'lineal': (cls.lineal, cls.lineal_derivada)
         }
         
@@ -0,0 +1,193 @@
+import numpy as np
+from typing import Dict, Iterable, Iterator, List, Optional
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from comun.constantes.constantes_redes_neuronales import CAPACIDAD_HISTORIAL_DEFECTO
+
+class HistorialEntrenamiento:
+
+    def __init__(self, capacidad: int = CAPACIDAD_HISTORIAL_DEFECTO,
+                 ventana: Optional[int] = None,
+                 factor_diezmado: Optional[int] = None):
+
+        if ventana is None and factor_diezmado is None:
+            factor_diezmado = 1
+        if ventana is not None and ventana < 1:
+            raise ValueError("La ventana debe ser un entero positivo")
+        if factor_diezmado is not None and factor_diezmado < 1:
+            raise ValueError("El factor de diezmado debe ser un entero positivo")
+        
+        self.capacidad = max(int(capacidad), 1)
+        self.ventana = ventana
+        self.factor_diezmado = factor_diezmado
+        
+        self._diezmados = np.empty(self.capacidad if factor_diezmado is not None else 0)
+        self._anillo = np.empty(ventana if ventana is not None else 0)
+        self.limpiar()
+    
+    def limpiar(self) -> None:
+
+        self.num_registros = 0
+        self._num_diezmados = 0
+        self.primero = None
+        self.ultimo = None
+        self.minimo = np.inf
+        self.maximo = -np.inf
+        self.epoca_minimo = None
+        self.media = 0.0
+        self._suma_desvios_cuadrados = 0.0
+    
+    def _asegurar_capacidad_diezmados(self, requerida: int) -> None:
+
+        if requerida > len(self._diezmados):
+            nuevo = np.empty(max(requerida, 2 * len(self._diezmados)))
+            nuevo[:self._num_diezmados] = self._diezmados[:self._num_diezmados]
+            self._diezmados = nuevo
+    
+    def agregar(self, valor: float) -> None:
+
+        valor = float(valor)
+        epoca = self.num_registros
+        
+        if self.factor_diezmado is not None and epoca % self.factor_diezmado == 0:
+            self._asegurar_capacidad_diezmados(self._num_diezmados + 1)
+            self._diezmados[self._num_diezmados] = valor
+            self._num_diezmados += 1
+        
+        if self.ventana is not None:
+            self._anillo[epoca % self.ventana] = valor
+        
+        if epoca == 0:
+            self.primero = valor
+        self.ultimo = valor
+        if valor < self.minimo:
+            self.minimo = valor
+            self.epoca_minimo = epoca
+        self.maximo = max(self.maximo, valor)
+        
+        delta = valor - self.media
+        self.media += delta / (epoca + 1)
+        self._suma_desvios_cuadrados += delta * (valor - self.media)
+        self.num_registros += 1
+    
+    def extender(self, valores: Iterable[float]) -> None:
+
+        if not isinstance(valores, np.ndarray):
+            valores = list(valores)
+        valores = np.asarray(valores, dtype=float).ravel()
+        if len(valores) == 0:
+            return
+        
+        epocas = np.arange(self.num_registros, self.num_registros + len(valores))
+        
+        if self.factor_diezmado is not None:
+            seleccionados = valores[epocas % self.factor_diezmado == 0]
+            self._asegurar_capacidad_diezmados(self._num_diezmados + len(seleccionados))
+            self._diezmados[self._num_diezmados:self._num_diezmados + len(seleccionados)] = seleccionados
+            self._num_diezmados += len(seleccionados)
+        
+        if self.ventana is not None:
+            recientes = slice(-min(len(valores), self.ventana), None)
+            self._anillo[epocas[recientes] % self.ventana] = valores[recientes]
+        
+        if self.num_registros == 0:
+            self.primero = float(valores[0])
+        self.ultimo = float(valores[-1])
+        indice_minimo = int(np.argmin(valores))
+        if valores[indice_minimo] < self.minimo:
+            self.minimo = float(valores[indice_minimo])
+            self.epoca_minimo = int(epocas[indice_minimo])
+        self.maximo = max(self.maximo, float(valores.max()))
+        
+        media_valores = float(np.mean(valores))
+        total = self.num_registros + len(valores)
+        delta = media_valores - self.media
+        self.media += delta * len(valores) / total
+        self._suma_desvios_cuadrados += (float(np.sum(np.square(valores - media_valores)))
+                                         + delta * delta * self.num_registros * len(valores) / total)
+        self.num_registros = total
+    
+    def _obtener_anillo(self) -> np.ndarray:
+
+        num_anillo = min(self.num_registros, self.ventana)
+        inicio = (self.num_registros - num_anillo) % self.ventana
+        return np.roll(self._anillo, -inicio)[:num_anillo]
+    
+    def _contar_previos_anillo(self) -> int:
+
+        if self.factor_diezmado is None:
+            return 0
+        
+        inicio_anillo = self.num_registros - min(self.num_registros, self.ventana)
+        return min(self._num_diezmados, -(-inicio_anillo // self.factor_diezmado))
+    
+    def obtener_epocas(self) -> np.ndarray:
+
+        if self.ventana is None:
+            return np.arange(self._num_diezmados) * self.factor_diezmado
+        
+        num_previos = self._contar_previos_anillo()
+        inicio_anillo = self.num_registros - min(self.num_registros, self.ventana)
+        return np.concatenate([np.arange(num_previos) * (self.factor_diezmado or 1),
+                               np.arange(inicio_anillo, self.num_registros)])
+    
+    def obtener_valores(self) -> np.ndarray:
+
+        diezmados = self._diezmados[:self._num_diezmados]
+        if self.ventana is None:
+            return diezmados
+        
+        return np.concatenate([diezmados[:self._contar_previos_anillo()], self._obtener_anillo()])
+    
+    def obtener_estadisticas(self) -> Dict[str, float]:
+
+        if self.num_registros == 0:
+            return {}
+        
+        return {
+            'inicial': self.primero,
+            'final': self.ultimo,
+            'minimo': self.minimo,
+            'maximo': self.maximo,
+            'media': self.media,
+            'desviacion': float(np.sqrt(self._suma_desvios_cuadrados / self.num_registros)),
+            'epoca_minimo': self.epoca_minimo,
+            'num_registros': self.num_registros
+        }
+    
+    def tolist(self) -> List[float]:
+
+        return self.obtener_valores().tolist()
+    
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+
+        valores = self.obtener_valores()
+        return valores.astype(dtype) if dtype is not None else valores.copy()
+    
+    def __len__(self) -> int:
+
+        if self.ventana is None:
+            return self._num_diezmados
+        
+        return self._contar_previos_anillo() + min(self.num_registros, self.ventana)
+    
+    def __bool__(self) -> bool:
+
+        return self.num_registros > 0
+    
+    def __getitem__(self, indice):
+
+        return self.obtener_valores()[indice]
+    
+    def __iter__(self) -> Iterator[float]:
+
+        return iter(self.obtener_valores().tolist())
+    
+    def __getstate__(self) -> dict:
+
+        estado = self.__dict__.copy()
+        estado['_diezmados'] = self._diezmados[:self._num_diezmados].copy()
+        return estado
@@ -1,5 +1,6 @@
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple, List, Optional
+from .funciones_activacion import FuncionesActivacion
 
 class UtilidadesMatematicas:
 
@@ -11,10 +12,11 @@ class UtilidadesMatematicas:
         return np.random.uniform(rango_min, rango_max, (filas, columnas))
     
     @staticmethod
-    def inicializar_pesos_xavier(filas: int, columnas: int) -> np.ndarray:
+    def inicializar_pesos_xavier(filas: int, columnas: int,
+                                 tipo_datos: np.dtype = np.float64) -> np.ndarray:
 
         limite = np.sqrt(6.0 / (filas + columnas))
-        return np.random.uniform(-limite, limite, (filas, columnas))
+        return np.random.uniform(-limite, limite, (filas, columnas)).astype(tipo_datos, copy=False)
     
     @staticmethod
     def calcular_error_cuadratico_medio(salida_esperada: np.ndarray, 
@@ -22,6 +24,17 @@ class UtilidadesMatematicas:
 
         return np.mean(np.square(salida_esperada - salida_obtenida))
     
+    @staticmethod
+    def calcular_entropia_cruzada(salida_esperada: np.ndarray, salida_neta: np.ndarray,
+                                  funcion_salida: str = 'softmax') -> float:
+
+        if funcion_salida == 'softmax':
+            log_probabilidades = FuncionesActivacion.log_softmax(salida_neta)
+            return -np.sum(salida_esperada * log_probabilidades) / len(salida_neta)
+        
+        perdidas = np.logaddexp(0, salida_neta) - salida_esperada * salida_neta
+        return np.sum(perdidas) / len(salida_neta)
+    
     @staticmethod
     def normalizar_datos(datos: np.ndarray) -> Tuple[np.ndarray, float, float]:
 
@@ -73,19 +86,35 @@ class UtilidadesMatematicas:
         return aciertos / total if total > 0 else 0.0
     
     @staticmethod
-    def generar_ruido_binario(datos: np.ndarray, probabilidad: float = 0.02) -> np.ndarray:
+    def generar_ruido_binario(datos: np.ndarray, probabilidad: float = 0.02,
+                              generador: Optional[np.random.Generator] = None) -> np.ndarray:
 
         datos_con_ruido = datos.copy()
-        mascara_ruido = np.random.random(datos.shape) < probabilidad
+        aleatorio = generador if generador is not None else np.random
+        mascara_ruido = aleatorio.random(datos.shape) < probabilidad
         datos_con_ruido[mascara_ruido] = 1 - datos_con_ruido[mascara_ruido]
         return datos_con_ruido
     
     @staticmethod
-    def convertir_a_one_hot(etiquetas: List[int], num_clases: int) -> np.ndarray:
+    def generar_ruido_binario_multinivel(datos: np.ndarray, probabilidades: List[float],
+                                         num_ensayos: int,
+                                         generador: Optional[np.random.Generator] = None) -> np.ndarray:
+
+        datos = np.asarray(datos)
+        aleatorio = generador if generador is not None else np.random
+        probabilidades = np.asarray(probabilidades, dtype=float).reshape((-1,) + (1,) * (datos.ndim + 1))
+        
+        forma = (probabilidades.shape[0], num_ensayos) + datos.shape
+        mascara_ruido = aleatorio.random(forma) < probabilidades
+        return np.where(mascara_ruido, 1 - datos, datos)
+    
+    @staticmethod
+    def convertir_a_one_hot(etiquetas: List[int], num_clases: int,
+                            tipo_datos: np.dtype = np.float64) -> np.ndarray:
 
-        one_hot = np.zeros((len(etiquetas), num_clases))
-        for i, etiqueta in enumerate(etiquetas):
-            one_hot[i, etiqueta] = 1
+        etiquetas = np.asarray(etiquetas, dtype=np.intp).ravel()
+        one_hot = np.zeros((len(etiquetas), num_clases), dtype=tipo_datos)
+        one_hot[np.arange(len(etiquetas)), etiquetas] = 1
         return one_hot
     
     @staticmethod
@@ -0,0 +1,61 @@
+import os
+
+import numpy as np
+
+from comun.src.cache_datos import CacheDatos
+
+
+class GeneradorContado:
+
+    def __init__(self, arreglo: np.ndarray):
+
+        self.arreglo = arreglo
+        self.llamadas = 0
+    
+    def __call__(self) -> dict:
+
+        self.llamadas += 1
+        return {'datos': self.arreglo}
+
+
+def test_cache_reutiliza_arreglos_mientras_el_origen_no_cambia(tmp_path):
+    ruta_origen = tmp_path / 'datos.txt'
+    ruta_origen.write_text('1 2\n3 4\n')
+    generador = GeneradorContado(np.array([[1.0, 2.0], [3.0, 4.0]]))
+    
+    primera = CacheDatos.cargar_o_generar(str(ruta_origen), generador)
+    segunda = CacheDatos.cargar_o_generar(str(ruta_origen), generador)
+    
+    assert generador.llamadas == 1
+    assert isinstance(segunda['datos'], np.memmap)
+    np.testing.assert_array_equal(segunda['datos'], primera['datos'])
+
+
+def test_cache_se_invalida_al_cambiar_fecha_de_modificacion(tmp_path):
+    ruta_origen = tmp_path / 'datos.txt'
+    ruta_origen.write_text('1 2\n')
+    generador = GeneradorContado(np.array([1.0, 2.0]))
+    
+    CacheDatos.cargar_o_generar(str(ruta_origen), generador)
+    estado = os.stat(ruta_origen)
+    os.utime(ruta_origen, ns=(estado.st_atime_ns, estado.st_mtime_ns + 1_000_000_000))
+    generador.arreglo = np.array([5.0, 6.0])
+    
+    recargados = CacheDatos.cargar_o_generar(str(ruta_origen), generador)
+    
+    assert generador.llamadas == 2
+    np.testing.assert_array_equal(recargados['datos'], [5.0, 6.0])
+    np.testing.assert_array_equal(CacheDatos.cargar_o_generar(str(ruta_origen), generador)['datos'], [5.0, 6.0])
+    assert generador.llamadas == 2
+
+
+def test_invalidar_fuerza_regeneracion(tmp_path):
+    ruta_origen = tmp_path / 'datos.txt'
+    ruta_origen.write_text('1\n')
+    generador = GeneradorContado(np.array([1.0]))
+    
+    CacheDatos.cargar_o_generar(str(ruta_origen), generador)
+    CacheDatos.invalidar(str(ruta_origen))
+    CacheDatos.cargar_o_generar(str(ruta_origen), generador)
+    
+    assert generador.llamadas == 2
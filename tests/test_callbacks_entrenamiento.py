@@ -0,0 +1,51 @@
+import numpy as np
+
+from tp2.src.perceptron_multicapa import PerceptronMulticapa
+from comun.src.callbacks_entrenamiento import DetencionTemprana
+
+
+def crear_problema():
+    generador = np.random.RandomState(3)
+    entradas = generador.rand(30, 4)
+    salidas = generador.rand(30, 1)
+    np.random.seed(3)
+    red = PerceptronMulticapa([4, 6, 1], ['sigmoide', 'sigmoide'])
+    return red, entradas, salidas
+
+
+def test_restaura_pesos_que_obtuvieron_el_mejor_error_de_entrenamiento():
+    red, entradas, salidas = crear_problema()
+    detencion = DetencionTemprana(paciencia=10 ** 6)
+    
+    # Una tasa excesiva hace que el error empeore después de las primeras épocas
+    convergencia, _ = red.entrenar(entradas, salidas, tasa_aprendizaje=60.0, max_epocas=60,
+                                   error_objetivo=0.0, mostrar_progreso=False,
+                                   callbacks=[detencion])
+    
+    assert not convergencia
+    assert not detencion.detenido
+    assert detencion.mejor_epoca < 59
+    assert np.isclose(red.calcular_error_conjunto(entradas, salidas), detencion.mejor_error)
+
+
+def test_restaura_mejores_pesos_de_validacion_al_detenerse():
+    red, entradas, salidas = crear_problema()
+    detencion = DetencionTemprana(entradas[:10], salidas[:10], paciencia=5)
+    
+    red.entrenar(entradas[10:], salidas[10:], tasa_aprendizaje=60.0, max_epocas=200,
+                 error_objetivo=0.0, mostrar_progreso=False, callbacks=[detencion])
+    
+    assert detencion.detenido
+    assert np.isclose(red.calcular_error_conjunto(entradas[:10], salidas[:10]), detencion.mejor_error)
+
+
+def test_no_restaura_si_el_entrenamiento_converge():
+    red, entradas, salidas = crear_problema()
+    detencion = DetencionTemprana(paciencia=10 ** 6)
+    
+    convergencia, _ = red.entrenar(entradas, salidas, tasa_aprendizaje=0.5, max_epocas=500,
+                                   error_objetivo=0.2, mostrar_progreso=False,
+                                   callbacks=[detencion])
+    
+    assert convergencia
+    assert red.calcular_error_conjunto(entradas, salidas) <= 0.2
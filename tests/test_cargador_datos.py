@@ -0,0 +1,78 @@
+import numpy as np
+
+from tp1.src.cargador_datos import CargadorDatos
+from tp1.src.perceptron_simple import PerceptronSimple
+from comun.constantes.constantes_redes_neuronales import LIMITE_VALORES_UNICOS
+
+
+def dividir_en_bloques(entradas: np.ndarray, salidas: np.ndarray, tamaño_bloque: int):
+    for inicio in range(0, len(entradas), tamaño_bloque):
+        yield entradas[inicio:inicio + tamaño_bloque], salidas[inicio:inicio + tamaño_bloque]
+
+
+def test_estadisticas_streaming_coinciden_con_calculo_en_memoria():
+    generador = np.random.default_rng(0)
+    entradas = generador.normal(3.0, 2.0, size=(1037, 4))
+    salidas = generador.integers(0, 5, size=1037).astype(float)
+    
+    completa = CargadorDatos.obtener_informacion_datos(entradas, salidas)
+    streaming = CargadorDatos.obtener_informacion_datos_streaming(dividir_en_bloques(entradas, salidas, 100))
+    
+    assert streaming['num_muestras'] == completa['num_muestras']
+    assert streaming['num_caracteristicas'] == completa['num_caracteristicas']
+    assert streaming['forma_entradas'] == completa['forma_entradas']
+    assert streaming['forma_salidas'] == completa['forma_salidas']
+    np.testing.assert_allclose(streaming['rango_entradas'], completa['rango_entradas'])
+    np.testing.assert_allclose(streaming['rango_salidas'], completa['rango_salidas'])
+    np.testing.assert_allclose(streaming['media_entradas'], completa['media_entradas'])
+    np.testing.assert_allclose(streaming['desviacion_entradas'], completa['desviacion_entradas'])
+    np.testing.assert_array_equal(streaming['valores_unicos_salidas'], completa['valores_unicos_salidas'])
+    assert not streaming['valores_unicos_truncados']
+
+
+def test_valores_unicos_truncados_no_dependen_del_orden_de_los_bloques():
+    salidas = np.arange(2 * LIMITE_VALORES_UNICOS, dtype=float)
+    entradas = salidas.reshape(-1, 1)
+    
+    ascendente = CargadorDatos.obtener_informacion_datos_streaming(dividir_en_bloques(entradas, salidas, 300))
+    descendente = CargadorDatos.obtener_informacion_datos_streaming(
+        dividir_en_bloques(entradas[::-1], salidas[::-1], 300))
+    
+    assert ascendente['valores_unicos_truncados'] and descendente['valores_unicos_truncados']
+    np.testing.assert_array_equal(ascendente['valores_unicos_salidas'], descendente['valores_unicos_salidas'])
+    np.testing.assert_array_equal(ascendente['valores_unicos_salidas'], salidas[:LIMITE_VALORES_UNICOS])
+
+
+def test_bloques_desde_archivo_reproducen_la_carga_completa(tmp_path):
+    generador = np.random.default_rng(3)
+    entradas = generador.normal(size=(23, 3))
+    salidas = generador.normal(size=23)
+    ruta_entradas, ruta_salidas = tmp_path / 'entradas.txt', tmp_path / 'salidas.txt'
+    np.savetxt(ruta_entradas, entradas)
+    np.savetxt(ruta_salidas, salidas)
+    
+    bloques = list(CargadorDatos.generar_bloques_desde_archivo(str(ruta_entradas), str(ruta_salidas), 5))
+    entradas_completas, salidas_completas = CargadorDatos.cargar_datos_desde_archivo(
+        str(ruta_entradas), str(ruta_salidas), usar_cache=False)
+    
+    assert [len(bloque_entradas) for bloque_entradas, _ in bloques] == [5, 5, 5, 5, 3]
+    np.testing.assert_allclose(np.vstack([bloque for bloque, _ in bloques]), entradas_completas)
+    np.testing.assert_allclose(np.concatenate([bloque for _, bloque in bloques]), salidas_completas)
+
+
+def test_entrenamiento_streaming_con_un_bloque_equivale_al_entrenamiento_en_lote():
+    generador = np.random.default_rng(4)
+    entradas = generador.normal(size=(30, 2))
+    salidas = 0.5 * entradas[:, 0] - entradas[:, 1]
+    
+    np.random.seed(0)
+    perceptron_memoria = PerceptronSimple(2, 'lineal')
+    np.random.seed(0)
+    perceptron_streaming = PerceptronSimple(2, 'lineal')
+    
+    perceptron_memoria.entrenar(entradas, salidas, tasa_aprendizaje=0.05, max_epocas=20, error_objetivo=0.0,
+                                mostrar_progreso=False, modo_entrenamiento='lote')
+    perceptron_streaming.entrenar_streaming(lambda: [(entradas, salidas)], tasa_aprendizaje=0.05,
+                                            max_epocas=20, error_objetivo=0.0, mostrar_progreso=False)
+    
+    np.testing.assert_allclose(perceptron_streaming.pesos, perceptron_memoria.pesos)
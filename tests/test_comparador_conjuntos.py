@@ -0,0 +1,107 @@
+import os
+from math import comb
+
+import numpy as np
+import pytest
+
+from tp2.src.comparador_conjuntos_entrenamiento import ComparadorConjuntosEntrenamiento
+
+CONFIGURACIONES_REDUCIDAS = {
+    'reducida': {
+        'descripcion': 'Configuraciones reducidas para pruebas',
+        'conjuntos': [
+            {'nombre': 'balance_2_2', 'entrenamiento': [0, 2, 1, 3], 'prueba': [4, 6, 8, 5, 7, 9]},
+            {'nombre': 'extremos', 'entrenamiento': [0, 1, 8, 9], 'prueba': [2, 3, 4, 5, 6, 7]}
+        ]
+    }
+}
+
+
+def crear_comparador() -> ComparadorConjuntosEntrenamiento:
+    comparador = ComparadorConjuntosEntrenamiento()
+    comparador.configuraciones_experimento = CONFIGURACIONES_REDUCIDAS
+    return comparador
+
+
+def extraer_precisiones(resultados: dict) -> dict:
+    return {(config, arq): (resultado['precision_entrenamiento'], resultado['precision_prueba'],
+                            resultado['epoca_convergencia'])
+            for config, arquitecturas in resultados['reducida'].items()
+            for arq, resultado in arquitecturas.items()}
+
+
+def test_ejecucion_memoizada_coincide_con_la_no_memoizada(tmp_path):
+    parametros = dict(arquitecturas=['MINIMA', 'COMPACTA'], semillas=(0, 1), max_epocas=40,
+                      mostrar_progreso=False)
+    
+    directorio = str(tmp_path / 'cache')
+    paralelo = crear_comparador().ejecutar_comparacion_paralela(
+        directorio_cache=directorio, max_workers=2, **parametros
+    )
+    assert len(os.listdir(directorio)) == 2 * 2 * 2
+    
+    marcas = {archivo: os.path.getmtime(os.path.join(directorio, archivo))
+              for archivo in os.listdir(directorio)}
+    memoizado = crear_comparador().ejecutar_comparacion_paralela(
+        directorio_cache=directorio, max_workers=1, **parametros
+    )
+    assert marcas == {archivo: os.path.getmtime(os.path.join(directorio, archivo))
+                      for archivo in os.listdir(directorio)}
+    
+    sin_cache = crear_comparador().ejecutar_comparacion_paralela(
+        directorio_cache=str(tmp_path / 'vacio'), max_workers=1, **parametros
+    )
+    
+    assert extraer_precisiones(paralelo) == extraer_precisiones(sin_cache)
+    assert extraer_precisiones(memoizado) == extraer_precisiones(sin_cache)
+    assert np.isclose(memoizado['reducida']['extremos']['MINIMA']['desviacion_precision_prueba'],
+                      sin_cache['reducida']['extremos']['MINIMA']['desviacion_precision_prueba'])
+
+
+def contar_divisiones_esperadas(tamaño_entrenamiento: int, min_pares: int, min_impares: int) -> int:
+    return sum(comb(5, pares) * comb(5, tamaño_entrenamiento - pares)
+               for pares in range(min_pares, tamaño_entrenamiento - min_impares + 1))
+
+
+@pytest.mark.parametrize('tamaño_entrenamiento, min_pares, min_impares',
+                         [(4, 1, 1), (5, 2, 2), (3, 0, 0), (6, 4, 1)])
+def test_enumeracion_coincide_con_conteo_combinatorio(tamaño_entrenamiento, min_pares, min_impares):
+    divisiones = list(ComparadorConjuntosEntrenamiento.enumerar_divisiones(tamaño_entrenamiento,
+                                                                           min_pares, min_impares))
+    
+    assert len(divisiones) == contar_divisiones_esperadas(tamaño_entrenamiento, min_pares, min_impares)
+    assert len({tuple(entrenamiento) for entrenamiento, _ in divisiones}) == len(divisiones)
+    for entrenamiento, prueba in divisiones:
+        assert sorted(entrenamiento + prueba) == list(range(10))
+
+
+def test_enumeracion_reanudada_omite_filas_escritas(tmp_path):
+    archivo = str(tmp_path / 'enumeracion.csv')
+    parametros = dict(tamaño_entrenamiento=9, arquitecturas=['MINIMA'], max_epocas=20, tamaño_grupo=4,
+                      archivo_salida=archivo, mostrar_progreso=False)
+    
+    completo = crear_comparador().ejecutar_enumeracion_exhaustiva(**parametros)
+    assert completo['divisiones_evaluadas'] == completo['num_divisiones'] == 10
+    esperados = ComparadorConjuntosEntrenamiento.cargar_resultados_enumeracion(archivo)
+    
+    with open(archivo, 'r', encoding='utf-8') as f:
+        lineas = f.readlines()
+    with open(archivo, 'w', encoding='utf-8') as f:
+        f.writelines(lineas[:4])
+    
+    reanudado = crear_comparador().ejecutar_enumeracion_exhaustiva(**parametros)
+    assert reanudado['divisiones_evaluadas'] == 7
+    assert reanudado['divisiones_omitidas'] == 3
+    
+    obtenidos = ComparadorConjuntosEntrenamiento.cargar_resultados_enumeracion(archivo)
+    orden = np.argsort(obtenidos['mascara_division'])
+    orden_esperado = np.argsort(esperados['mascara_division'])
+    for columna in ('entrenamiento', 'convergencia', 'precision_entrenamiento', 'precision_prueba'):
+        np.testing.assert_array_equal(obtenidos[columna][orden], esperados[columna][orden_esperado])
+    
+    sin_cambios = crear_comparador().ejecutar_enumeracion_exhaustiva(**parametros)
+    assert sin_cambios['divisiones_evaluadas'] == 0
+    assert len(ComparadorConjuntosEntrenamiento.cargar_resultados_enumeracion(archivo)['entrenamiento']) == 10
+    
+    with pytest.raises(ValueError):
+        crear_comparador().ejecutar_enumeracion_exhaustiva(**dict(parametros, min_pares=2))
@@ -0,0 +1,49 @@
+import numpy as np
+
+from tp2.src.ensemble_multicapa import EnsembleMulticapa
+from tp2.src.perceptron_multicapa import PerceptronMulticapa
+
+ARQUITECTURA = [2, 3, 1]
+ENTRADAS = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=float)
+SALIDAS = np.array([0, 1, 1, 0], dtype=float)
+
+
+def crear_red_independiente(semilla: int) -> PerceptronMulticapa:
+    estado_original = np.random.get_state()
+    np.random.seed(semilla)
+    red = PerceptronMulticapa(ARQUITECTURA, tipo_datos='float64')
+    np.random.set_state(estado_original)
+    return red
+
+
+def test_miembro_coincide_con_red_independiente_de_igual_semilla():
+    semillas = [5, 6, 7]
+    ensemble = EnsembleMulticapa(ARQUITECTURA, len(semillas), semillas=semillas, tipo_datos='float64')
+    
+    ensemble.entrenar(ENTRADAS, SALIDAS, tasa_aprendizaje=0.5, max_epocas=20, error_objetivo=0.0,
+                      mostrar_progreso=False)
+    
+    for indice, semilla in enumerate(semillas):
+        red = crear_red_independiente(semilla)
+        red.entrenar(ENTRADAS, SALIDAS, tasa_aprendizaje=0.5, max_epocas=20, error_objetivo=0.0,
+                     mostrar_progreso=False, mezclar=False)
+        
+        np.testing.assert_allclose(ensemble.obtener_miembro(indice).parametros, red.parametros)
+
+
+def test_mascara_de_muestras_equivale_a_entrenar_con_el_subconjunto():
+    entradas_por_miembro = [ENTRADAS, ENTRADAS[:3]]
+    salidas_por_miembro = [SALIDAS, SALIDAS[:3]]
+    entradas, salidas, mascara = EnsembleMulticapa.apilar_conjuntos(
+        entradas_por_miembro, salidas_por_miembro, tipo_datos='float64'
+    )
+    ensemble = EnsembleMulticapa(ARQUITECTURA, 2, semillas=[1, 2], tipo_datos='float64')
+    
+    ensemble.entrenar(entradas, salidas, tasa_aprendizaje=0.5, max_epocas=10, error_objetivo=0.0,
+                      mostrar_progreso=False, mascara_muestras=mascara)
+    
+    red = crear_red_independiente(2)
+    red.entrenar(ENTRADAS[:3], SALIDAS[:3], tasa_aprendizaje=0.5, max_epocas=10, error_objetivo=0.0,
+                 mostrar_progreso=False, mezclar=False)
+    
+    np.testing.assert_allclose(ensemble.obtener_miembro(1).parametros, red.parametros)
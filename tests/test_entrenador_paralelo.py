@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from tp2.src.perceptron_multicapa import PerceptronMulticapa
+from tp2.src.entrenador_paralelo import EntrenadorParalelo
+
+
+def crear_red() -> PerceptronMulticapa:
+    np.random.seed(0)
+    return PerceptronMulticapa([3, 5, 2], ['tanh', 'sigmoide'], tipo_datos='float64')
+
+
+@pytest.mark.parametrize('configuracion_lotes', [{}, {'tamaño_lote': 8, 'semilla': 3}])
+def test_entrenamiento_paralelo_coincide_con_entrenamiento_serial(configuracion_lotes):
+    generador = np.random.default_rng(0)
+    entradas = generador.normal(size=(37, 3))
+    salidas = generador.uniform(size=(37, 2))
+    red_serial = crear_red()
+    red_paralela = crear_red()
+    
+    resultado_serial = red_serial.entrenar(entradas, salidas, tasa_aprendizaje=0.1, max_epocas=15,
+                                           error_objetivo=0.0, mostrar_progreso=False,
+                                           **configuracion_lotes)
+    resultado_paralelo = EntrenadorParalelo(red_paralela, num_procesos=2).entrenar(
+        entradas, salidas, tasa_aprendizaje=0.1, max_epocas=15, error_objetivo=0.0,
+        mostrar_progreso=False, **configuracion_lotes
+    )
+    
+    assert resultado_paralelo == resultado_serial
+    np.testing.assert_allclose(red_paralela.parametros, red_serial.parametros, atol=1e-12)
+    np.testing.assert_allclose(red_paralela.evaluador.historial_errores.obtener_valores(),
+                               red_serial.evaluador.historial_errores.obtener_valores())
+
+
+def test_red_queda_desvinculada_de_la_memoria_compartida():
+    red = crear_red()
+    
+    EntrenadorParalelo(red, num_procesos=2).entrenar(np.ones((4, 3)), np.zeros((4, 2)), max_epocas=2,
+                                                    mostrar_progreso=False)
+    
+    for capa in red.capas:
+        assert np.shares_memory(capa.pesos, red.parametros)
+    red.parametros += 1.0
+    assert np.all(np.isfinite(red.predecir(np.ones((1, 3)))))
@@ -0,0 +1,24 @@
+import numpy as np
+
+from tp2.src.entrenador_tp2 import EntrenadorTP2
+
+
+def test_semilla_no_altera_el_generador_global():
+    entrenador = EntrenadorTP2()
+    
+    np.random.seed(123)
+    esperado = np.random.rand(3)
+    
+    np.random.seed(123)
+    entrenador.entrenar_discriminacion_numeros_pares(max_epocas=5, mostrar_progreso=False, semilla=7)
+    np.testing.assert_array_equal(np.random.rand(3), esperado)
+
+
+def test_misma_semilla_reproduce_el_resultado():
+    entrenador = EntrenadorTP2()
+    
+    resultados = [entrenador.entrenar_discriminacion_numeros_pares(max_epocas=30, mostrar_progreso=False,
+                                                                  semilla=7)
+                  for _ in range(2)]
+    
+    np.testing.assert_array_equal(resultados[0]['red'].parametros, resultados[1]['red'].parametros)
@@ -0,0 +1,122 @@
+import numpy as np
+
+from comun.src.evaluador_rendimiento import EvaluadorRendimiento, AcumuladorMetricas
+
+
+class RedIdentidad:
+
+    def predecir(self, entradas: np.ndarray) -> np.ndarray:
+
+        return np.asarray(entradas)
+
+
+class RedPrimerBit:
+
+    def predecir(self, entradas: np.ndarray) -> np.ndarray:
+
+        return np.asarray(entradas, dtype=float)[:, :1] - 0.5
+
+
+def dividir_en_bloques(predicciones: np.ndarray, reales: np.ndarray, tamaño_bloque: int):
+    for inicio in range(0, len(predicciones), tamaño_bloque):
+        yield predicciones[inicio:inicio + tamaño_bloque], reales[inicio:inicio + tamaño_bloque]
+
+
+def test_matriz_confusion_coincide_con_conteo_por_bucle():
+    generador = np.random.default_rng(0)
+    clases_reales = generador.integers(0, 4, size=200)
+    clases_predichas = generador.integers(0, 4, size=200)
+    
+    esperada = np.zeros((4, 4), dtype=int)
+    for real, predicha in zip(clases_reales, clases_predichas):
+        esperada[real, predicha] += 1
+    
+    matriz = EvaluadorRendimiento.generar_matriz_confusion(clases_predichas, clases_reales, 4)
+    
+    np.testing.assert_array_equal(matriz, esperada)
+
+
+def test_evaluacion_binaria_por_lotes_coincide_con_evaluacion_completa():
+    generador = np.random.default_rng(1)
+    predicciones = generador.normal(size=(97, 1))
+    reales = np.sign(generador.normal(size=(97, 1)))
+    evaluador = EvaluadorRendimiento()
+    
+    completa = evaluador.evaluar_clasificacion_binaria(predicciones, reales)
+    por_lotes = evaluador.evaluar_por_lotes(RedIdentidad(), dividir_en_bloques(predicciones, reales, 10))
+    
+    assert por_lotes['num_muestras'] == 97
+    for clave in ('precision', 'error_cuadratico_medio', 'sensibilidad', 'especificidad',
+                  'verdaderos_positivos', 'verdaderos_negativos', 'falsos_positivos', 'falsos_negativos'):
+        np.testing.assert_allclose(por_lotes[clave], completa[clave])
+
+
+def test_acumulador_multiclase_coincide_con_evaluacion_completa():
+    generador = np.random.default_rng(2)
+    predicciones = generador.uniform(size=(50, 3))
+    reales = np.eye(3)[generador.integers(0, 3, size=50)]
+    evaluador = EvaluadorRendimiento()
+    acumulador = AcumuladorMetricas('multiclase')
+    
+    for predicciones_lote, reales_lote in dividir_en_bloques(predicciones, reales, 7):
+        acumulador.actualizar(predicciones_lote, reales_lote)
+    resultado = acumulador.resultado()
+    completa = evaluador.evaluar_clasificacion_multiclase(predicciones, reales)
+    
+    np.testing.assert_allclose(resultado['precision'], completa['precision'])
+    np.testing.assert_allclose(resultado['error_cuadratico_medio'], completa['error_cuadratico_medio'])
+    np.testing.assert_array_equal(
+        resultado['matriz_confusion'],
+        EvaluadorRendimiento.generar_matriz_confusion(completa['clases_predichas'],
+                                                      completa['clases_reales'], 3)
+    )
+
+
+def crear_datos_binarios(num_muestras: int = 30, num_bits: int = 6):
+    datos = np.random.default_rng(3).integers(0, 2, size=(num_muestras, num_bits)).astype(float)
+    return datos, datos[:, 0] - 0.5
+
+
+def test_curva_robustez_devuelve_bandas_y_percentiles_por_probabilidad():
+    datos, etiquetas = crear_datos_binarios()
+    probabilidades = [0.0, 0.1, 0.3, 0.5]
+    
+    curva = EvaluadorRendimiento().calcular_curva_robustez(RedPrimerBit(), datos, etiquetas, probabilidades,
+                                                           num_ensayos=25, semilla=0)
+    
+    assert curva['precisiones'].shape == (4, 25)
+    for clave in ('precision_media', 'precision_desviacion', 'banda_inferior', 'banda_superior',
+                  'percentil_inferior', 'percentil_superior', 'degradacion_media'):
+        assert curva[clave].shape == (4,)
+    assert np.all(curva['banda_inferior'] <= curva['precision_media'])
+    assert np.all(curva['precision_media'] <= curva['banda_superior'])
+    assert np.all(curva['percentil_inferior'] <= curva['percentil_superior'])
+    assert curva['precision_sin_ruido'] == 1.0
+    np.testing.assert_array_equal(curva['precisiones'][0], 1.0)
+    assert curva['banda_inferior'][0] == curva['banda_superior'][0] == 1.0
+    assert curva['precision_media'][-1] < curva['precision_media'][1]
+
+
+def test_curva_robustez_es_reproducible_con_semilla():
+    datos, etiquetas = crear_datos_binarios()
+    evaluador = EvaluadorRendimiento()
+    
+    primera = evaluador.calcular_curva_robustez(RedPrimerBit(), datos, etiquetas, [0.2], num_ensayos=5,
+                                                semilla=7)
+    segunda = evaluador.calcular_curva_robustez(RedPrimerBit(), datos, etiquetas, [0.2], num_ensayos=5,
+                                                semilla=7)
+    
+    np.testing.assert_array_equal(primera['precisiones'], segunda['precisiones'])
+
+
+def test_curva_robustez_multiclase_con_un_solo_ensayo():
+    etiquetas = np.random.default_rng(4).integers(0, 3, size=12)
+    datos = np.eye(3)[etiquetas]
+    
+    curva = EvaluadorRendimiento().calcular_curva_robustez(RedIdentidad(), datos, etiquetas, [0.0, 0.2],
+                                                           num_ensayos=1, tipo='multiclase', semilla=0)
+    
+    assert curva['precisiones'].shape == (2, 1)
+    np.testing.assert_array_equal(curva['precision_desviacion'], 0.0)
+    np.testing.assert_array_equal(curva['banda_inferior'], curva['precision_media'])
+    assert curva['precision_media'][0] == 1.0
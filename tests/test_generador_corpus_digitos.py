@@ -0,0 +1,65 @@
+import json
+import os
+
+import numpy as np
+
+from tp2.src.generador_corpus_digitos import GeneradorCorpusDigitos
+
+
+def crear_generador() -> GeneradorCorpusDigitos:
+    return GeneradorCorpusDigitos(probabilidad_ruido=0.05, probabilidad_desplazamiento=0.3,
+                                  probabilidad_engrosamiento=0.2, tamaño_bloque=16, semilla=4)
+
+
+def test_reanudar_corpus_completo_no_reescribe_archivos(tmp_path):
+    ruta = str(tmp_path / 'corpus')
+    entradas, etiquetas = crear_generador().generar(ruta, 50, mostrar_progreso=False)
+    entradas, etiquetas = np.array(entradas), np.array(etiquetas)
+    rutas = GeneradorCorpusDigitos.obtener_rutas(ruta)
+    fechas = {nombre: os.stat(ruta_archivo).st_mtime_ns for nombre, ruta_archivo in rutas.items()}
+    
+    reanudadas, etiquetas_reanudadas = crear_generador().generar(ruta, 50, mostrar_progreso=False)
+    
+    assert {nombre: os.stat(ruta_archivo).st_mtime_ns for nombre, ruta_archivo in rutas.items()} == fechas
+    np.testing.assert_array_equal(reanudadas, entradas)
+    np.testing.assert_array_equal(etiquetas_reanudadas, etiquetas)
+
+
+def test_reanudar_tras_interrupcion_completa_solo_bloques_pendientes(tmp_path):
+    ruta_completa = str(tmp_path / 'completo')
+    ruta_interrumpida = str(tmp_path / 'interrumpido')
+    entradas_esperadas, etiquetas_esperadas = crear_generador().generar(ruta_completa, 50,
+                                                                        mostrar_progreso=False)
+    
+    crear_generador().generar(ruta_interrumpida, 50, mostrar_progreso=False)
+    rutas = GeneradorCorpusDigitos.obtener_rutas(ruta_interrumpida)
+    with open(rutas['metadatos'], 'r', encoding='utf-8') as archivo:
+        metadatos = json.load(archivo)
+    metadatos['bloques_completados'] = [0, 2]
+    with open(rutas['metadatos'], 'w', encoding='utf-8') as archivo:
+        json.dump(metadatos, archivo)
+    entradas = np.load(rutas['entradas'], mmap_mode='r+')
+    entradas[16:32] = 0
+    entradas[48:] = 0
+    entradas.flush()
+    del entradas
+    
+    reanudadas, etiquetas_reanudadas = crear_generador().generar(ruta_interrumpida, 50,
+                                                                 mostrar_progreso=False)
+    
+    np.testing.assert_array_equal(reanudadas, entradas_esperadas)
+    np.testing.assert_array_equal(etiquetas_reanudadas, etiquetas_esperadas)
+    with open(rutas['metadatos'], 'r', encoding='utf-8') as archivo:
+        assert sorted(json.load(archivo)['bloques_completados']) == [0, 1, 2, 3]
+
+
+def test_configuracion_distinta_regenera_el_corpus(tmp_path):
+    ruta = str(tmp_path / 'corpus')
+    crear_generador().generar(ruta, 20, mostrar_progreso=False)
+    
+    otro_generador = GeneradorCorpusDigitos(probabilidad_ruido=0.05, tamaño_bloque=16, semilla=5)
+    entradas, _ = otro_generador.generar(ruta, 20, mostrar_progreso=False)
+    
+    esperadas = np.concatenate([GeneradorCorpusDigitos.generar_bloque(
+        otro_generador.obtener_configuracion(20), indice)[0] for indice in range(2)])
+    np.testing.assert_array_equal(entradas, esperadas)
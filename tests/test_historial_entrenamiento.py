@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from comun.src.historial_entrenamiento import HistorialEntrenamiento
+
+VALORES = np.random.default_rng(0).uniform(0.1, 2.0, size=103)
+
+
+@pytest.mark.parametrize('ventana, factor_diezmado', [(None, 1), (None, 7), (10, None), (10, 4)])
+def test_estadisticas_coinciden_con_numpy_tras_diezmado(ventana, factor_diezmado):
+    historial = HistorialEntrenamiento(capacidad=4, ventana=ventana, factor_diezmado=factor_diezmado)
+    for valor in VALORES:
+        historial.agregar(valor)
+    
+    estadisticas = historial.obtener_estadisticas()
+    
+    assert estadisticas['num_registros'] == len(VALORES)
+    assert estadisticas['inicial'] == VALORES[0]
+    assert estadisticas['final'] == VALORES[-1]
+    assert estadisticas['minimo'] == VALORES.min()
+    assert estadisticas['maximo'] == VALORES.max()
+    assert estadisticas['epoca_minimo'] == int(np.argmin(VALORES))
+    np.testing.assert_allclose(estadisticas['media'], np.mean(VALORES))
+    np.testing.assert_allclose(estadisticas['desviacion'], np.std(VALORES))
+
+
+@pytest.mark.parametrize('ventana, factor_diezmado', [(None, 7), (10, 4)])
+def test_valores_retenidos_corresponden_a_sus_epocas(ventana, factor_diezmado):
+    historial = HistorialEntrenamiento(capacidad=4, ventana=ventana, factor_diezmado=factor_diezmado)
+    for valor in VALORES:
+        historial.agregar(valor)
+    
+    epocas = historial.obtener_epocas()
+    
+    assert len(historial) == len(epocas)
+    assert np.all(np.diff(epocas) > 0)
+    np.testing.assert_array_equal(historial.obtener_valores(), VALORES[epocas])
+
+
+def test_extender_equivale_a_agregar_uno_a_uno():
+    individual = HistorialEntrenamiento(ventana=10, factor_diezmado=4)
+    por_bloques = HistorialEntrenamiento(ventana=10, factor_diezmado=4)
+    
+    for valor in VALORES:
+        individual.agregar(valor)
+    for inicio in range(0, len(VALORES), 13):
+        por_bloques.extender(VALORES[inicio:inicio + 13])
+    
+    np.testing.assert_array_equal(por_bloques.obtener_valores(), individual.obtener_valores())
+    np.testing.assert_array_equal(por_bloques.obtener_epocas(), individual.obtener_epocas())
+    for clave, valor in individual.obtener_estadisticas().items():
+        np.testing.assert_allclose(por_bloques.obtener_estadisticas()[clave], valor)
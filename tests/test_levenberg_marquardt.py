@@ -0,0 +1,54 @@
+import numpy as np
+
+from tp2.src.perceptron_multicapa import PerceptronMulticapa
+from tp2.src.entrenador_levenberg_marquardt import EntrenadorLevenbergMarquardt
+
+ENTRADAS_XOR = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=float)
+SALIDAS_XOR = np.array([[0], [1], [1], [0]], dtype=float)
+
+
+def crear_red(semilla: int = 0) -> PerceptronMulticapa:
+    np.random.seed(semilla)
+    return PerceptronMulticapa([2, 3, 2], ['tanh', 'sigmoide'], tipo_datos='float64')
+
+
+def test_jacobiano_coincide_con_diferencias_finitas():
+    red = crear_red()
+    entradas = np.random.RandomState(1).rand(5, 2)
+    entrenador = EntrenadorLevenbergMarquardt(red)
+    
+    red._propagacion_adelante(entradas)
+    jacobiano = entrenador.calcular_jacobiano()
+    
+    parametros = red.obtener_parametros()
+    epsilon = 1e-6
+    numerico = np.empty_like(jacobiano)
+    for j in range(parametros.size):
+        desplazados = parametros.copy()
+        desplazados[j] += epsilon
+        red.establecer_parametros(desplazados)
+        salida_mas = red._propagacion_adelante(entradas).ravel().copy()
+        desplazados[j] -= 2 * epsilon
+        red.establecer_parametros(desplazados)
+        salida_menos = red._propagacion_adelante(entradas).ravel()
+        numerico[:, j] = (salida_mas - salida_menos) / (2 * epsilon)
+    
+    np.testing.assert_allclose(jacobiano, numerico, rtol=1e-6, atol=1e-8)
+
+
+def test_convergencia_en_la_ultima_iteracion_se_reporta():
+    red = crear_red()
+    salidas = np.hstack([SALIDAS_XOR, 1 - SALIDAS_XOR])
+    convergencia, iteraciones = EntrenadorLevenbergMarquardt(red).entrenar(
+        ENTRADAS_XOR, salidas, max_iteraciones=500, error_objetivo=1e-3, mostrar_progreso=False
+    )
+    assert convergencia and iteraciones > 1
+    
+    red = crear_red()
+    convergencia, iteraciones_limitadas = EntrenadorLevenbergMarquardt(red).entrenar(
+        ENTRADAS_XOR, salidas, max_iteraciones=iteraciones, error_objetivo=1e-3, mostrar_progreso=False
+    )
+    
+    assert convergencia
+    assert iteraciones_limitadas == iteraciones == red.epoca_convergencia
+    assert red.evaluador.historial_errores.num_registros == iteraciones + 1
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from tp2.src.optimizadores import crear_optimizador
+
+PARAMETRO_INICIAL = np.array([0.5, -1.0, 2.0])
+GRADIENTES = [np.array([0.2, -0.4, 1.0]), np.array([-0.1, 0.3, 0.5])]
+TASA = 0.1
+
+
+def aplicar_pasos(nombre: str, **configuracion) -> np.ndarray:
+    optimizador = crear_optimizador(nombre, **configuracion)
+    parametro = PARAMETRO_INICIAL.copy()
+    for gradiente in GRADIENTES:
+        optimizador.actualizar([parametro], [gradiente], TASA)
+    return parametro
+
+
+def test_sgd_aplica_el_gradiente_escalado():
+    esperado = PARAMETRO_INICIAL + TASA * (GRADIENTES[0] + GRADIENTES[1])
+    
+    np.testing.assert_allclose(aplicar_pasos('sgd'), esperado)
+
+
+def test_momentum_acumula_velocidad():
+    velocidad = TASA * GRADIENTES[0]
+    esperado = PARAMETRO_INICIAL + velocidad
+    velocidad = 0.9 * velocidad + TASA * GRADIENTES[1]
+    esperado = esperado + velocidad
+    
+    np.testing.assert_allclose(aplicar_pasos('momentum', momento=0.9), esperado)
+
+
+def test_nesterov_anticipa_la_velocidad():
+    esperado = PARAMETRO_INICIAL.copy()
+    velocidad = np.zeros_like(esperado)
+    for gradiente in GRADIENTES:
+        velocidad = 0.9 * velocidad + TASA * gradiente
+        esperado = esperado + 0.9 * velocidad + TASA * gradiente
+    
+    np.testing.assert_allclose(aplicar_pasos('nesterov', momento=0.9), esperado)
+
+
+def test_rmsprop_normaliza_por_promedio_cuadratico():
+    esperado = PARAMETRO_INICIAL.copy()
+    promedio = np.zeros_like(esperado)
+    for gradiente in GRADIENTES:
+        promedio = 0.9 * promedio + 0.1 * gradiente ** 2
+        esperado = esperado + TASA * gradiente / (np.sqrt(promedio) + 1e-8)
+    
+    np.testing.assert_allclose(aplicar_pasos('rmsprop', decaimiento=0.9, epsilon=1e-8), esperado)
+
+
+def test_adam_aplica_correccion_de_sesgo():
+    beta1, beta2, epsilon = 0.9, 0.999, 1e-8
+    esperado = PARAMETRO_INICIAL.copy()
+    primer_momento = np.zeros_like(esperado)
+    segundo_momento = np.zeros_like(esperado)
+    for paso, gradiente in enumerate(GRADIENTES, start=1):
+        primer_momento = beta1 * primer_momento + (1 - beta1) * gradiente
+        segundo_momento = beta2 * segundo_momento + (1 - beta2) * gradiente ** 2
+        primer_corregido = primer_momento / (1 - beta1 ** paso)
+        segundo_corregido = segundo_momento / (1 - beta2 ** paso)
+        esperado = esperado + TASA * primer_corregido / (np.sqrt(segundo_corregido) + epsilon)
+    
+    resultado = aplicar_pasos('adam', beta1=beta1, beta2=beta2, epsilon=epsilon)
+    
+    np.testing.assert_allclose(resultado, esperado, rtol=1e-6)
+
+
+def test_rprop_adapta_el_paso_segun_el_signo():
+    resultado = aplicar_pasos('rprop', paso_inicial=0.1, paso_minimo=1e-6, paso_maximo=50.0,
+                              factor_aumento=1.2, factor_disminucion=0.5)
+    
+    primer_paso = PARAMETRO_INICIAL + 0.1 * np.sign(GRADIENTES[0])
+    esperado = primer_paso + np.array([0.0, 0.0, 0.12])
+    
+    np.testing.assert_allclose(resultado, esperado)
+
+
+def test_optimizador_desconocido_lanza_error():
+    with pytest.raises(ValueError, match="Optimizador 'inexistente' no disponible"):
+        crear_optimizador('inexistente')
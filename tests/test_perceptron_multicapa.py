@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from tp2.src.perceptron_multicapa import PerceptronMulticapa
+from comun.src.funciones_activacion import FuncionesActivacion
+
+
+def crear_red(semilla: int = 0, **configuracion) -> PerceptronMulticapa:
+    np.random.seed(semilla)
+    return PerceptronMulticapa([3, 4, 2], ['tanh', 'sigmoide'], **configuracion)
+
+
+def test_parametros_de_capas_son_vistas_del_buffer_contiguo():
+    red = crear_red()
+    
+    assert red.parametros.flags['C_CONTIGUOUS']
+    assert red.parametros.size == sum(capa.pesos.size + capa.sesgos.size for capa in red.capas)
+    for capa in red.capas:
+        for arreglo in (capa.pesos, capa.sesgos):
+            assert np.shares_memory(arreglo, red.parametros)
+        for arreglo in (capa.gradientes_pesos, capa.gradientes_sesgos):
+            assert np.shares_memory(arreglo, red.gradientes)
+    
+    concatenados = np.concatenate([np.concatenate([pesos.ravel(), sesgos.ravel()])
+                                   for pesos, sesgos in red.obtener_pesos_por_capa()])
+    np.testing.assert_array_equal(concatenados, red.parametros)
+
+
+def test_escrituras_en_el_buffer_se_reflejan_en_las_capas():
+    red = crear_red()
+    nuevos_parametros = np.arange(red.parametros.size, dtype=red.tipo_datos)
+    
+    red.establecer_parametros(nuevos_parametros)
+    
+    primera_capa = red.capas[0]
+    np.testing.assert_array_equal(primera_capa.pesos.ravel(), nuevos_parametros[:primera_capa.pesos.size])
+    assert red.capas[1].sesgos[0, -1] == nuevos_parametros[-1]
+    
+    red.capas[1].pesos[0, 0] = -7.0
+    assert red.parametros[primera_capa.num_parametros] == -7.0
+
+
+def test_paso_de_entrenamiento_actualiza_las_capas_a_traves_del_buffer():
+    red = crear_red()
+    entradas = np.random.default_rng(0).normal(size=(8, 3))
+    salidas = np.random.default_rng(1).uniform(size=(8, 2))
+    pesos_previos = [pesos for pesos, _ in red.obtener_pesos_por_capa()]
+    
+    red.entrenar(entradas, salidas, tasa_aprendizaje=0.5, max_epocas=1, error_objetivo=0.0,
+                 mostrar_progreso=False)
+    
+    for capa, pesos in zip(red.capas, pesos_previos):
+        assert np.shares_memory(capa.pesos, red.parametros)
+        assert not np.allclose(capa.pesos, pesos)
+
+
+@pytest.mark.parametrize('funcion_salida', ['softmax', 'sigmoide'])
+def test_gradiente_entropia_cruzada_coincide_con_diferencias_finitas(funcion_salida):
+    np.random.seed(0)
+    red = PerceptronMulticapa([3, 4, 3], ['tanh', funcion_salida], tipo_datos='float64',
+                              funcion_perdida='entropia_cruzada')
+    generador = np.random.default_rng(1)
+    entradas = generador.normal(size=(6, 3))
+    salidas = np.eye(3)[generador.integers(0, 3, size=6)]
+    
+    def calcular_perdida(parametros: np.ndarray) -> float:
+        red.establecer_parametros(parametros)
+        return red._calcular_error(salidas, red._propagacion_adelante(entradas))
+    
+    parametros = red.obtener_parametros()
+    red._retropropagacion(salidas, red._propagacion_adelante(entradas).copy())
+    gradiente = red.gradientes.copy()
+    
+    epsilon = 1e-6
+    numerico = np.empty_like(parametros)
+    for j in range(parametros.size):
+        desplazados = parametros.copy()
+        desplazados[j] += epsilon
+        perdida_mas = calcular_perdida(desplazados)
+        desplazados[j] -= 2 * epsilon
+        numerico[j] = (perdida_mas - calcular_perdida(desplazados)) / (2 * epsilon)
+    
+    np.testing.assert_allclose(gradiente, -len(entradas) * numerico, rtol=1e-5, atol=1e-8)
+
+
+def test_softmax_solo_se_admite_en_salida_con_entropia_cruzada():
+    with pytest.raises(ValueError):
+        PerceptronMulticapa([3, 4, 3], ['tanh', 'softmax'])
+    with pytest.raises(ValueError):
+        PerceptronMulticapa([3, 4, 3], ['softmax', 'sigmoide'], funcion_perdida='entropia_cruzada')
+    with pytest.raises(ValueError):
+        FuncionesActivacion.softmax_derivada(np.zeros((2, 3)))
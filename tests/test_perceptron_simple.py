@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+
+from tp1.src.perceptron_simple import PerceptronSimple
+from comun.constantes.constantes_redes_neuronales import (
+    PATRONES_XOR_ENTRADA, PATRONES_XOR_SALIDA, PATRONES_AND_ENTRADA, PATRONES_AND_SALIDA
+)
+
+ENTRADAS_XOR = np.array(PATRONES_XOR_ENTRADA, dtype=float)
+SALIDAS_XOR = np.array(PATRONES_XOR_SALIDA, dtype=float)
+ENTRADAS_AND = np.array(PATRONES_AND_ENTRADA, dtype=float)
+SALIDAS_AND = np.array(PATRONES_AND_SALIDA, dtype=float)
+
+
+def crear_perceptron(funcion_activacion: str = 'escalon', semilla: int = 0) -> PerceptronSimple:
+    np.random.seed(semilla)
+    return PerceptronSimple(2, funcion_activacion)
+
+
+def test_detecta_ciclo_de_pesos_en_problema_no_separable():
+    perceptron = crear_perceptron()
+    
+    convergencia, epoca = perceptron.entrenar(ENTRADAS_XOR, SALIDAS_XOR, max_epocas=1000,
+                                              mostrar_progreso=False, detectar_ciclos=True)
+    
+    assert not convergencia
+    assert perceptron.ciclo_detectado
+    assert perceptron.longitud_ciclo > 0
+    assert epoca < 1000
+
+
+def test_deteccion_de_ciclos_no_afecta_problema_separable():
+    perceptron = crear_perceptron()
+    
+    convergencia, _ = perceptron.entrenar(ENTRADAS_AND, SALIDAS_AND, max_epocas=1000,
+                                          mostrar_progreso=False, detectar_ciclos=True)
+    
+    assert convergencia
+    assert not perceptron.ciclo_detectado
+
+
+def test_huella_distingue_la_tasa_de_aprendizaje():
+    perceptron = crear_perceptron()
+    huellas = {}
+    
+    assert perceptron._registrar_huella_pesos(huellas, 0, 16, 0.1) == 0
+    assert perceptron._registrar_huella_pesos(huellas, 1, 16, 0.05) == 0
+    assert perceptron._registrar_huella_pesos(huellas, 2, 16, 0.05) == 1
+
+
+@pytest.mark.parametrize('funcion_activacion', ['escalon', 'sigmoide', 'tanh', 'lineal'])
+def test_prediccion_vectorizada_coincide_con_prediccion_por_muestra(funcion_activacion):
+    perceptron = crear_perceptron(funcion_activacion)
+    entradas = np.random.default_rng(1).normal(size=(50, 2))
+    
+    predicciones_lote = perceptron.predecir(entradas)
+    predicciones_individuales = np.array([perceptron.predecir(entrada) for entrada in entradas])
+    
+    np.testing.assert_allclose(predicciones_lote, predicciones_individuales)
+
+
+def test_epoca_en_lote_promedia_las_actualizaciones_por_muestra():
+    perceptron = crear_perceptron('lineal')
+    pesos_iniciales = perceptron.pesos.copy()
+    tasa_aprendizaje = 0.1
+    
+    actualizacion_esperada = np.zeros_like(pesos_iniciales)
+    for entrada, salida in zip(ENTRADAS_AND, SALIDAS_AND):
+        entrada_con_sesgo = np.append(entrada, 1)
+        actualizacion_esperada += (salida - np.dot(entrada_con_sesgo, pesos_iniciales)) * entrada_con_sesgo
+    actualizacion_esperada *= tasa_aprendizaje / len(ENTRADAS_AND)
+    
+    perceptron.entrenar(ENTRADAS_AND, SALIDAS_AND, tasa_aprendizaje=tasa_aprendizaje, max_epocas=1,
+                        error_objetivo=0.0, mostrar_progreso=False, modo_entrenamiento='lote')
+    
+    np.testing.assert_allclose(perceptron.pesos, pesos_iniciales + actualizacion_esperada)
+
+
+def test_inicializacion_minimos_cuadrados_resuelve_compuerta_separable():
+    perceptron = crear_perceptron()
+    
+    convergencia, epoca = perceptron.entrenar(ENTRADAS_AND, SALIDAS_AND, max_epocas=10, error_objetivo=0.0,
+                                              mostrar_progreso=False, inicializacion='minimos_cuadrados')
+    
+    assert convergencia
+    assert epoca == 1
+    np.testing.assert_array_equal(perceptron.predecir(ENTRADAS_AND), SALIDAS_AND)
+
+
+def test_solucion_cerrada_lineal_recupera_objetivo_exacto():
+    perceptron = crear_perceptron('lineal')
+    entradas = np.random.default_rng(2).normal(size=(40, 2))
+    salidas = 2.0 * entradas[:, 0] - entradas[:, 1] + 0.5
+    
+    convergencia, _ = perceptron.entrenar(entradas, salidas, max_epocas=10, error_objetivo=1e-8,
+                                          mostrar_progreso=False, inicializacion='minimos_cuadrados',
+                                          tamaño_bloque=7)
+    
+    assert convergencia
+    np.testing.assert_allclose(perceptron.pesos, [2.0, -1.0, 0.5], atol=1e-10)
+
+
+def test_solucion_cerrada_lineal_sin_convergencia_informa_max_epocas():
+    perceptron = crear_perceptron('lineal')
+    
+    resultado = perceptron.entrenar(ENTRADAS_AND, SALIDAS_AND, max_epocas=10, error_objetivo=0.0,
+                                    mostrar_progreso=False, inicializacion='minimos_cuadrados')
+    
+    assert resultado == (False, 10)
+    assert not perceptron.convergencia_alcanzada
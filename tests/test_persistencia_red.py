@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from tp2.src.perceptron_multicapa import PerceptronMulticapa
+from tp2.src.entrenador_tp2 import EntrenadorTP2
+
+
+def crear_red_entrenada() -> PerceptronMulticapa:
+    np.random.seed(0)
+    red = PerceptronMulticapa([4, 5, 2], ['tanh', 'sigmoide'], 'adam')
+    entradas = np.random.rand(20, 4)
+    salidas = np.random.rand(20, 2)
+    red.entrenar(entradas, salidas, max_epocas=15, mostrar_progreso=False, tamaño_lote=8, semilla=1)
+    return red
+
+
+@pytest.mark.parametrize('mmap_mode', [None, 'r'])
+def test_guardar_cargar_conserva_parametros_y_predicciones(tmp_path, mmap_mode):
+    red = crear_red_entrenada()
+    entradas = np.random.rand(6, 4)
+    
+    ruta = red.guardar(str(tmp_path / 'red'))
+    cargada = PerceptronMulticapa.cargar(ruta, mmap_mode=mmap_mode)
+    
+    np.testing.assert_array_equal(cargada.parametros, red.parametros)
+    np.testing.assert_array_equal(cargada.predecir(entradas), red.predecir(entradas))
+    np.testing.assert_array_equal(np.asarray(cargada.evaluador.historial_errores),
+                                  np.asarray(red.evaluador.historial_errores))
+    assert cargada.epocas_entrenadas == red.epocas_entrenadas
+    
+    if mmap_mode is not None:
+        assert isinstance(cargada.parametros, np.memmap)
+
+
+def test_redes_cargadas_en_otro_entrenador_se_pueden_evaluar_con_ruido(tmp_path):
+    entrenador = EntrenadorTP2()
+    np.random.seed(0)
+    entrenador.entrenar_discriminacion_numeros_pares(max_epocas=50, mostrar_progreso=False, semilla=0)
+    original = entrenador.evaluar_robustez_ruido('discriminacion_pares', 0.0, mostrar_progreso=False)
+    
+    entrenador.guardar_redes(str(tmp_path))
+    
+    nuevo = EntrenadorTP2()
+    redes = nuevo.cargar_redes(str(tmp_path))
+    assert list(redes) == ['discriminacion_pares']
+    
+    cargado = nuevo.evaluar_robustez_ruido('discriminacion_pares', 0.0, mostrar_progreso=False)
+    assert cargado['precision_sin_ruido'] == original['precision_sin_ruido']
+    
+    curva = nuevo.evaluar_curva_robustez_ruido('discriminacion_pares', probabilidades=[0.0, 0.2],
+                                              num_ensayos=3, semilla=0, mostrar_progreso=False)
+    assert len(curva['probabilidades']) == 2
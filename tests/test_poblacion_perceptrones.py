@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from tp1.src.perceptron_simple import PerceptronSimple
+from tp1.src.poblacion_perceptrones import PoblacionPerceptrones
+from comun.constantes.constantes_redes_neuronales import (
+    PATRONES_XOR_SALIDA, PATRONES_AND_ENTRADA, PATRONES_AND_SALIDA, PATRONES_OR_SALIDA
+)
+
+ENTRADAS = np.array(PATRONES_AND_ENTRADA, dtype=float)
+SALIDAS = np.array([PATRONES_AND_SALIDA, PATRONES_XOR_SALIDA, PATRONES_OR_SALIDA], dtype=float)
+TASAS = np.array([0.1, 0.1, 0.5])
+
+
+@pytest.mark.parametrize('modo_entrenamiento', ['online', 'lote'])
+def test_poblacion_equivale_a_perceptrones_independientes(modo_entrenamiento):
+    poblacion = PoblacionPerceptrones(2, len(SALIDAS), 'escalon', semillas=[0, 1, 2])
+    pesos_iniciales = poblacion.pesos.copy()
+    
+    convergencia, epocas = poblacion.entrenar(ENTRADAS, SALIDAS, tasas_aprendizaje=TASAS, max_epocas=50,
+                                              error_objetivo=0.0, mostrar_progreso=False,
+                                              modo_entrenamiento=modo_entrenamiento)
+    
+    for i in range(len(SALIDAS)):
+        perceptron = PerceptronSimple(2, 'escalon')
+        perceptron.pesos = pesos_iniciales[i].copy()
+        convergencia_individual, epoca_individual = perceptron.entrenar(
+            ENTRADAS, SALIDAS[i], tasa_aprendizaje=TASAS[i], max_epocas=50, error_objetivo=0.0,
+            mostrar_progreso=False, modo_entrenamiento=modo_entrenamiento
+        )
+        
+        assert convergencia[i] == convergencia_individual
+        assert epocas[i] == epoca_individual
+        np.testing.assert_allclose(poblacion.pesos[i], perceptron.pesos)
+    
+    assert list(convergencia) == [True, False, True]
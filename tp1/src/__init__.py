@@ -1,4 +1,5 @@
 from .perceptron_simple import PerceptronSimple
+from .poblacion_perceptrones import PoblacionPerceptrones
 from .cargador_datos import CargadorDatos
 from .entrenador_compuertas import EntrenadorCompuertas
 from .visualizador_resultados import VisualizadorResultados
@@ -6,6 +7,7 @@ from .main_tp1 import EjecutorTP1
 
 __all__ = [
     'PerceptronSimple',
+    'PoblacionPerceptrones',
     'CargadorDatos',
     'EntrenadorCompuertas', 
     'VisualizadorResultados',
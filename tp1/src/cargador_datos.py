@@ -1,15 +1,17 @@
 import numpy as np
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Iterable, Iterator
 import os
 import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from comun.src.cache_datos import CacheDatos
 from comun.constantes.constantes_redes_neuronales import (
     PATRONES_XOR_ENTRADA, PATRONES_XOR_SALIDA,
     PATRONES_AND_ENTRADA, PATRONES_AND_SALIDA,
     PATRONES_OR_ENTRADA, PATRONES_OR_SALIDA,
-    ARCHIVO_ENTRENAMIENTO_TP1, ARCHIVO_SALIDA_TP1
+    ARCHIVO_ENTRENAMIENTO_TP1, ARCHIVO_SALIDA_TP1,
+    TAMAÑO_BLOQUE_DEFECTO, LIMITE_VALORES_UNICOS
 )
 
 class CargadorDatos:
@@ -31,26 +33,87 @@ class CargadorDatos:
         return np.array(entradas), np.array(salidas)
     
     @staticmethod
-    def cargar_datos_desde_archivo(ruta_entradas: str, ruta_salidas: str) -> Tuple[np.ndarray, np.ndarray]:
+    def _cargar_texto(ruta_archivo: str, usar_cache: bool) -> np.ndarray:
+
+        if not usar_cache:
+            return np.loadtxt(ruta_archivo)
+        
+        arreglos = CacheDatos.cargar_o_generar(
+            ruta_archivo, lambda: {'datos': np.loadtxt(ruta_archivo)}
+        )
+        return arreglos['datos']
+    
+    @staticmethod
+    def cargar_datos_desde_archivo(ruta_entradas: str, ruta_salidas: str,
+                                   usar_cache: bool = True) -> Tuple[np.ndarray, np.ndarray]:
 
         try:
-            entradas = np.loadtxt(ruta_entradas)
+            entradas = CargadorDatos._cargar_texto(ruta_entradas, usar_cache)
             
-            salidas = np.loadtxt(ruta_salidas)
+            salidas = CargadorDatos._cargar_texto(ruta_salidas, usar_cache)
             
             if len(entradas) != len(salidas):
                 raise ValueError(f"Número de entradas ({len(entradas)}) no coincide "
                                f"con número de salidas ({len(salidas)})")
             
             return entradas, salidas
-            
+        
         except FileNotFoundError as e:
             raise FileNotFoundError(f"No se pudo encontrar el archivo: {e.filename}")
         except Exception as e:
             raise ValueError(f"Error al cargar datos desde archivo: {str(e)}")
     
     @staticmethod
-    def cargar_datos_tp1_ejercicio2(directorio_datos: str = None) -> Tuple[np.ndarray, np.ndarray]:
+    def _convertir_lineas_a_bloque(lineas_entradas: List[str],
+                                  lineas_salidas: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+
+        entradas = np.loadtxt(lineas_entradas, ndmin=2)
+        salidas = np.loadtxt(lineas_salidas, ndmin=1)
+        return entradas, salidas
+    
+    @staticmethod
+    def generar_bloques_desde_archivo(ruta_entradas: str, ruta_salidas: str,
+                                      tamaño_bloque: int = TAMAÑO_BLOQUE_DEFECTO
+                                      ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+
+        try:
+            with open(ruta_entradas, 'r') as archivo_entradas, open(ruta_salidas, 'r') as archivo_salidas:
+                lineas_entradas = (linea for linea in archivo_entradas if linea.strip())
+                lineas_salidas = (linea for linea in archivo_salidas if linea.strip())
+                
+                bloque_entradas = []
+                bloque_salidas = []
+                num_muestras = 0
+                
+                for linea_entrada in lineas_entradas:
+                    linea_salida = next(lineas_salidas, None)
+                    if linea_salida is None:
+                        raise ValueError(f"El archivo de salidas termina antes que el de entradas "
+                                       f"(muestra {num_muestras + 1})")
+                    
+                    bloque_entradas.append(linea_entrada)
+                    bloque_salidas.append(linea_salida)
+                    num_muestras += 1
+                    
+                    if len(bloque_entradas) == tamaño_bloque:
+                        yield CargadorDatos._convertir_lineas_a_bloque(bloque_entradas, bloque_salidas)
+                        bloque_entradas = []
+                        bloque_salidas = []
+                
+                if next(lineas_salidas, None) is not None:
+                    raise ValueError(f"El archivo de entradas termina antes que el de salidas "
+                                   f"(muestra {num_muestras + 1})")
+                
+                if bloque_entradas:
+                    yield CargadorDatos._convertir_lineas_a_bloque(bloque_entradas, bloque_salidas)
+        
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"No se pudo encontrar el archivo: {e.filename}")
+    
+    @staticmethod
+    def generar_bloques_tp1_ejercicio2(directorio_datos: str = None,
+                                       tamaño_bloque: int = TAMAÑO_BLOQUE_DEFECTO
+                                       ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
 
         if directorio_datos is None:
             directorio_actual = os.path.dirname(__file__)
@@ -59,7 +122,20 @@ class CargadorDatos:
         ruta_entradas = os.path.join(directorio_datos, ARCHIVO_ENTRENAMIENTO_TP1)
         ruta_salidas = os.path.join(directorio_datos, ARCHIVO_SALIDA_TP1)
         
-        return CargadorDatos.cargar_datos_desde_archivo(ruta_entradas, ruta_salidas)
+        return CargadorDatos.generar_bloques_desde_archivo(ruta_entradas, ruta_salidas, tamaño_bloque)
+    
+    @staticmethod
+    def cargar_datos_tp1_ejercicio2(directorio_datos: str = None,
+                                    usar_cache: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+
+        if directorio_datos is None:
+            directorio_actual = os.path.dirname(__file__)
+            directorio_datos = os.path.join(directorio_actual, '..', 'datos')
+        
+        ruta_entradas = os.path.join(directorio_datos, ARCHIVO_ENTRENAMIENTO_TP1)
+        ruta_salidas = os.path.join(directorio_datos, ARCHIVO_SALIDA_TP1)
+        
+        return CargadorDatos.cargar_datos_desde_archivo(ruta_entradas, ruta_salidas, usar_cache)
     
     @staticmethod
     def preparar_datos_entrenamiento(entradas: np.ndarray, salidas: np.ndarray,
@@ -98,6 +174,76 @@ class CargadorDatos:
             'media_entradas': np.mean(entradas, axis=0),
             'desviacion_entradas': np.std(entradas, axis=0),
             'valores_unicos_salidas': np.unique(salidas),
+            'valores_unicos_truncados': False,
+            'limite_valores_unicos': None,
             'forma_entradas': entradas.shape,
             'forma_salidas': salidas.shape
         }
+    
+    @staticmethod
+    def obtener_informacion_datos_streaming(bloques: Iterable[Tuple[np.ndarray, np.ndarray]]) -> Dict[str, any]:
+
+        num_muestras = 0
+        media = None
+        suma_cuadrados = None
+        minimo_entradas, maximo_entradas = np.inf, -np.inf
+        minimo_salidas, maximo_salidas = np.inf, -np.inf
+        valores_unicos = np.array([])
+        valores_unicos_truncados = False
+        forma_salidas = ()
+        
+        for entradas, salidas in bloques:
+            entradas = np.asarray(entradas, dtype=float)
+            salidas = np.asarray(salidas, dtype=float)
+            if entradas.ndim == 1:
+                entradas = entradas.reshape(-1, 1)
+            
+            num_bloque = len(entradas)
+            if num_bloque == 0:
+                continue
+            
+            media_bloque = np.mean(entradas, axis=0)
+            suma_cuadrados_bloque = np.sum(np.square(entradas - media_bloque), axis=0)
+            
+            if media is None:
+                media = media_bloque
+                suma_cuadrados = suma_cuadrados_bloque
+            else:
+                total = num_muestras + num_bloque
+                diferencia = media_bloque - media
+                media = media + diferencia * num_bloque / total
+                suma_cuadrados = (suma_cuadrados + suma_cuadrados_bloque
+                                  + np.square(diferencia) * num_muestras * num_bloque / total)
+            
+            num_muestras += num_bloque
+            minimo_entradas = min(minimo_entradas, np.min(entradas))
+            maximo_entradas = max(maximo_entradas, np.max(entradas))
+            minimo_salidas = min(minimo_salidas, np.min(salidas))
+            maximo_salidas = max(maximo_salidas, np.max(salidas))
+            forma_salidas = salidas.shape[1:]
+            
+            # Se conservan siempre los LIMITE_VALORES_UNICOS valores menores, de modo que el
+            # resumen no depende del orden en que llegan los bloques
+            valores_unicos = np.union1d(valores_unicos, salidas)
+            if len(valores_unicos) > LIMITE_VALORES_UNICOS:
+                valores_unicos = valores_unicos[:LIMITE_VALORES_UNICOS]
+                valores_unicos_truncados = True
+        
+        if num_muestras == 0:
+            raise ValueError("No se recibieron muestras para calcular la información de los datos")
+        
+        num_caracteristicas = len(media)
+        
+        return {
+            'num_muestras': num_muestras,
+            'num_caracteristicas': num_caracteristicas,
+            'rango_entradas': (minimo_entradas, maximo_entradas),
+            'rango_salidas': (minimo_salidas, maximo_salidas),
+            'media_entradas': media,
+            'desviacion_entradas': np.sqrt(suma_cuadrados / num_muestras),
+            'valores_unicos_salidas': valores_unicos,
+            'valores_unicos_truncados': valores_unicos_truncados,
+            'limite_valores_unicos': LIMITE_VALORES_UNICOS,
+            'forma_entradas': (num_muestras, num_caracteristicas),
+            'forma_salidas': (num_muestras,) + forma_salidas
+        }
@@ -1,11 +1,12 @@
 import numpy as np
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from .perceptron_simple import PerceptronSimple
+from .poblacion_perceptrones import PoblacionPerceptrones
 from .cargador_datos import CargadorDatos
 from .visualizador_resultados import VisualizadorResultados
 from comun.constantes.constantes_redes_neuronales import (
@@ -24,7 +25,8 @@ class EntrenadorCompuertas:
                                     tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                                     max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
                                     error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
-                                    mostrar_progreso: bool = True) -> Dict:
+                                    mostrar_progreso: bool = True,
+                                    detectar_ciclos: bool = False) -> Dict:
 
         try:
             entradas, salidas_esperadas = CargadorDatos.cargar_datos_compuerta_logica(tipo_compuerta)
@@ -45,7 +47,8 @@ class EntrenadorCompuertas:
                 tasa_aprendizaje=tasa_aprendizaje,
                 max_epocas=max_epocas,
                 error_objetivo=error_objetivo,
-                mostrar_progreso=mostrar_progreso
+                mostrar_progreso=mostrar_progreso,
+                detectar_ciclos=detectar_ciclos
             )
             
             metricas = perceptron.evaluar(entradas, salidas_esperadas)
@@ -56,6 +59,8 @@ class EntrenadorCompuertas:
                 'funcion_activacion': funcion_activacion,
                 'convergencia': convergencia,
                 'epoca_convergencia': epoca_convergencia,
+                'ciclo_detectado': perceptron.ciclo_detectado,
+                'longitud_ciclo': perceptron.longitud_ciclo,
                 'metricas': metricas,
                 'info_entrenamiento': info_entrenamiento,
                 'entradas': entradas,
@@ -70,7 +75,7 @@ class EntrenadorCompuertas:
                 self.visualizador.mostrar_resultados_entrenamiento(resultados)
             
             return resultados
-            
+        
         except Exception as e:
             error_msg = f"Error al entrenar compuerta {tipo_compuerta}: {str(e)}"
             print(error_msg)
@@ -79,7 +84,8 @@ class EntrenadorCompuertas:
     def entrenar_todas_las_compuertas(self, funcion_activacion: str = 'escalon',
                                     tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                                     max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
-                                    mostrar_progreso: bool = True) -> Dict[str, Dict]:
+                                    mostrar_progreso: bool = True,
+                                    detectar_ciclos: bool = False) -> Dict[str, Dict]:
 
         compuertas = ['and', 'or', 'xor']
         resultados_completos = {}
@@ -96,7 +102,8 @@ class EntrenadorCompuertas:
                 funcion_activacion=funcion_activacion,
                 tasa_aprendizaje=tasa_aprendizaje,
                 max_epocas=max_epocas,
-                mostrar_progreso=mostrar_progreso
+                mostrar_progreso=mostrar_progreso,
+                detectar_ciclos=detectar_ciclos
             )
             resultados_completos[compuerta] = resultado
         
@@ -107,7 +114,8 @@ class EntrenadorCompuertas:
     
     def comparar_funciones_activacion(self, tipo_compuerta: str,
                                     funciones: list = None,
-                                    mostrar_progreso: bool = True) -> Dict[str, Dict]:
+                                    mostrar_progreso: bool = True,
+                                    detectar_ciclos: bool = False) -> Dict[str, Dict]:
 
         if funciones is None:
             funciones = ['escalon', 'sigmoide', 'lineal']
@@ -123,7 +131,8 @@ class EntrenadorCompuertas:
             resultado = self.entrenar_compuerta_individual(
                 tipo_compuerta=tipo_compuerta,
                 funcion_activacion=funcion,
-                mostrar_progreso=mostrar_progreso
+                mostrar_progreso=mostrar_progreso,
+                detectar_ciclos=detectar_ciclos
             )
             resultados_comparacion[funcion] = resultado
         
@@ -132,6 +141,99 @@ class EntrenadorCompuertas:
         
         return resultados_comparacion
     
+    def estudiar_convergencia_poblacion(self, compuertas: List[str] = None,
+                                       num_inicializaciones: int = 1000,
+                                       tasas_aprendizaje: List[float] = None,
+                                       funcion_activacion: str = 'escalon',
+                                       max_epocas: int = 1000,
+                                       error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                                       semilla_base: int = 0,
+                                       modo_entrenamiento: str = 'online',
+                                       mostrar_progreso: bool = True) -> Dict[str, Dict]:
+
+        if compuertas is None:
+            compuertas = ['and', 'or', 'xor']
+        
+        if tasas_aprendizaje is None:
+            tasas_aprendizaje = [TASA_APRENDIZAJE_DEFECTO]
+        
+        entradas = None
+        objetivos = []
+        tasas = []
+        grupos = []
+        
+        for compuerta in compuertas:
+            entradas_compuerta, salidas_compuerta = CargadorDatos.cargar_datos_compuerta_logica(compuerta)
+            
+            if entradas is None:
+                entradas = entradas_compuerta
+            elif not np.array_equal(entradas, entradas_compuerta):
+                raise ValueError("Todas las compuertas de la población deben compartir las entradas")
+            
+            for tasa in tasas_aprendizaje:
+                objetivos.append(np.tile(salidas_compuerta, (num_inicializaciones, 1)))
+                tasas.append(np.full(num_inicializaciones, tasa))
+                grupos.append((compuerta, tasa))
+        
+        num_miembros = len(grupos) * num_inicializaciones
+        semillas = semilla_base + np.arange(num_miembros)
+        
+        if mostrar_progreso:
+            print(f"\n{'='*60}")
+            print(f"ESTUDIO DE CONVERGENCIA POBLACIONAL")
+            print(f"Compuertas: {compuertas} | Tasas: {tasas_aprendizaje}")
+            print(f"Miembros: {num_miembros} ({num_inicializaciones} inicializaciones por grupo)")
+            print(f"{'='*60}")
+        
+        poblacion = PoblacionPerceptrones(
+            num_entradas=entradas.shape[1],
+            num_miembros=num_miembros,
+            funcion_activacion=funcion_activacion,
+            semillas=semillas
+        )
+        
+        poblacion.entrenar(
+            entradas=entradas,
+            salidas_esperadas=np.vstack(objetivos),
+            tasas_aprendizaje=np.concatenate(tasas),
+            max_epocas=max_epocas,
+            error_objetivo=error_objetivo,
+            mostrar_progreso=mostrar_progreso,
+            modo_entrenamiento=modo_entrenamiento
+        )
+        
+        resultados = {}
+        for indice_grupo, (compuerta, tasa) in enumerate(grupos):
+            indices = np.arange(indice_grupo * num_inicializaciones,
+                                (indice_grupo + 1) * num_inicializaciones)
+            
+            estadisticas = poblacion.obtener_estadisticas_convergencia(indices)
+            estadisticas.update({
+                'tipo_compuerta': compuerta,
+                'tasa_aprendizaje': tasa,
+                'epocas_convergencia': poblacion.epocas_convergencia[indices],
+                'convergencia': poblacion.convergencia_alcanzada[indices]
+            })
+            resultados[f"{compuerta}_lr{tasa}"] = estadisticas
+        
+        if mostrar_progreso:
+            self._mostrar_resumen_poblacion(resultados)
+        
+        return resultados
+    
+    def _mostrar_resumen_poblacion(self, resultados: Dict[str, Dict]) -> None:
+
+        print(f"\n{'='*60}")
+        print("RESUMEN DE CONVERGENCIA POBLACIONAL")
+        print(f"{'='*60}")
+        
+        for nombre, estadisticas in resultados.items():
+            tasa_convergencia = estadisticas['tasa_convergencia'] * 100
+            epoca_media = estadisticas.get('epoca_media', float('nan'))
+            
+            print(f"{nombre:>14}: Convergencia: {tasa_convergencia:>6.1f}% | "
+                  f"Época media: {epoca_media:>8.1f}")
+    
     def _mostrar_resumen_comparativo(self, resultados: Dict[str, Dict]) -> None:
 
         print(f"\n{'='*60}")
@@ -143,9 +245,11 @@ class EntrenadorCompuertas:
                 convergencia = "SÍ" if resultado['convergencia'] else "NO"
                 epoca = resultado.get('epoca_convergencia', 'N/A')
                 precision = resultado['metricas'].get('precision', 0) * 100
+                ciclo = (f" | Ciclo: {resultado['longitud_ciclo']}"
+                         if resultado.get('ciclo_detectado') else "")
                 
                 print(f"{compuerta.upper():>8}: Convergencia: {convergencia:>3} | "
-                      f"Época: {epoca:>6} | Precisión: {precision:>6.1f}%")
+                      f"Época: {epoca:>6} | Precisión: {precision:>6.1f}%{ciclo}")
             else:
                 print(f"{compuerta.upper():>8}: ERROR - {resultado['error']}")
     
@@ -30,7 +30,8 @@ class EjecutorTP1:
             funcion_activacion='escalon',
             tasa_aprendizaje=TASA_APRENDIZAJE_DEFECTO,
             max_epocas=1000,
-            mostrar_progreso=True
+            mostrar_progreso=True,
+            detectar_ciclos=True
         )
         
         self.resultados_experimentos['ejercicio_1_escalon'] = resultados_escalon
@@ -46,7 +47,8 @@ class EjecutorTP1:
         resultados_comparacion = self.entrenador.comparar_funciones_activacion(
             tipo_compuerta='xor',
             funciones=['escalon', 'sigmoide', 'lineal'],
-            mostrar_progreso=True
+            mostrar_progreso=True,
+            detectar_ciclos=True
         )
         
         self.resultados_experimentos['ejercicio_1_comparacion'] = resultados_comparacion
@@ -75,7 +77,8 @@ class EjecutorTP1:
             resultado_lineal = self._entrenar_perceptron_individual(
                 entradas_train, salidas_train, entradas_val, salidas_val,
                 funcion_activacion='lineal',
-                nombre_experimento='Perceptrón Lineal'
+                nombre_experimento='Perceptrón Lineal',
+                inicializacion='minimos_cuadrados'
             )
             
             print("\n🔹 Entrenando PERCEPTRÓN NO LINEAL (Sigmoide):")
@@ -92,7 +95,7 @@ class EjecutorTP1:
             }
             
             self._comparar_perceptrones_lineales_no_lineales(resultado_lineal, resultado_sigmoide)
-            
+        
         except Exception as e:
             print(f"❌ Error al ejecutar ejercicio 2: {str(e)}")
             print("💡 Asegúrese de que los archivos de datos estén en tp1/datos/")
@@ -100,7 +103,8 @@ class EjecutorTP1:
     def _entrenar_perceptron_individual(self, entradas_train, salidas_train, 
                                       entradas_val, salidas_val,
                                       funcion_activacion: str,
-                                      nombre_experimento: str) -> dict:
+                                      nombre_experimento: str,
+                                      inicializacion: str = 'aleatoria') -> dict:
 
         perceptron = PerceptronSimple(
             num_entradas=entradas_train.shape[1],
@@ -112,7 +116,8 @@ class EjecutorTP1:
             salidas_esperadas=salidas_train,
             tasa_aprendizaje=TASA_APRENDIZAJE_DEFECTO,
             max_epocas=EPOCAS_MAXIMAS_DEFECTO,
-            mostrar_progreso=True
+            mostrar_progreso=True,
+            inicializacion=inicializacion
         )
         
         metricas_train = perceptron.evaluar(entradas_train, salidas_train)
@@ -142,7 +147,9 @@ class EjecutorTP1:
         print(f"  Rango de entradas: {info_datos['rango_entradas']}")
         print(f"  Rango de salidas: {info_datos['rango_salidas']}")
         print(f"  Forma de entradas: {info_datos['forma_entradas']}")
-        print(f"  Valores únicos en salidas: {info_datos['valores_unicos_salidas']}")
+        truncados = (f" ({info_datos['limite_valores_unicos']} menores)"
+                     if info_datos.get('valores_unicos_truncados') else "")
+        print(f"  Valores únicos en salidas{truncados}: {info_datos['valores_unicos_salidas']}")
     
     def _mostrar_resultados_experimento_individual(self, resultado: dict) -> None:
 
@@ -178,6 +185,9 @@ class EjecutorTP1:
                 
                 if convergencia:
                     print(f"  ✅ {compuerta.upper()}: Problema linealmente separable (Precisión: {precision:.1f}%)")
+                elif resultado.get('ciclo_detectado'):
+                    print(f"  ❌ {compuerta.upper()}: Problema NO linealmente separable "
+                          f"(ciclo de {resultado['longitud_ciclo']} épocas, Precisión: {precision:.1f}%)")
                 else:
                     print(f"  ❌ {compuerta.upper()}: Problema NO linealmente separable (Precisión: {precision:.1f}%)")
         
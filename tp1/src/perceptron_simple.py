@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Callable, Tuple, Optional
+from typing import Callable, Iterable, Iterator, List, Tuple, Optional
 import sys
 import os
 
@@ -8,9 +8,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from comun.src.funciones_activacion import FuncionesActivacion
 from comun.src.utilidades_matematicas import UtilidadesMatematicas
 from comun.src.evaluador_rendimiento import EvaluadorRendimiento
+from comun.src.callbacks_entrenamiento import CallbackEntrenamiento
 from comun.constantes.constantes_redes_neuronales import (
     TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO, ERROR_OBJETIVO_DEFECTO,
-    RANGO_PESO_MINIMO, RANGO_PESO_MAXIMO, MENSAJE_CONVERGENCIA, MENSAJE_NO_CONVERGENCIA
+    RANGO_PESO_MINIMO, RANGO_PESO_MAXIMO, MENSAJE_CONVERGENCIA, MENSAJE_NO_CONVERGENCIA,
+    MODOS_ENTRENAMIENTO_PERCEPTRON, CAPACIDAD_HUELLAS_CICLO, DECIMALES_HUELLA_PESOS,
+    MENSAJE_CICLO_DETECTADO, MENSAJE_SOLUCION_CERRADA, INICIALIZACIONES_PERCEPTRON,
+    TAMAÑO_BLOQUE_DEFECTO
 )
 
 class PerceptronSimple:
@@ -30,6 +34,8 @@ class PerceptronSimple:
         self.evaluador = EvaluadorRendimiento()
         self.convergencia_alcanzada = False
         self.epoca_convergencia = 0
+        self.ciclo_detectado = False
+        self.longitud_ciclo = 0
     
     def _agregar_sesgo(self, entradas: np.ndarray) -> np.ndarray:
 
@@ -46,53 +52,299 @@ class PerceptronSimple:
     def predecir(self, entradas: np.ndarray) -> np.ndarray:
 
         entradas_con_sesgo = self._agregar_sesgo(entradas)
+        salidas_netas = self._calcular_salida_neta(entradas_con_sesgo)
         
         if entradas.ndim == 1:
-            salida_neta = self._calcular_salida_neta(entradas_con_sesgo)
-            return self.funcion_activacion(np.array([salida_neta]))[0]
-        else:
-            predicciones = []
-            for entrada in entradas_con_sesgo:
-                salida_neta = self._calcular_salida_neta(entrada)
-                prediccion = self.funcion_activacion(np.array([salida_neta]))[0]
-                predicciones.append(prediccion)
-            return np.array(predicciones)
+            return self.funcion_activacion(np.array([salidas_netas]))[0]
+        
+        return self.funcion_activacion(salidas_netas)
     
     def _actualizar_pesos(self, entrada_con_sesgo: np.ndarray, error: float, 
                          tasa_aprendizaje: float) -> None:
 
         self.pesos += tasa_aprendizaje * error * entrada_con_sesgo
     
+    def _ejecutar_epoca_online(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                              tasa_aprendizaje: float) -> float:
+
+        error_total = 0.0
+        
+        for i, entrada in enumerate(entradas):
+            entrada_con_sesgo = self._agregar_sesgo(entrada)
+            prediccion = self.predecir(entrada)
+            error = salidas_esperadas[i] - prediccion
+            
+            if abs(error) > 1e-10:
+                self._actualizar_pesos(entrada_con_sesgo, error, tasa_aprendizaje)
+            
+            error_total += abs(error)
+        
+        return error_total / len(entradas)
+    
+    def _ejecutar_epoca_lote(self, entradas_con_sesgo: np.ndarray, salidas_esperadas: np.ndarray,
+                            tasa_aprendizaje: float) -> float:
+
+        predicciones = self.funcion_activacion(self._calcular_salida_neta(entradas_con_sesgo))
+        errores = salidas_esperadas - predicciones
+        
+        self.pesos += tasa_aprendizaje * np.dot(errores, entradas_con_sesgo) / len(errores)
+        
+        return float(np.mean(np.abs(errores)))
+    
+    def _calcular_huella_pesos(self, tasa_aprendizaje: float) -> int:
+
+        pesos_cuantizados = np.round(self.pesos, DECIMALES_HUELLA_PESOS) + 0.0
+        return hash((pesos_cuantizados.tobytes(), float(tasa_aprendizaje)))
+    
+    def _registrar_huella_pesos(self, huellas: dict, epoca: int, capacidad: int,
+                                tasa_aprendizaje: float) -> int:
+
+        huella = self._calcular_huella_pesos(tasa_aprendizaje)
+        
+        if huella in huellas:
+            return epoca - huellas[huella]
+        
+        if len(huellas) >= capacidad:
+            del huellas[next(iter(huellas))]
+        
+        huellas[huella] = epoca
+        return 0
+    
+    @staticmethod
+    def _generar_bloques(entradas: np.ndarray, salidas: np.ndarray,
+                        tamaño_bloque: int) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+
+        for inicio in range(0, len(entradas), tamaño_bloque):
+            yield entradas[inicio:inicio + tamaño_bloque], salidas[inicio:inicio + tamaño_bloque]
+    
+    def _acumular_ecuaciones_normales(self, bloques: Iterable[Tuple[np.ndarray, np.ndarray]]
+                                     ) -> Tuple[np.ndarray, np.ndarray]:
+
+        dimension = self.num_entradas + 1
+        matriz_normal = np.zeros((dimension, dimension))
+        vector_normal = np.zeros(dimension)
+        
+        for entradas_bloque, salidas_bloque in bloques:
+            entradas_bloque = np.asarray(entradas_bloque, dtype=float).reshape(-1, self.num_entradas)
+            entradas_con_sesgo = self._agregar_sesgo(entradas_bloque)
+            
+            matriz_normal += np.dot(entradas_con_sesgo.T, entradas_con_sesgo)
+            vector_normal += np.dot(entradas_con_sesgo.T, np.ravel(salidas_bloque))
+        
+        return matriz_normal, vector_normal
+    
+    def inicializar_minimos_cuadrados(self, bloques: Iterable[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+
+        matriz_normal, vector_normal = self._acumular_ecuaciones_normales(bloques)
+        self.pesos = np.linalg.lstsq(matriz_normal, vector_normal, rcond=None)[0]
+        
+        return self.pesos.copy()
+    
+    def _calcular_error_promedio_bloques(self, bloques: Iterable[Tuple[np.ndarray, np.ndarray]]) -> float:
+
+        error_total = 0.0
+        num_muestras = 0
+        
+        for entradas_bloque, salidas_bloque in bloques:
+            entradas_bloque = np.asarray(entradas_bloque, dtype=float).reshape(-1, self.num_entradas)
+            predicciones = self.predecir(entradas_bloque)
+            error_total += np.sum(np.abs(np.ravel(salidas_bloque) - predicciones))
+            num_muestras += len(entradas_bloque)
+        
+        return error_total / num_muestras
+    
+    def _finalizar_solucion_cerrada(self, error_promedio: float, error_objetivo: float,
+                                   max_epocas: int, mostrar_progreso: bool) -> Tuple[bool, int]:
+
+        self.evaluador.registrar_error(error_promedio)
+        
+        if mostrar_progreso:
+            print(f"{MENSAJE_SOLUCION_CERRADA} Error promedio = {error_promedio:.6f}")
+        
+        if error_promedio <= error_objetivo:
+            return self._marcar_convergencia(0, mostrar_progreso)
+        
+        self.convergencia_alcanzada = False
+        if mostrar_progreso:
+            print(MENSAJE_NO_CONVERGENCIA)
+        return False, max_epocas
+    
+    def _marcar_convergencia(self, epoca: int, mostrar_progreso: bool) -> Tuple[bool, int]:
+
+        self.convergencia_alcanzada = True
+        self.epoca_convergencia = epoca + 1
+        if mostrar_progreso:
+            print(f"{MENSAJE_CONVERGENCIA} Época: {self.epoca_convergencia}")
+        return True, self.epoca_convergencia
+    
     def entrenar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
                 tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                 max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
                 error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
-                mostrar_progreso: bool = True) -> Tuple[bool, int]:
+                mostrar_progreso: bool = True,
+                modo_entrenamiento: str = 'online',
+                detectar_ciclos: bool = False,
+                capacidad_huellas: int = CAPACIDAD_HUELLAS_CICLO,
+                inicializacion: str = 'aleatoria',
+                tamaño_bloque: int = TAMAÑO_BLOQUE_DEFECTO,
+                callbacks: Optional[List[CallbackEntrenamiento]] = None) -> Tuple[bool, int]:
+
+        if modo_entrenamiento not in MODOS_ENTRENAMIENTO_PERCEPTRON:
+            raise ValueError(f"Modo de entrenamiento '{modo_entrenamiento}' no válido. "
+                           f"Opciones: {list(MODOS_ENTRENAMIENTO_PERCEPTRON)}")
+        
+        if inicializacion not in INICIALIZACIONES_PERCEPTRON:
+            raise ValueError(f"Inicialización '{inicializacion}' no válida. "
+                           f"Opciones: {list(INICIALIZACIONES_PERCEPTRON)}")
+        
+        self.evaluador.limpiar_historial()
+        self.ciclo_detectado = False
+        self.longitud_ciclo = 0
+        huellas = {}
+        detectar_ciclos = detectar_ciclos and self.nombre_funcion == 'escalon'
+        
+        callbacks = list(callbacks) if callbacks is not None else []
+        registro = {'tasa_aprendizaje': tasa_aprendizaje, 'error': None}
+        for callback in callbacks:
+            callback.al_iniciar_entrenamiento(self, registro)
+        
+        if inicializacion == 'minimos_cuadrados':
+            self.inicializar_minimos_cuadrados(
+                self._generar_bloques(entradas, salidas_esperadas, tamaño_bloque)
+            )
+            if self.nombre_funcion == 'lineal':
+                error_promedio = self._calcular_error_promedio_bloques(
+                    self._generar_bloques(entradas, salidas_esperadas, tamaño_bloque)
+                )
+                resultado = self._finalizar_solucion_cerrada(error_promedio, error_objetivo,
+                                                             max_epocas, mostrar_progreso)
+                return self._finalizar_callbacks(callbacks, registro, error_promedio, resultado)
+        
+        if modo_entrenamiento == 'lote':
+            entradas_con_sesgo = self._agregar_sesgo(np.asarray(entradas, dtype=float))
+            salidas_lote = np.ravel(salidas_esperadas).astype(float)
+        
+        error_promedio = None
+        
+        for epoca in range(max_epocas):
+            if modo_entrenamiento == 'lote':
+                error_promedio = self._ejecutar_epoca_lote(
+                    entradas_con_sesgo, salidas_lote, registro['tasa_aprendizaje']
+                )
+            else:
+                error_promedio = self._ejecutar_epoca_online(
+                    entradas, salidas_esperadas, registro['tasa_aprendizaje']
+                )
+            
+            self.evaluador.registrar_error(error_promedio)
+            
+            if error_promedio <= error_objetivo:
+                resultado = self._marcar_convergencia(epoca, mostrar_progreso)
+                return self._finalizar_callbacks(callbacks, registro, error_promedio, resultado)
+            
+            if detectar_ciclos:
+                longitud_ciclo = self._registrar_huella_pesos(huellas, epoca, capacidad_huellas,
+                                                              registro['tasa_aprendizaje'])
+                
+                if longitud_ciclo > 0:
+                    self.ciclo_detectado = True
+                    self.longitud_ciclo = longitud_ciclo
+                    if mostrar_progreso:
+                        print(f"{MENSAJE_CICLO_DETECTADO} Época: {epoca + 1} | "
+                              f"Longitud del ciclo: {longitud_ciclo}")
+                    return self._finalizar_callbacks(callbacks, registro, error_promedio,
+                                                     (False, epoca + 1))
+            
+            if mostrar_progreso and epoca % 1000 == 0:
+                print(f"Época {epoca}: Error promedio = {error_promedio:.6f}")
+            
+            registro['error'] = error_promedio
+            if CallbackEntrenamiento.notificar_fin_epoca(callbacks, self, epoca, registro):
+                if mostrar_progreso:
+                    print(registro.get('motivo_detencion', MENSAJE_NO_CONVERGENCIA))
+                return self._finalizar_callbacks(callbacks, registro, error_promedio,
+                                                 (False, epoca + 1))
+        
+        if mostrar_progreso:
+            print(MENSAJE_NO_CONVERGENCIA)
+        return self._finalizar_callbacks(callbacks, registro, error_promedio, (False, max_epocas))
+    
+    def _finalizar_callbacks(self, callbacks: List[CallbackEntrenamiento], registro: dict,
+                            error_final: Optional[float],
+                            resultado: Tuple[bool, int]) -> Tuple[bool, int]:
 
+        registro['error'] = error_final
+        registro['convergencia'] = resultado[0]
+        for callback in callbacks:
+            callback.al_finalizar_entrenamiento(self, registro)
+        return resultado
+    
+    def obtener_parametros(self) -> np.ndarray:
+
+        return self.pesos.copy()
+    
+    def establecer_parametros(self, parametros: np.ndarray) -> None:
+
+        np.copyto(self.pesos, parametros)
+    
+    def calcular_error_conjunto(self, entradas: np.ndarray, salidas_esperadas: np.ndarray) -> float:
+
+        predicciones = self.predecir(np.asarray(entradas, dtype=float))
+        return float(np.mean(np.abs(np.ravel(salidas_esperadas) - predicciones)))
+    
+    def entrenar_streaming(self, fuente_bloques: Callable[[], Iterable[Tuple[np.ndarray, np.ndarray]]],
+                          tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                          max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                          error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                          mostrar_progreso: bool = True,
+                          modo_entrenamiento: str = 'lote',
+                          inicializacion: str = 'aleatoria') -> Tuple[bool, int]:
+
+        if modo_entrenamiento not in MODOS_ENTRENAMIENTO_PERCEPTRON:
+            raise ValueError(f"Modo de entrenamiento '{modo_entrenamiento}' no válido. "
+                           f"Opciones: {list(MODOS_ENTRENAMIENTO_PERCEPTRON)}")
+        
+        if inicializacion not in INICIALIZACIONES_PERCEPTRON:
+            raise ValueError(f"Inicialización '{inicializacion}' no válida. "
+                           f"Opciones: {list(INICIALIZACIONES_PERCEPTRON)}")
+        
         self.evaluador.limpiar_historial()
         
+        if inicializacion == 'minimos_cuadrados':
+            self.inicializar_minimos_cuadrados(fuente_bloques())
+            if self.nombre_funcion == 'lineal':
+                error_promedio = self._calcular_error_promedio_bloques(fuente_bloques())
+                return self._finalizar_solucion_cerrada(error_promedio, error_objetivo,
+                                                        max_epocas, mostrar_progreso)
+        
         for epoca in range(max_epocas):
             error_total = 0.0
+            num_muestras = 0
             
-            for i, entrada in enumerate(entradas):
-                entrada_con_sesgo = self._agregar_sesgo(entrada)
-                prediccion = self.predecir(entrada)
-                error = salidas_esperadas[i] - prediccion
+            for entradas_bloque, salidas_bloque in fuente_bloques():
+                entradas_bloque = np.asarray(entradas_bloque, dtype=float).reshape(-1, self.num_entradas)
+                salidas_bloque = np.ravel(salidas_bloque).astype(float)
                 
-                if abs(error) > 1e-10:
-                    self._actualizar_pesos(entrada_con_sesgo, error, tasa_aprendizaje)
+                if modo_entrenamiento == 'lote':
+                    error_bloque = self._ejecutar_epoca_lote(
+                        self._agregar_sesgo(entradas_bloque), salidas_bloque, tasa_aprendizaje
+                    )
+                else:
+                    error_bloque = self._ejecutar_epoca_online(
+                        entradas_bloque, salidas_bloque, tasa_aprendizaje
+                    )
                 
-                error_total += abs(error)
+                error_total += error_bloque * len(entradas_bloque)
+                num_muestras += len(entradas_bloque)
             
-            error_promedio = error_total / len(entradas)
+            if num_muestras == 0:
+                raise ValueError("La fuente de bloques no produjo muestras para entrenar")
+            
+            error_promedio = error_total / num_muestras
             self.evaluador.registrar_error(error_promedio)
             
             if error_promedio <= error_objetivo:
-                self.convergencia_alcanzada = True
-                self.epoca_convergencia = epoca + 1
-                if mostrar_progreso:
-                    print(f"{MENSAJE_CONVERGENCIA} Época: {self.epoca_convergencia}")
-                return True, self.epoca_convergencia
+                return self._marcar_convergencia(epoca, mostrar_progreso)
             
             if mostrar_progreso and epoca % 1000 == 0:
                 print(f"Época {epoca}: Error promedio = {error_promedio:.6f}")
@@ -103,7 +355,7 @@ class PerceptronSimple:
     
     def evaluar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray) -> dict:
 
-        predicciones = np.array([self.predecir(entrada) for entrada in entradas])
+        predicciones = self.predecir(np.asarray(entradas))
         
         if self.nombre_funcion == 'escalon':
             return self.evaluador.evaluar_clasificacion_binaria(predicciones, salidas_esperadas)
@@ -124,6 +376,8 @@ class PerceptronSimple:
         info = {
             'convergencia_alcanzada': self.convergencia_alcanzada,
             'epoca_convergencia': self.epoca_convergencia,
+            'ciclo_detectado': self.ciclo_detectado,
+            'longitud_ciclo': self.longitud_ciclo,
             'funcion_activacion': self.nombre_funcion,
             'num_entradas': self.num_entradas,
             'pesos_finales': self.pesos.copy()
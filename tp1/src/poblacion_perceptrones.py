@@ -0,0 +1,176 @@
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from .perceptron_simple import PerceptronSimple
+from comun.src.funciones_activacion import FuncionesActivacion
+from comun.constantes.constantes_redes_neuronales import (
+    TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO, ERROR_OBJETIVO_DEFECTO,
+    RANGO_PESO_MINIMO, RANGO_PESO_MAXIMO, INTERVALO_IMPRESION_DEFECTO,
+    MODOS_ENTRENAMIENTO_PERCEPTRON
+)
+
+class PoblacionPerceptrones:
+
+    def __init__(self, num_entradas: int, num_miembros: int,
+                 funcion_activacion: str = 'escalon',
+                 semillas: Optional[Sequence[int]] = None):
+
+        if semillas is not None and len(semillas) != num_miembros:
+            raise ValueError(f"Se esperaban {num_miembros} semillas, se recibieron {len(semillas)}")
+        
+        self.num_entradas = num_entradas
+        self.num_miembros = num_miembros
+        self.pesos = self._inicializar_pesos(semillas)
+        
+        self.funcion_activacion, self.derivada_activacion = (
+            FuncionesActivacion.obtener_funcion_y_derivada(funcion_activacion)
+        )
+        
+        self.nombre_funcion = funcion_activacion
+        self.convergencia_alcanzada = np.zeros(num_miembros, dtype=bool)
+        self.epocas_convergencia = np.zeros(num_miembros, dtype=int)
+    
+    def _inicializar_pesos(self, semillas: Optional[Sequence[int]]) -> np.ndarray:
+
+        forma = (self.num_miembros, self.num_entradas + 1)
+        
+        if semillas is None:
+            return np.random.uniform(RANGO_PESO_MINIMO, RANGO_PESO_MAXIMO, forma)
+        
+        pesos = np.empty(forma)
+        for i, semilla in enumerate(semillas):
+            generador = np.random.RandomState(semilla)
+            pesos[i] = generador.uniform(RANGO_PESO_MINIMO, RANGO_PESO_MAXIMO, forma[1])
+        return pesos
+    
+    def _agregar_sesgo(self, entradas: np.ndarray) -> np.ndarray:
+
+        sesgos = np.ones((entradas.shape[0], 1))
+        return np.hstack([entradas, sesgos])
+    
+    def _preparar_salidas(self, salidas_esperadas: np.ndarray, num_muestras: int) -> np.ndarray:
+
+        salidas = np.asarray(salidas_esperadas, dtype=float)
+        
+        if salidas.ndim == 1:
+            salidas = np.broadcast_to(salidas, (self.num_miembros, num_muestras))
+        
+        if salidas.shape != (self.num_miembros, num_muestras):
+            raise ValueError(f"Las salidas esperadas deben tener forma "
+                           f"({self.num_miembros}, {num_muestras}) o ({num_muestras},), "
+                           f"se recibió {salidas.shape}")
+        
+        return salidas
+    
+    def predecir(self, entradas: np.ndarray) -> np.ndarray:
+
+        entradas = np.atleast_2d(entradas)
+        entradas_con_sesgo = self._agregar_sesgo(entradas)
+        
+        return self.funcion_activacion(np.dot(self.pesos, entradas_con_sesgo.T))
+    
+    def _ejecutar_epoca_online(self, entradas_con_sesgo: np.ndarray, salidas: np.ndarray,
+                              tasas: np.ndarray, activos: np.ndarray) -> np.ndarray:
+
+        error_total = np.zeros(self.num_miembros)
+        
+        for i, entrada in enumerate(entradas_con_sesgo):
+            predicciones = self.funcion_activacion(np.dot(self.pesos, entrada))
+            errores = np.where(activos, salidas[:, i] - predicciones, 0.0)
+            
+            self.pesos += np.outer(tasas * errores, entrada)
+            error_total += np.abs(errores)
+        
+        return error_total / len(entradas_con_sesgo)
+    
+    def _ejecutar_epoca_lote(self, entradas_con_sesgo: np.ndarray, salidas: np.ndarray,
+                            tasas: np.ndarray, activos: np.ndarray) -> np.ndarray:
+
+        predicciones = self.funcion_activacion(np.dot(self.pesos, entradas_con_sesgo.T))
+        errores = salidas - predicciones
+        errores[~activos] = 0.0
+        
+        self.pesos += (tasas[:, np.newaxis] * np.dot(errores, entradas_con_sesgo)
+                       / len(entradas_con_sesgo))
+        
+        return np.mean(np.abs(errores), axis=1)
+    
+    def entrenar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                tasas_aprendizaje: Union[float, Sequence[float]] = TASA_APRENDIZAJE_DEFECTO,
+                max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                mostrar_progreso: bool = True,
+                modo_entrenamiento: str = 'online') -> Tuple[np.ndarray, np.ndarray]:
+
+        if modo_entrenamiento not in MODOS_ENTRENAMIENTO_PERCEPTRON:
+            raise ValueError(f"Modo de entrenamiento '{modo_entrenamiento}' no válido. "
+                           f"Opciones: {list(MODOS_ENTRENAMIENTO_PERCEPTRON)}")
+        
+        entradas_con_sesgo = self._agregar_sesgo(np.asarray(entradas, dtype=float))
+        salidas = self._preparar_salidas(salidas_esperadas, len(entradas_con_sesgo))
+        tasas = np.broadcast_to(np.asarray(tasas_aprendizaje, dtype=float), (self.num_miembros,))
+        
+        ejecutar_epoca = (self._ejecutar_epoca_lote if modo_entrenamiento == 'lote'
+                          else self._ejecutar_epoca_online)
+        
+        activos = np.ones(self.num_miembros, dtype=bool)
+        self.convergencia_alcanzada = np.zeros(self.num_miembros, dtype=bool)
+        self.epocas_convergencia = np.full(self.num_miembros, max_epocas, dtype=int)
+        
+        for epoca in range(max_epocas):
+            errores_promedio = ejecutar_epoca(entradas_con_sesgo, salidas, tasas, activos)
+            
+            convergidos = activos & (errores_promedio <= error_objetivo)
+            self.convergencia_alcanzada[convergidos] = True
+            self.epocas_convergencia[convergidos] = epoca + 1
+            activos &= ~convergidos
+            
+            if mostrar_progreso and epoca % INTERVALO_IMPRESION_DEFECTO == 0:
+                print(f"Época {epoca}: Miembros convergidos = "
+                      f"{self.num_miembros - np.count_nonzero(activos)}/{self.num_miembros}")
+            
+            if not activos.any():
+                break
+        
+        if mostrar_progreso:
+            print(f"Convergencia: {np.count_nonzero(self.convergencia_alcanzada)}/"
+                  f"{self.num_miembros} miembros")
+        
+        return self.convergencia_alcanzada.copy(), self.epocas_convergencia.copy()
+    
+    def obtener_perceptron(self, indice: int) -> PerceptronSimple:
+
+        perceptron = PerceptronSimple(self.num_entradas, self.nombre_funcion)
+        perceptron.pesos = self.pesos[indice].copy()
+        perceptron.convergencia_alcanzada = bool(self.convergencia_alcanzada[indice])
+        perceptron.epoca_convergencia = int(self.epocas_convergencia[indice])
+        return perceptron
+    
+    def obtener_estadisticas_convergencia(self, indices: Optional[np.ndarray] = None) -> dict:
+
+        if indices is None:
+            indices = np.arange(self.num_miembros)
+        
+        convergencia = self.convergencia_alcanzada[indices]
+        epocas = self.epocas_convergencia[indices][convergencia]
+        
+        estadisticas = {
+            'num_miembros': len(convergencia),
+            'num_convergidos': int(np.count_nonzero(convergencia)),
+            'tasa_convergencia': float(np.mean(convergencia)) if len(convergencia) > 0 else 0.0
+        }
+        
+        if len(epocas) > 0:
+            estadisticas.update({
+                'epoca_media': float(np.mean(epocas)),
+                'epoca_mediana': float(np.median(epocas)),
+                'epoca_minima': int(np.min(epocas)),
+                'epoca_maxima': int(np.max(epocas)),
+                'desviacion_epocas': float(np.std(epocas))
+            })
+        
+        return estadisticas
@@ -1,4 +1,11 @@
 from .perceptron_multicapa import PerceptronMulticapa, CapaRed
+from .ensemble_multicapa import EnsembleMulticapa
+from .optimizadores import (
+    Optimizador, OptimizadorSGD, OptimizadorMomentum, OptimizadorNesterov,
+    OptimizadorRMSprop, OptimizadorAdam, OptimizadorRprop, crear_optimizador
+)
+from .entrenador_levenberg_marquardt import EntrenadorLevenbergMarquardt
+from .perfilador_red import PerfiladorRed
 from .cargador_datos_digitos import CargadorDatosDigitos
 from .entrenador_tp2 import EntrenadorTP2
 from .main_tp2 import EjecutorTP2
@@ -6,6 +13,17 @@ from .main_tp2 import EjecutorTP2
 __all__ = [
     'PerceptronMulticapa',
     'CapaRed',
+    'EnsembleMulticapa',
+    'Optimizador',
+    'OptimizadorSGD',
+    'OptimizadorMomentum',
+    'OptimizadorNesterov',
+    'OptimizadorRMSprop',
+    'OptimizadorAdam',
+    'OptimizadorRprop',
+    'crear_optimizador',
+    'EntrenadorLevenbergMarquardt',
+    'PerfiladorRed',
     'CargadorDatosDigitos',
     'EntrenadorTP2',
     'EjecutorTP2'
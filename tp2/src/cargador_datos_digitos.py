@@ -7,61 +7,35 @@ import numpy as np
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from comun.src.utilidades_matematicas import UtilidadesMatematicas
+from comun.src.cache_datos import CacheDatos
 from comun.constantes.constantes_redes_neuronales import (
-    TAMAÑO_ENTRADA_DIGITOS, ARCHIVO_DATOS_DIGITOS
+    TAMAÑO_ENTRADA_DIGITOS, ARCHIVO_DATOS_DIGITOS, TIPO_DATOS_DEFECTO
 )
 
 class CargadorDatosDigitos:
 
-    def __init__(self):
+    def __init__(self, tipo_datos: str = TIPO_DATOS_DEFECTO):
 
+        self.tipo_datos = np.dtype(tipo_datos)
         self.datos_cargados = False
         self.patrones_digitos = {}
         self.etiquetas_digitos = []
         self.datos_entrada = None
         self.datos_salida = None
     
-    def cargar_datos_desde_archivo(self, ruta_archivo: str) -> Tuple[np.ndarray, np.ndarray]:
+    def cargar_datos_desde_archivo(self, ruta_archivo: str,
+                                   usar_cache: bool = True) -> Tuple[np.ndarray, np.ndarray]:
 
         try:
-            with open(ruta_archivo, 'r') as archivo:
-                lineas = archivo.readlines()
+            if usar_cache:
+                arreglos = CacheDatos.cargar_o_generar(
+                    ruta_archivo, lambda: self._leer_patrones_desde_archivo(ruta_archivo)
+                )
+            else:
+                arreglos = self._leer_patrones_desde_archivo(ruta_archivo)
             
-            lineas = [linea.strip() for linea in lineas if linea.strip()]
-            
-            patrones = []
-            etiquetas = []
-            
-            lineas_por_digito = 7
-            total_digitos = 10
-            
-            if len(lineas) != lineas_por_digito * total_digitos:
-                return self._cargar_formato_con_etiquetas(lineas)
-            
-            for digito in range(total_digitos):
-                inicio = digito * lineas_por_digito
-                fin = inicio + lineas_por_digito
-                
-                patron_actual = []
-                for i in range(inicio, fin):
-                    if i < len(lineas):
-                        linea = lineas[i]
-                        fila = [int(c) for c in linea if c in '01']
-                        patron_actual.extend(fila)
-                
-                if len(patron_actual) == TAMAÑO_ENTRADA_DIGITOS:
-                    patrones.append(np.array(patron_actual))
-                    etiquetas.append(digito)
-            
-            datos_entrada = np.array(patrones)
-            datos_salida = np.array(etiquetas)
-            
-            if len(patrones) == 0:
-                raise ValueError("No se pudieron extraer patrones válidos del archivo")
-            
-            if datos_entrada.shape[1] != TAMAÑO_ENTRADA_DIGITOS:
-                raise ValueError(f"Los patrones deben tener {TAMAÑO_ENTRADA_DIGITOS} elementos "
-                               f"(5x7 píxeles), pero tienen {datos_entrada.shape[1]}")
+            datos_entrada = np.asarray(arreglos['entradas'], dtype=self.tipo_datos)
+            datos_salida = arreglos['etiquetas']
             
             self.datos_entrada = datos_entrada
             self.datos_salida = datos_salida
@@ -69,12 +43,56 @@ class CargadorDatosDigitos:
             self.datos_cargados = True
             
             return datos_entrada, datos_salida
-            
+        
         except FileNotFoundError:
             raise FileNotFoundError(f"No se pudo encontrar el archivo: {ruta_archivo}")
         except Exception as e:
             raise ValueError(f"Error al procesar el archivo de dígitos: {str(e)}")
     
+    def _leer_patrones_desde_archivo(self, ruta_archivo: str) -> Dict[str, np.ndarray]:
+
+        with open(ruta_archivo, 'r') as archivo:
+            lineas = archivo.readlines()
+        
+        lineas = [linea.strip() for linea in lineas if linea.strip()]
+        
+        patrones = []
+        etiquetas = []
+        
+        lineas_por_digito = 7
+        total_digitos = 10
+        
+        if len(lineas) != lineas_por_digito * total_digitos:
+            datos_entrada, datos_salida = self._cargar_formato_con_etiquetas(lineas)
+            return {'entradas': datos_entrada, 'etiquetas': datos_salida}
+        
+        for digito in range(total_digitos):
+            inicio = digito * lineas_por_digito
+            fin = inicio + lineas_por_digito
+            
+            patron_actual = []
+            for i in range(inicio, fin):
+                if i < len(lineas):
+                    linea = lineas[i]
+                    fila = [int(c) for c in linea if c in '01']
+                    patron_actual.extend(fila)
+            
+            if len(patron_actual) == TAMAÑO_ENTRADA_DIGITOS:
+                patrones.append(np.array(patron_actual))
+                etiquetas.append(digito)
+        
+        datos_entrada = np.array(patrones)
+        datos_salida = np.array(etiquetas)
+        
+        if len(patrones) == 0:
+            raise ValueError("No se pudieron extraer patrones válidos del archivo")
+        
+        if datos_entrada.shape[1] != TAMAÑO_ENTRADA_DIGITOS:
+            raise ValueError(f"Los patrones deben tener {TAMAÑO_ENTRADA_DIGITOS} elementos "
+                           f"(5x7 píxeles), pero tienen {datos_entrada.shape[1]}")
+        
+        return {'entradas': datos_entrada, 'etiquetas': datos_salida}
+    
     def _cargar_formato_con_etiquetas(self, lineas: List[str]) -> Tuple[np.ndarray, np.ndarray]:
 
         patrones = []
@@ -113,14 +131,15 @@ class CargadorDatosDigitos:
         for digito in self.patrones_digitos:
             self.patrones_digitos[digito] = np.array(self.patrones_digitos[digito])
     
-    def cargar_datos_tp2(self, directorio_datos: str = None) -> Tuple[np.ndarray, np.ndarray]:
+    def cargar_datos_tp2(self, directorio_datos: str = None,
+                         usar_cache: bool = True) -> Tuple[np.ndarray, np.ndarray]:
 
         if directorio_datos is None:
             directorio_actual = os.path.dirname(__file__)
             directorio_datos = os.path.join(directorio_actual, '..', 'datos')
         
         ruta_archivo = os.path.join(directorio_datos, ARCHIVO_DATOS_DIGITOS)
-        return self.cargar_datos_desde_archivo(ruta_archivo)
+        return self.cargar_datos_desde_archivo(ruta_archivo, usar_cache)
     
     def dividir_datos_por_digitos(self, digitos_entrenamiento: List[int],
                                 digitos_prueba: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
@@ -10,15 +10,71 @@ Fecha: 2025-09-23
 """
 
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional, Sequence
 import sys
 import os
+import csv
+import json
+import time
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from itertools import combinations
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from .entrenador_tp2 import EntrenadorTP2
-from comun.constantes.constantes_redes_neuronales import ARQUITECTURAS_TP2
+from comun.constantes.constantes_redes_neuronales import (
+    ARQUITECTURAS_TP2, TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO,
+    DIRECTORIO_CACHE_COMPARACION, ARCHIVO_ENUMERACION_DIVISIONES, DIVISIONES_POR_GRUPO_DEFECTO
+)
+
+# Entrenador propio de cada proceso trabajador (los dígitos se cargan una sola vez)
+_entrenador_trabajador: Optional[EntrenadorTP2] = None
+
+
+def _inicializar_trabajador() -> None:
+    """Crea el entrenador del proceso y carga los datos de dígitos una única vez."""
+    global _entrenador_trabajador
+    _entrenador_trabajador = EntrenadorTP2()
+    _entrenador_trabajador.cargador_datos.cargar_datos_tp2()
+
+
+def _ejecutar_trabajo(trabajo: Dict, entrenador: Optional[EntrenadorTP2] = None) -> Tuple[str, Dict]:
+    """
+    Entrena una red para un trabajo (conjunto, arquitectura, semilla) y memoiza
+    el resultado en disco apenas termina.
+    
+    Args:
+        trabajo: Parámetros del trabajo, su clave y la ruta de su archivo de caché
+        entrenador: Entrenador a utilizar; por defecto el del proceso trabajador
+        
+    Returns:
+        Tupla (clave, resultado resumido)
+    """
+    if entrenador is None:
+        if _entrenador_trabajador is None:
+            _inicializar_trabajador()
+        entrenador = _entrenador_trabajador
+    
+    resultado = entrenador.entrenar_discriminacion_numeros_pares(
+        arquitectura=trabajo['parametros']['arquitectura'],
+        digitos_entrenamiento=trabajo['parametros']['digitos_entrenamiento'],
+        digitos_prueba=trabajo['parametros']['digitos_prueba'],
+        tasa_aprendizaje=trabajo['parametros']['tasa_aprendizaje'],
+        max_epocas=trabajo['parametros']['max_epocas'],
+        semilla=trabajo['parametros']['semilla'],
+        mostrar_progreso=False
+    )
+    
+    resumen = ComparadorConjuntosEntrenamiento._resumir_resultado(resultado)
+    
+    # Los errores no se memoizan para que se reintenten en la próxima ejecución
+    if 'error' not in resumen:
+        ComparadorConjuntosEntrenamiento._guardar_resultado_memoizado(
+            trabajo['ruta'], trabajo['parametros'], resumen
+        )
+    
+    return trabajo['clave'], resumen
 
 
 class ComparadorConjuntosEntrenamiento:
@@ -26,7 +82,18 @@ class ComparadorConjuntosEntrenamiento:
     Clase para comparar sistemáticamente diferentes combinaciones de conjuntos 
     de entrenamiento en el problema de discriminación de números pares.
     """
-
+    
+    # Columnas del archivo de la enumeración exhaustiva
+    COLUMNAS_ENUMERACION = [
+        'arquitectura', 'mascara_division', 'entrenamiento', 'prueba',
+        'pares_entrenamiento', 'impares_entrenamiento', 'min_pares', 'min_impares',
+        'tasa_aprendizaje', 'max_epocas',
+        'num_semillas', 'semilla_base', 'convergencia', 'epoca_convergencia',
+        'precision_entrenamiento', 'precision_prueba', 'desviacion_precision_prueba',
+        'segundos_por_division'
+    ]
+    COLUMNAS_TEXTO_ENUMERACION = ('arquitectura', 'entrenamiento', 'prueba')
+    
     def __init__(self):
         """Inicializa el comparador con las configuraciones base."""
         self.entrenador = EntrenadorTP2()
@@ -228,6 +295,602 @@ class ComparadorConjuntosEntrenamiento:
         
         return resultados_completos
     
+    def ejecutar_comparacion_ensemble(self,
+                                      arquitecturas: List[str] = None,
+                                      num_semillas: int = 10,
+                                      semilla_base: int = 0,
+                                      mostrar_progreso: bool = True) -> Dict:
+        """
+        Ejecuta la comparación completa entrenando, por arquitectura, todas las
+        configuraciones y semillas en un único EnsembleMulticapa.
+        
+        Args:
+            arquitecturas: Lista de nombres de arquitecturas a probar
+            num_semillas: Cantidad de inicializaciones por configuración
+            semilla_base: Semilla del primer miembro del ensemble
+            mostrar_progreso: Si mostrar el progreso durante la ejecución
+            
+        Returns:
+            Dict con la misma estructura que ejecutar_comparacion_completa, con
+            precisiones promediadas sobre las semillas
+        """
+        if arquitecturas is None:
+            arquitecturas = ['MINIMA', 'COMPACTA', 'DIRECTA_ORIGINAL']
+        
+        if mostrar_progreso:
+            print("🚀 INICIANDO COMPARACIÓN MULTI-SEMILLA DE CONJUNTOS DE ENTRENAMIENTO")
+            print(f"   Semillas por configuración: {num_semillas}")
+            print("=" * 70)
+        
+        # Lista plana de (categoría, configuración) en el orden del ensemble
+        claves = []
+        configuraciones = []
+        for categoria, config_categoria in self.configuraciones_experimento.items():
+            for config_conjunto in config_categoria['conjuntos']:
+                claves.append((categoria, config_conjunto['nombre']))
+                configuraciones.append((config_conjunto['entrenamiento'], config_conjunto['prueba']))
+        
+        resultados_completos = {categoria: {} for categoria in self.configuraciones_experimento}
+        
+        for nombre_arq in arquitecturas:
+            if nombre_arq not in ARQUITECTURAS_TP2:
+                continue
+            
+            arquitectura = ARQUITECTURAS_TP2[nombre_arq]
+            
+            if mostrar_progreso:
+                print(f"\n🏗️ Arquitectura {nombre_arq}: {arquitectura} "
+                      f"({len(configuraciones) * num_semillas} redes)")
+            
+            resultados_arq = self.entrenador.entrenar_discriminacion_pares_ensemble(
+                configuraciones=configuraciones,
+                arquitectura=arquitectura,
+                num_semillas=num_semillas,
+                semilla_base=semilla_base,
+                mostrar_progreso=False
+            )
+            
+            for (categoria, nombre_config), resultado in zip(claves, resultados_arq):
+                if 'error' not in resultado:
+                    resultado.update(self._calcular_metricas_adicionales(
+                        resultado, resultado['digitos_entrenamiento'], resultado['digitos_prueba']
+                    ))
+                
+                resultados_categoria = resultados_completos[categoria]
+                resultados_categoria.setdefault(nombre_config, {})[nombre_arq] = resultado
+                
+                if mostrar_progreso:
+                    print(f"   🔸 {categoria}/{nombre_config}")
+                    self._mostrar_resumen_resultado(resultado, nombre_arq)
+        
+        self.resultados_comparacion = resultados_completos
+        
+        if mostrar_progreso:
+            print("\n" + "=" * 70)
+            print("✅ COMPARACIÓN MULTI-SEMILLA FINALIZADA")
+            self._generar_resumen_comparacion()
+        
+        return resultados_completos
+    
+    @staticmethod
+    def calcular_clave_trabajo(parametros: Dict) -> str:
+        """
+        Calcula la clave de memoización de un trabajo.
+        
+        Args:
+            parametros: Arquitectura, dígitos, tasa de aprendizaje, épocas y semilla
+            
+        Returns:
+            Hash hexadecimal estable de los parámetros
+        """
+        identificador = json.dumps(parametros, sort_keys=True)
+        return hashlib.sha1(identificador.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _resumir_resultado(resultado: Dict) -> Dict:
+        """Extrae los valores escalares (serializables a JSON) de un resultado."""
+        if 'error' in resultado:
+            return {'error': True, 'mensaje': resultado.get('mensaje', 'Desconocido')}
+        
+        return {
+            'convergencia': bool(resultado['convergencia']),
+            'epoca_convergencia': int(resultado['epoca_convergencia']),
+            'precision_entrenamiento': float(resultado['precision_entrenamiento']),
+            'precision_prueba': float(resultado['precision_prueba'])
+        }
+    
+    @staticmethod
+    def _leer_resultado_memoizado(ruta: str, parametros: Dict) -> Optional[Dict]:
+        """Lee un resultado memoizado; retorna None si falta, está corrupto o no coincide."""
+        try:
+            with open(ruta, 'r', encoding='utf-8') as archivo:
+                contenido = json.load(archivo)
+        except (OSError, ValueError):
+            return None
+        
+        if contenido.get('parametros') != parametros:
+            return None
+        
+        return contenido.get('resultado')
+    
+    @staticmethod
+    def _guardar_resultado_memoizado(ruta: str, parametros: Dict, resultado: Dict) -> None:
+        """Escribe un resultado de forma atómica para que una interrupción no deje archivos a medias."""
+        ruta_temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+            json.dump({'parametros': parametros, 'resultado': resultado}, archivo)
+        os.replace(ruta_temporal, ruta)
+    
+    @staticmethod
+    def _agregar_resultados_semillas(resultados: List[Dict],
+                                     entrenamiento: List[int],
+                                     prueba: List[int],
+                                     arquitectura: List[int]) -> Dict:
+        """Combina los resultados de las distintas semillas de un mismo experimento."""
+        errores = [resultado for resultado in resultados if 'error' in resultado]
+        if errores:
+            return dict(errores[0], convergencia=False,
+                        precision_entrenamiento=0.0, precision_prueba=0.0)
+        
+        precisiones_prueba = np.array([resultado['precision_prueba'] for resultado in resultados])
+        epocas_convergencia = np.array([resultado['epoca_convergencia'] for resultado in resultados])
+        
+        resultado = {
+            'problema': 'discriminacion_pares',
+            'arquitectura': arquitectura,
+            'convergencia': all(resultado['convergencia'] for resultado in resultados),
+            'epoca_convergencia': float(np.mean(epocas_convergencia)),
+            'precision_entrenamiento': float(np.mean([resultado['precision_entrenamiento']
+                                                      for resultado in resultados])),
+            'precision_prueba': float(np.mean(precisiones_prueba)),
+            'digitos_entrenamiento': entrenamiento,
+            'digitos_prueba': prueba,
+            'num_semillas': len(resultados)
+        }
+        
+        if len(resultados) > 1:
+            resultado['desviacion_precision_prueba'] = float(np.std(precisiones_prueba))
+            resultado['precisiones_prueba'] = precisiones_prueba
+            resultado['epocas_convergencia'] = epocas_convergencia
+        
+        return resultado
+    
+    def ejecutar_comparacion_paralela(self,
+                                      arquitecturas: List[str] = None,
+                                      semillas: Sequence[int] = (0,),
+                                      tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                                      max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                                      directorio_cache: str = None,
+                                      max_workers: Optional[int] = None,
+                                      mostrar_progreso: bool = True) -> Dict:
+        """
+        Ejecuta la comparación completa repartiendo los trabajos (conjunto,
+        arquitectura, semilla) en un pool de procesos. Cada resultado se memoiza
+        en disco, por lo que una ejecución interrumpida o ampliada con nuevas
+        arquitecturas o semillas reanuda desde los trabajos pendientes.
+        
+        Args:
+            arquitecturas: Lista de nombres de arquitecturas a probar
+            semillas: Semillas de inicialización por configuración y arquitectura
+            tasa_aprendizaje: Tasa de aprendizaje de cada entrenamiento
+            max_epocas: Número máximo de épocas de cada entrenamiento
+            directorio_cache: Directorio de los resultados memoizados
+            max_workers: Número de procesos (1 ejecuta en el proceso actual)
+            mostrar_progreso: Si mostrar el progreso durante la ejecución
+            
+        Returns:
+            Dict con la misma estructura que ejecutar_comparacion_completa, con
+            precisiones promediadas sobre las semillas
+        """
+        if arquitecturas is None:
+            arquitecturas = ['MINIMA', 'COMPACTA', 'DIRECTA_ORIGINAL']
+        
+        if directorio_cache is None:
+            directorio_cache = os.path.join(os.path.dirname(__file__), '..', 'resultados',
+                                            DIRECTORIO_CACHE_COMPARACION)
+        os.makedirs(directorio_cache, exist_ok=True)
+        
+        arquitecturas = [nombre_arq for nombre_arq in arquitecturas if nombre_arq in ARQUITECTURAS_TP2]
+        
+        # Lista plana de trabajos y resultados ya memoizados
+        trabajos = []
+        resultados_trabajos = {}
+        for categoria, config_categoria in self.configuraciones_experimento.items():
+            for config_conjunto in config_categoria['conjuntos']:
+                for nombre_arq in arquitecturas:
+                    for semilla in semillas:
+                        parametros = {
+                            'arquitectura': list(ARQUITECTURAS_TP2[nombre_arq]),
+                            'digitos_entrenamiento': list(config_conjunto['entrenamiento']),
+                            'digitos_prueba': list(config_conjunto['prueba']),
+                            'tasa_aprendizaje': float(tasa_aprendizaje),
+                            'max_epocas': int(max_epocas),
+                            'semilla': int(semilla)
+                        }
+                        clave = self.calcular_clave_trabajo(parametros)
+                        ruta = os.path.join(directorio_cache, f"{clave}.json")
+                        
+                        memoizado = self._leer_resultado_memoizado(ruta, parametros)
+                        if memoizado is not None:
+                            resultados_trabajos[clave] = memoizado
+                        
+                        trabajos.append({'clave': clave, 'ruta': ruta, 'parametros': parametros,
+                                         'categoria': categoria, 'nombre_config': config_conjunto['nombre'],
+                                         'nombre_arq': nombre_arq})
+        
+        # Primero las arquitecturas más costosas para equilibrar la carga entre procesos
+        pendientes = {trabajo['clave']: trabajo for trabajo in trabajos
+                      if trabajo['clave'] not in resultados_trabajos}
+        pendientes = sorted(pendientes.values(), key=lambda trabajo: -sum(
+            a * b for a, b in zip(trabajo['parametros']['arquitectura'][:-1],
+                                  trabajo['parametros']['arquitectura'][1:])
+        ))
+        
+        if mostrar_progreso:
+            print("🚀 INICIANDO COMPARACIÓN PARALELA DE CONJUNTOS DE ENTRENAMIENTO")
+            print(f"   Trabajos: {len(trabajos)} | Memoizados: {len(trabajos) - len(pendientes)} "
+                  f"| Pendientes: {len(pendientes)}")
+            print(f"   Caché: {os.path.abspath(directorio_cache)}")
+            print("=" * 70)
+        
+        tiempo_inicio = time.time()
+        
+        def registrar_resultado(clave: str, resumen: Dict) -> None:
+            resultados_trabajos[clave] = resumen
+            if mostrar_progreso:
+                completados = len(resultados_trabajos)
+                print(f"   Trabajos completados: {completados}/{len(trabajos)} "
+                      f"({time.time() - tiempo_inicio:.1f}s)")
+        
+        if max_workers == 1:
+            if pendientes and not self.entrenador.cargador_datos.datos_cargados:
+                self.entrenador.cargador_datos.cargar_datos_tp2()
+            for trabajo in pendientes:
+                registrar_resultado(*_ejecutar_trabajo(trabajo, self.entrenador))
+        elif pendientes:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_inicializar_trabajador) as executor:
+                futures = {executor.submit(_ejecutar_trabajo, trabajo): trabajo for trabajo in pendientes}
+                
+                for future in as_completed(futures):
+                    try:
+                        registrar_resultado(*future.result())
+                    except Exception as e:
+                        trabajo = futures[future]
+                        print(f"Error en {trabajo['categoria']}/{trabajo['nombre_config']}/"
+                              f"{trabajo['nombre_arq']} (semilla {trabajo['parametros']['semilla']}): {e}")
+        
+        # Reconstruir la estructura por categoría, configuración y arquitectura
+        resultados_completos = {categoria: {} for categoria in self.configuraciones_experimento}
+        agrupados = {}
+        for trabajo in trabajos:
+            if trabajo['clave'] in resultados_trabajos:
+                identificador = (trabajo['categoria'], trabajo['nombre_config'], trabajo['nombre_arq'])
+                agrupados.setdefault(identificador, []).append(resultados_trabajos[trabajo['clave']])
+        
+        for categoria, config_categoria in self.configuraciones_experimento.items():
+            if mostrar_progreso:
+                print(f"\n📂 CATEGORÍA: {categoria.upper()}")
+            
+            for config_conjunto in config_categoria['conjuntos']:
+                nombre_config = config_conjunto['nombre']
+                resultados_config = {}
+                
+                if mostrar_progreso:
+                    print(f"   🔸 {nombre_config}")
+                
+                for nombre_arq in arquitecturas:
+                    resultados_semillas = agrupados.get((categoria, nombre_config, nombre_arq))
+                    if not resultados_semillas:
+                        continue
+                    
+                    resultado = self._agregar_resultados_semillas(
+                        resultados_semillas, config_conjunto['entrenamiento'],
+                        config_conjunto['prueba'], ARQUITECTURAS_TP2[nombre_arq]
+                    )
+                    if 'error' not in resultado:
+                        resultado.update(self._calcular_metricas_adicionales(
+                            resultado, config_conjunto['entrenamiento'], config_conjunto['prueba']
+                        ))
+                    resultados_config[nombre_arq] = resultado
+                    
+                    if mostrar_progreso:
+                        self._mostrar_resumen_resultado(resultado, nombre_arq)
+                
+                resultados_completos[categoria][nombre_config] = resultados_config
+        
+        self.resultados_comparacion = resultados_completos
+        
+        if mostrar_progreso:
+            print("\n" + "=" * 70)
+            print("✅ COMPARACIÓN PARALELA FINALIZADA")
+            self._generar_resumen_comparacion()
+        
+        return resultados_completos
+    
+    @staticmethod
+    def enumerar_divisiones(tamaño_entrenamiento: int,
+                            min_pares: int = 1,
+                            min_impares: int = 1,
+                            digitos: Sequence[int] = tuple(range(10))) -> Iterator[Tuple[List[int], List[int]]]:
+        """
+        Enumera todas las particiones entrenamiento/prueba de los dígitos que
+        cumplen las restricciones, en orden lexicográfico.
+        
+        Args:
+            tamaño_entrenamiento: Cantidad de dígitos del conjunto de entrenamiento
+            min_pares: Mínimo de dígitos pares en entrenamiento
+            min_impares: Mínimo de dígitos impares en entrenamiento
+            digitos: Dígitos a repartir
+            
+        Returns:
+            Iterador de tuplas (entrenamiento, prueba)
+        """
+        if not 0 < tamaño_entrenamiento < len(digitos):
+            raise ValueError(f"El tamaño de entrenamiento debe estar entre 1 y {len(digitos) - 1}")
+        
+        for entrenamiento in combinations(digitos, tamaño_entrenamiento):
+            pares = sum(1 for d in entrenamiento if d % 2 == 0)
+            if pares < min_pares or len(entrenamiento) - pares < min_impares:
+                continue
+            
+            prueba = [d for d in digitos if d not in entrenamiento]
+            yield list(entrenamiento), prueba
+    
+    @staticmethod
+    def _formatear_digitos(digitos: Sequence[int]) -> str:
+        """Representa una lista de dígitos como texto compacto para el archivo de resultados."""
+        return ''.join(str(d) for d in digitos)
+    
+    @staticmethod
+    def calcular_mascara_division(entrenamiento: Sequence[int]) -> int:
+        """
+        Identifica una división por la máscara de bits de sus dígitos de entrenamiento.
+        
+        A diferencia del índice en la enumeración, la máscara no depende de las
+        restricciones usadas, por lo que la misma división recibe siempre las
+        mismas semillas.
+        
+        Args:
+            entrenamiento: Dígitos del conjunto de entrenamiento
+            
+        Returns:
+            Entero con el bit d encendido por cada dígito d de entrenamiento
+        """
+        return sum(1 << d for d in set(entrenamiento))
+    
+    @staticmethod
+    def _crear_clave_enumeracion(arquitectura: str, entrenamiento: str, min_pares, min_impares,
+                                 tasa_aprendizaje, max_epocas, num_semillas, semilla_base) -> Tuple[str, ...]:
+        """Crea la clave (como texto, igual que en el CSV) de una fila de la enumeración."""
+        return tuple(str(valor) for valor in (arquitectura, entrenamiento, min_pares, min_impares,
+                                              tasa_aprendizaje, max_epocas, num_semillas, semilla_base))
+    
+    @classmethod
+    def _leer_claves_enumeracion(cls, archivo: str) -> Tuple[set, set]:
+        """
+        Obtiene las claves de los experimentos ya escritos en un archivo de
+        enumeración y las restricciones (tamaño, mínimo de pares, mínimo de
+        impares) con que fueron generados.
+        """
+        claves = set()
+        restricciones = set()
+        
+        try:
+            with open(archivo, 'r', encoding='utf-8', newline='') as f:
+                for fila in csv.DictReader(f):
+                    claves.add(cls._crear_clave_enumeracion(
+                        *(fila[columna] for columna in
+                          ('arquitectura', 'entrenamiento', 'min_pares', 'min_impares',
+                           'tasa_aprendizaje', 'max_epocas', 'num_semillas', 'semilla_base'))
+                    ))
+                    restricciones.add((len(fila['entrenamiento']), int(fila['min_pares']),
+                                       int(fila['min_impares'])))
+        except OSError:
+            return set(), set()
+        except KeyError:
+            raise ValueError(f"El archivo '{archivo}' no tiene el formato de una enumeración exhaustiva")
+        
+        return claves, restricciones
+    
+    def ejecutar_enumeracion_exhaustiva(self,
+                                        tamaño_entrenamiento: int,
+                                        min_pares: int = 1,
+                                        min_impares: int = 1,
+                                        arquitecturas: List[str] = None,
+                                        num_semillas: int = 1,
+                                        semilla_base: int = 0,
+                                        tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                                        max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                                        tamaño_grupo: int = DIVISIONES_POR_GRUPO_DEFECTO,
+                                        archivo_salida: str = None,
+                                        reanudar: bool = True,
+                                        mostrar_progreso: bool = True) -> Dict:
+        """
+        Evalúa todas las divisiones de dígitos que cumplen las restricciones.
+        
+        Las divisiones de una misma arquitectura se agrupan y se entrenan juntas
+        como miembros de un EnsembleMulticapa, y cada grupo se agrega al archivo
+        CSV de salida (una columna por métrica) apenas termina. Con reanudar, las
+        divisiones ya presentes en el archivo no se vuelven a entrenar; un archivo
+        generado con otras restricciones no se reutiliza.
+        
+        Args:
+            tamaño_entrenamiento: Cantidad de dígitos del conjunto de entrenamiento
+            min_pares: Mínimo de dígitos pares en entrenamiento
+            min_impares: Mínimo de dígitos impares en entrenamiento
+            arquitecturas: Lista de nombres de arquitecturas a probar
+            num_semillas: Cantidad de inicializaciones por división
+            semilla_base: Desplazamiento de las semillas, derivadas de la máscara de cada división
+            tasa_aprendizaje: Tasa de aprendizaje de cada entrenamiento
+            max_epocas: Número máximo de épocas de cada entrenamiento
+            tamaño_grupo: Cantidad de divisiones entrenadas en un mismo ensemble
+            archivo_salida: Ruta del archivo CSV de resultados
+            reanudar: Si conservar el archivo existente y omitir lo ya evaluado
+            mostrar_progreso: Si mostrar el progreso durante la ejecución
+            
+        Returns:
+            Dict con el resumen de la ejecución y el costo medio por división
+        """
+        if arquitecturas is None:
+            arquitecturas = ['MINIMA', 'COMPACTA', 'DIRECTA_ORIGINAL']
+        
+        if tamaño_grupo < 1:
+            raise ValueError("El tamaño de grupo debe ser un entero positivo")
+        
+        if archivo_salida is None:
+            archivo_salida = os.path.join(os.path.dirname(__file__), '..', 'resultados',
+                                          ARCHIVO_ENUMERACION_DIVISIONES)
+        
+        directorio = os.path.dirname(archivo_salida)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        
+        divisiones = list(self.enumerar_divisiones(tamaño_entrenamiento, min_pares, min_impares))
+        arquitecturas = [nombre_arq for nombre_arq in arquitecturas if nombre_arq in ARQUITECTURAS_TP2]
+        
+        claves_existentes, restricciones_existentes = (
+            self._leer_claves_enumeracion(archivo_salida) if reanudar else (set(), set())
+        )
+        
+        restricciones = (tamaño_entrenamiento, min_pares, min_impares)
+        if restricciones_existentes - {restricciones}:
+            raise ValueError(
+                f"El archivo '{archivo_salida}' fue generado con otras restricciones "
+                f"{sorted(restricciones_existentes)}. Opciones: usar otro archivo o reanudar=False"
+            )
+        
+        escribir_encabezado = not (reanudar and os.path.exists(archivo_salida))
+        
+        # Divisiones pendientes por arquitectura (índices en la lista de divisiones de esta ejecución)
+        pendientes = {}
+        for nombre_arq in arquitecturas:
+            pendientes[nombre_arq] = [
+                indice for indice, (entrenamiento, _) in enumerate(divisiones)
+                if self._crear_clave_enumeracion(
+                    nombre_arq, self._formatear_digitos(entrenamiento), min_pares, min_impares,
+                    float(tasa_aprendizaje), int(max_epocas), num_semillas, semilla_base
+                ) not in claves_existentes
+            ]
+        
+        total_pendientes = sum(len(indices) for indices in pendientes.values())
+        
+        if mostrar_progreso:
+            print("🚀 INICIANDO ENUMERACIÓN EXHAUSTIVA DE DIVISIONES")
+            print(f"   Divisiones: {len(divisiones)} | Arquitecturas: {len(arquitecturas)} "
+                  f"| Pendientes: {total_pendientes}")
+            print(f"   Archivo: {os.path.abspath(archivo_salida)}")
+            print("=" * 70)
+        
+        evaluadas = 0
+        tiempo_entrenamiento = 0.0
+        
+        with open(archivo_salida, 'w' if escribir_encabezado else 'a', encoding='utf-8', newline='') as f:
+            escritor = csv.DictWriter(f, fieldnames=self.COLUMNAS_ENUMERACION)
+            if escribir_encabezado:
+                escritor.writeheader()
+            
+            for nombre_arq in arquitecturas:
+                indices_arq = pendientes[nombre_arq]
+                
+                for inicio in range(0, len(indices_arq), tamaño_grupo):
+                    indices_grupo = indices_arq[inicio:inicio + tamaño_grupo]
+                    
+                    # Semillas fijadas por la máscara de cada división: no dependen del
+                    # agrupamiento ni de las restricciones de la enumeración
+                    semillas = [semilla_base + self.calcular_mascara_division(divisiones[indice][0])
+                                * num_semillas + s
+                                for indice in indices_grupo for s in range(num_semillas)]
+                    
+                    inicio_grupo = time.perf_counter()
+                    resultados_grupo = self.entrenador.entrenar_discriminacion_pares_ensemble(
+                        configuraciones=[divisiones[indice] for indice in indices_grupo],
+                        arquitectura=ARQUITECTURAS_TP2[nombre_arq],
+                        num_semillas=num_semillas,
+                        tasa_aprendizaje=tasa_aprendizaje,
+                        max_epocas=max_epocas,
+                        mostrar_progreso=False,
+                        semillas=semillas
+                    )
+                    duracion_grupo = time.perf_counter() - inicio_grupo
+                    
+                    if any('error' in resultado for resultado in resultados_grupo):
+                        print(f"❌ {nombre_arq}: Error - {resultados_grupo[0].get('mensaje', 'Desconocido')}")
+                        break
+                    
+                    for indice, resultado in zip(indices_grupo, resultados_grupo):
+                        entrenamiento, prueba = divisiones[indice]
+                        pares = sum(1 for d in entrenamiento if d % 2 == 0)
+                        
+                        escritor.writerow({
+                            'arquitectura': nombre_arq,
+                            'mascara_division': self.calcular_mascara_division(entrenamiento),
+                            'entrenamiento': self._formatear_digitos(entrenamiento),
+                            'prueba': self._formatear_digitos(prueba),
+                            'pares_entrenamiento': pares,
+                            'impares_entrenamiento': len(entrenamiento) - pares,
+                            'min_pares': min_pares,
+                            'min_impares': min_impares,
+                            'tasa_aprendizaje': float(tasa_aprendizaje),
+                            'max_epocas': int(max_epocas),
+                            'num_semillas': num_semillas,
+                            'semilla_base': semilla_base,
+                            'convergencia': int(resultado['convergencia']),
+                            'epoca_convergencia': resultado['epoca_convergencia'],
+                            'precision_entrenamiento': resultado['precision_entrenamiento'],
+                            'precision_prueba': resultado['precision_prueba'],
+                            'desviacion_precision_prueba': resultado['desviacion_precision_prueba'],
+                            'segundos_por_division': duracion_grupo / len(indices_grupo)
+                        })
+                    
+                    # Volcar cada grupo para que una interrupción conserve lo ya evaluado
+                    f.flush()
+                    
+                    evaluadas += len(indices_grupo)
+                    tiempo_entrenamiento += duracion_grupo
+                    
+                    if mostrar_progreso:
+                        print(f"   🏗️ {nombre_arq}: {evaluadas}/{total_pendientes} divisiones "
+                              f"({duracion_grupo / len(indices_grupo) * 1e3:.1f} ms/división)")
+        
+        resumen = {
+            'archivo': archivo_salida,
+            'num_divisiones': len(divisiones),
+            'num_arquitecturas': len(arquitecturas),
+            'divisiones_evaluadas': evaluadas,
+            'divisiones_omitidas': len(divisiones) * len(arquitecturas) - total_pendientes,
+            'tiempo_entrenamiento': tiempo_entrenamiento,
+            'segundos_por_division': tiempo_entrenamiento / evaluadas if evaluadas else 0.0
+        }
+        
+        if mostrar_progreso:
+            print("\n" + "=" * 70)
+            print("✅ ENUMERACIÓN EXHAUSTIVA FINALIZADA")
+            print(f"   Evaluadas: {evaluadas} | Omitidas: {resumen['divisiones_omitidas']}")
+            print(f"   Tiempo de entrenamiento: {tiempo_entrenamiento:.2f}s "
+                  f"({resumen['segundos_por_division'] * 1e3:.1f} ms/división)")
+        
+        return resumen
+    
+    @classmethod
+    def cargar_resultados_enumeracion(cls, archivo: str) -> Dict[str, np.ndarray]:
+        """
+        Carga el archivo de una enumeración exhaustiva en forma columnar.
+        
+        Args:
+            archivo: Ruta del archivo CSV de resultados
+            
+        Returns:
+            Dict con un arreglo por columna (numérico salvo las columnas de texto)
+        """
+        with open(archivo, 'r', encoding='utf-8', newline='') as f:
+            filas = list(csv.DictReader(f))
+        
+        return {
+            columna: np.array([fila[columna] for fila in filas],
+                              dtype=str if columna in cls.COLUMNAS_TEXTO_ENUMERACION else float)
+            for columna in cls.COLUMNAS_ENUMERACION
+        }
+    
     def _calcular_metricas_adicionales(self, 
                                      resultado: Dict, 
                                      entrenamiento: List[int], 
@@ -295,7 +958,13 @@ class ComparadorConjuntosEntrenamiento:
         epoca = resultado.get('epoca_convergencia', 0)
         calidad = resultado.get('metricas_conjunto', {}).get('calidad_generalizacion', 'N/A')
         
-        print(f"       ✅ {nombre_arq}: Train={prec_train:.1f}% Test={prec_test:.1f}% "
+        desviacion = resultado.get('desviacion_precision_prueba')
+        if desviacion is not None:
+            prec_test_texto = f"{prec_test:.1f}±{desviacion * 100:.1f}%"
+        else:
+            prec_test_texto = f"{prec_test:.1f}%"
+        
+        print(f"       ✅ {nombre_arq}: Train={prec_train:.1f}% Test={prec_test_texto} "
               f"Épocas={epoca} Generalización={calidad}")
     
     def _generar_resumen_comparacion(self) -> None:
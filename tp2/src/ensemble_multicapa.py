@@ -0,0 +1,265 @@
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from .perceptron_multicapa import PerceptronMulticapa
+from comun.src.funciones_activacion import FuncionesActivacion
+from comun.src.utilidades_matematicas import UtilidadesMatematicas
+from comun.constantes.constantes_redes_neuronales import (
+    TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO, ERROR_OBJETIVO_DEFECTO,
+    INTERVALO_IMPRESION_DEFECTO, TIPOS_DATOS_DISPONIBLES, TIPO_DATOS_DEFECTO
+)
+
+class EnsembleMulticapa:
+
+    def __init__(self, arquitectura: List[int], num_miembros: int,
+                 funciones_activacion: List[str] = None,
+                 semillas: Optional[Sequence[int]] = None,
+                 tipo_datos: str = TIPO_DATOS_DEFECTO):
+        if len(arquitectura) < 2:
+            raise ValueError("La arquitectura debe tener al menos 2 capas (entrada y salida)")
+        
+        if semillas is not None and len(semillas) != num_miembros:
+            raise ValueError(f"Se esperaban {num_miembros} semillas, se recibieron {len(semillas)}")
+        
+        if np.dtype(tipo_datos).name not in TIPOS_DATOS_DISPONIBLES:
+            raise ValueError(f"Tipo de datos '{tipo_datos}' no válido. "
+                           f"Opciones: {list(TIPOS_DATOS_DISPONIBLES)}")
+        
+        self.arquitectura = arquitectura
+        self.num_capas = len(arquitectura) - 1
+        self.num_miembros = num_miembros
+        self.tipo_datos = np.dtype(tipo_datos)
+        
+        if funciones_activacion is None:
+            funciones_activacion = ['sigmoide'] * self.num_capas
+        
+        if len(funciones_activacion) != self.num_capas:
+            raise ValueError("Número de funciones de activación debe coincidir con número de capas")
+        
+        if 'softmax' in funciones_activacion:
+            raise ValueError("La salida softmax requiere la función de pérdida 'entropia_cruzada', "
+                             "no soportada por el ensemble")
+        
+        self.nombres_funciones = list(funciones_activacion)
+        self.funciones = [FuncionesActivacion.obtener_funcion_y_derivada(nombre)
+                          for nombre in funciones_activacion]
+        
+        self.pesos, self.sesgos = self._inicializar_parametros(semillas)
+        
+        self.convergencia_alcanzada = np.zeros(num_miembros, dtype=bool)
+        self.epocas_convergencia = np.zeros(num_miembros, dtype=int)
+        self.errores_finales = np.full(num_miembros, np.inf)
+    
+    def _inicializar_parametros(self, semillas: Optional[Sequence[int]]) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        pesos = [np.empty((self.num_miembros, self.arquitectura[i], self.arquitectura[i + 1]),
+                          dtype=self.tipo_datos) for i in range(self.num_capas)]
+        sesgos = [np.zeros((self.num_miembros, 1, self.arquitectura[i + 1]), dtype=self.tipo_datos)
+                  for i in range(self.num_capas)]
+        
+        estado_original = np.random.get_state()
+        try:
+            for miembro in range(self.num_miembros):
+                if semillas is not None:
+                    np.random.seed(semillas[miembro])
+                
+                for i in range(self.num_capas):
+                    pesos[i][miembro] = UtilidadesMatematicas.inicializar_pesos_xavier(
+                        self.arquitectura[i], self.arquitectura[i + 1], self.tipo_datos
+                    )
+        finally:
+            if semillas is not None:
+                np.random.set_state(estado_original)
+        
+        return pesos, sesgos
+    
+    @staticmethod
+    def apilar_conjuntos(entradas_por_miembro: List[np.ndarray],
+                         salidas_por_miembro: List[np.ndarray],
+                         tipo_datos: str = TIPO_DATOS_DEFECTO) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if len(entradas_por_miembro) != len(salidas_por_miembro):
+            raise ValueError("Debe haber la misma cantidad de conjuntos de entrada y de salida")
+        
+        salidas_por_miembro = [np.asarray(salidas).reshape(len(salidas), -1)
+                               for salidas in salidas_por_miembro]
+        
+        num_miembros = len(entradas_por_miembro)
+        max_muestras = max(len(entradas) for entradas in entradas_por_miembro)
+        num_entradas = np.shape(entradas_por_miembro[0])[1]
+        num_salidas = salidas_por_miembro[0].shape[1]
+        
+        entradas_apiladas = np.zeros((num_miembros, max_muestras, num_entradas), dtype=tipo_datos)
+        salidas_apiladas = np.zeros((num_miembros, max_muestras, num_salidas), dtype=tipo_datos)
+        mascara_muestras = np.zeros((num_miembros, max_muestras), dtype=bool)
+        
+        for miembro, (entradas, salidas) in enumerate(zip(entradas_por_miembro, salidas_por_miembro)):
+            num_muestras = len(entradas)
+            entradas_apiladas[miembro, :num_muestras] = entradas
+            salidas_apiladas[miembro, :num_muestras] = salidas
+            mascara_muestras[miembro, :num_muestras] = True
+        
+        return entradas_apiladas, salidas_apiladas, mascara_muestras
+    
+    def _propagacion_adelante(self, entradas: np.ndarray) -> List[np.ndarray]:
+        activaciones = [entradas]
+        
+        for i, (funcion_activacion, _) in enumerate(self.funciones):
+            salida_neta = np.matmul(activaciones[-1], self.pesos[i])
+            salida_neta += self.sesgos[i]
+            activaciones.append(funcion_activacion(salida_neta, salida=salida_neta))
+        
+        return activaciones
+    
+    def _retropropagacion(self, activaciones: List[np.ndarray], error: np.ndarray,
+                          factores_actualizacion: np.ndarray) -> None:
+        for i in reversed(range(self.num_capas)):
+            derivada_activacion = self.funciones[i][1]
+            delta = derivada_activacion(activaciones[i + 1])
+            delta *= error
+            
+            if i > 0:
+                error = np.matmul(delta, np.swapaxes(self.pesos[i], 1, 2))
+            
+            gradientes_pesos = np.matmul(np.swapaxes(activaciones[i], -1, -2), delta)
+            gradientes_sesgos = np.sum(delta, axis=1, keepdims=True)
+            
+            gradientes_pesos *= factores_actualizacion
+            gradientes_sesgos *= factores_actualizacion
+            
+            self.pesos[i] += gradientes_pesos
+            self.sesgos[i] += gradientes_sesgos
+    
+    def _preparar_datos(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                        mascara_muestras: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        entradas = np.asarray(entradas, dtype=self.tipo_datos)
+        salidas_esperadas = np.asarray(salidas_esperadas, dtype=self.tipo_datos)
+        
+        if salidas_esperadas.ndim == entradas.ndim - 1:
+            salidas_esperadas = salidas_esperadas[..., np.newaxis]
+        
+        num_muestras = entradas.shape[-2]
+        
+        if mascara_muestras is None:
+            mascara_muestras = np.ones((self.num_miembros, num_muestras), dtype=bool)
+        
+        if mascara_muestras.shape != (self.num_miembros, num_muestras):
+            raise ValueError(f"La máscara de muestras debe tener forma "
+                           f"({self.num_miembros}, {num_muestras}), se recibió {mascara_muestras.shape}")
+        
+        return entradas, salidas_esperadas, mascara_muestras.astype(self.tipo_datos)[..., np.newaxis]
+    
+    def predecir(self, entradas: np.ndarray) -> np.ndarray:
+        entradas = np.asarray(entradas, dtype=self.tipo_datos)
+        if entradas.ndim == 1:
+            entradas = entradas.reshape(1, -1)
+        
+        return self._propagacion_adelante(entradas)[-1]
+    
+    def entrenar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                mostrar_progreso: bool = True,
+                intervalo_impresion: int = INTERVALO_IMPRESION_DEFECTO,
+                mascara_muestras: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        entradas, salidas_esperadas, mascara = self._preparar_datos(
+            entradas, salidas_esperadas, mascara_muestras
+        )
+        
+        elementos_por_miembro = np.sum(mascara, axis=(1, 2)) * salidas_esperadas.shape[-1]
+        elementos_por_miembro = np.maximum(elementos_por_miembro, 1)
+        
+        activos = np.ones(self.num_miembros, dtype=bool)
+        factores_actualizacion = np.full((self.num_miembros, 1, 1), tasa_aprendizaje,
+                                         dtype=self.tipo_datos)
+        
+        self.convergencia_alcanzada = np.zeros(self.num_miembros, dtype=bool)
+        self.epocas_convergencia = np.full(self.num_miembros, max_epocas, dtype=int)
+        
+        if mostrar_progreso:
+            print(f"Iniciando entrenamiento de ensemble...")
+            print(f"Arquitectura: {self.arquitectura}")
+            print(f"Miembros: {self.num_miembros}")
+            print(f"Tasa de aprendizaje: {tasa_aprendizaje}")
+        
+        for epoca in range(max_epocas):
+            activaciones = self._propagacion_adelante(entradas)
+            
+            error = salidas_esperadas - activaciones[-1]
+            error *= mascara
+            
+            self.errores_finales = np.sum(np.square(error), axis=(1, 2)) / elementos_por_miembro
+            
+            convergidos = activos & (self.errores_finales <= error_objetivo)
+            self.convergencia_alcanzada[convergidos] = True
+            self.epocas_convergencia[convergidos] = epoca + 1
+            activos &= ~convergidos
+            factores_actualizacion[convergidos] = 0
+            
+            if not activos.any():
+                break
+            
+            self._retropropagacion(activaciones, error, factores_actualizacion)
+            
+            if mostrar_progreso and epoca % intervalo_impresion == 0:
+                print(f"Época {epoca:>6}: Error medio = {np.mean(self.errores_finales):.6f} | "
+                      f"Convergidos = {self.num_miembros - np.count_nonzero(activos)}/{self.num_miembros}")
+        
+        if mostrar_progreso:
+            print(f"Convergencia: {np.count_nonzero(self.convergencia_alcanzada)}/"
+                  f"{self.num_miembros} miembros")
+        
+        return self.convergencia_alcanzada.copy(), self.epocas_convergencia.copy()
+    
+    def obtener_miembro(self, indice: int) -> PerceptronMulticapa:
+        red = PerceptronMulticapa(self.arquitectura, self.nombres_funciones,
+                                  tipo_datos=self.tipo_datos)
+        
+        for i, capa in enumerate(red.capas):
+            capa.pesos[...] = self.pesos[i][indice]
+            capa.sesgos[...] = self.sesgos[i][indice]
+        
+        red.convergencia_alcanzada = bool(self.convergencia_alcanzada[indice])
+        red.epoca_convergencia = int(self.epocas_convergencia[indice])
+        return red
+    
+    def obtener_estadisticas_convergencia(self, indices: Optional[np.ndarray] = None) -> dict:
+        if indices is None:
+            indices = np.arange(self.num_miembros)
+        
+        convergencia = self.convergencia_alcanzada[indices]
+        epocas = self.epocas_convergencia[indices][convergencia]
+        
+        estadisticas = {
+            'num_miembros': len(convergencia),
+            'num_convergidos': int(np.count_nonzero(convergencia)),
+            'tasa_convergencia': float(np.mean(convergencia)) if len(convergencia) > 0 else 0.0,
+            'error_final_medio': float(np.mean(self.errores_finales[indices]))
+        }
+        
+        if len(epocas) > 0:
+            estadisticas.update({
+                'epoca_media': float(np.mean(epocas)),
+                'epoca_mediana': float(np.median(epocas)),
+                'epoca_minima': int(np.min(epocas)),
+                'epoca_maxima': int(np.max(epocas)),
+                'desviacion_epocas': float(np.std(epocas))
+            })
+        
+        return estadisticas
+    
+    def obtener_informacion_red(self) -> dict:
+        total_parametros = sum(pesos[0].size + sesgos[0].size
+                               for pesos, sesgos in zip(self.pesos, self.sesgos))
+        
+        return {
+            'arquitectura': self.arquitectura,
+            'num_capas': self.num_capas,
+            'num_miembros': self.num_miembros,
+            'parametros_por_miembro': total_parametros,
+            'tipo_datos': self.tipo_datos.name,
+            'num_convergidos': int(np.count_nonzero(self.convergencia_alcanzada))
+        }
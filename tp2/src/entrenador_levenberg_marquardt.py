@@ -0,0 +1,151 @@
+import numpy as np
+from typing import List, Tuple
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from .perceptron_multicapa import PerceptronMulticapa
+from comun.constantes.constantes_redes_neuronales import (
+    ERROR_OBJETIVO_DEFECTO, ITERACIONES_MAXIMAS_LM, AMORTIGUAMIENTO_INICIAL_LM,
+    FACTOR_AMORTIGUAMIENTO_LM, AMORTIGUAMIENTO_MAXIMO_LM,
+    MENSAJE_CONVERGENCIA, MENSAJE_NO_CONVERGENCIA
+)
+
+class EntrenadorLevenbergMarquardt:
+
+    def __init__(self, red: PerceptronMulticapa,
+                 amortiguamiento_inicial: float = AMORTIGUAMIENTO_INICIAL_LM,
+                 factor_amortiguamiento: float = FACTOR_AMORTIGUAMIENTO_LM,
+                 amortiguamiento_maximo: float = AMORTIGUAMIENTO_MAXIMO_LM):
+        if red.funcion_perdida != 'error_cuadratico_medio':
+            raise ValueError("Levenberg-Marquardt requiere la función de pérdida 'error_cuadratico_medio'")
+        
+        self.red = red
+        self.amortiguamiento_inicial = amortiguamiento_inicial
+        self.factor_amortiguamiento = factor_amortiguamiento
+        self.amortiguamiento_maximo = amortiguamiento_maximo
+        self.amortiguamiento = amortiguamiento_inicial
+        
+        self.rangos_capas: List[Tuple[int, int]] = []
+        inicio = 0
+        for capa in red.capas:
+            self.rangos_capas.append((inicio, inicio + capa.num_parametros))
+            inicio += capa.num_parametros
+    
+    def _calcular_residuos(self, entradas: np.ndarray, salidas_esperadas: np.ndarray) -> np.ndarray:
+        salidas_obtenidas = self.red._propagacion_adelante(entradas)
+        return (salidas_esperadas - salidas_obtenidas).astype(np.float64).ravel()
+    
+    def calcular_jacobiano(self) -> np.ndarray:
+        capas = self.red.capas
+        capa_salida = capas[-1]
+        num_muestras = len(capa_salida.ultima_salida_activada)
+        num_salidas = capa_salida.num_neuronas
+        
+        jacobiano = np.empty((num_muestras, num_salidas, self.red.parametros.size))
+        
+        derivada_salida = capa_salida.derivada_activacion(capa_salida.ultima_salida_activada)
+        delta = np.zeros((num_salidas, num_muestras, num_salidas))
+        delta[np.arange(num_salidas), :, np.arange(num_salidas)] = derivada_salida.T
+        
+        for i in reversed(range(len(capas))):
+            capa = capas[i]
+            inicio, fin = self.rangos_capas[i]
+            corte = inicio + capa.pesos.size
+            
+            derivadas_pesos = np.einsum('ni,knj->nkij', capa.ultima_entrada, delta)
+            jacobiano[:, :, inicio:corte] = derivadas_pesos.reshape(num_muestras, num_salidas, -1)
+            jacobiano[:, :, corte:fin] = np.swapaxes(delta, 0, 1)
+            
+            if i > 0:
+                capa_anterior = capas[i - 1]
+                delta = np.matmul(delta, capa.pesos.T)
+                delta *= capa_anterior.derivada_activacion(capa_anterior.ultima_salida_activada)
+        
+        return jacobiano.reshape(num_muestras * num_salidas, -1)
+    
+    def _marcar_convergencia(self, iteraciones: int, error_cuadratico: float,
+                             mostrar_progreso: bool) -> Tuple[bool, int]:
+        self.red.convergencia_alcanzada = True
+        self.red.epoca_convergencia = iteraciones
+        if mostrar_progreso:
+            print(f"{MENSAJE_CONVERGENCIA} Iteración: {iteraciones}")
+            print(f"Error final: {error_cuadratico:.6f}")
+        return True, iteraciones
+    
+    def entrenar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                max_iteraciones: int = ITERACIONES_MAXIMAS_LM,
+                error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                mostrar_progreso: bool = True) -> Tuple[bool, int]:
+        red = self.red
+        red.evaluador.limpiar_historial()
+        
+        entradas = np.asarray(entradas, dtype=red.tipo_datos)
+        salidas_esperadas = np.asarray(salidas_esperadas, dtype=red.tipo_datos)
+        
+        if entradas.ndim == 1:
+            entradas = entradas.reshape(1, -1)
+        if salidas_esperadas.ndim == 1:
+            salidas_esperadas = salidas_esperadas.reshape(-1, 1)
+        
+        self.amortiguamiento = self.amortiguamiento_inicial
+        identidad = np.eye(red.parametros.size)
+        
+        residuos = self._calcular_residuos(entradas, salidas_esperadas)
+        error_cuadratico = float(np.mean(np.square(residuos)))
+        
+        if mostrar_progreso:
+            print(f"Iniciando entrenamiento Levenberg-Marquardt...")
+            print(f"Arquitectura: {red.arquitectura}")
+            print(f"Parámetros: {red.parametros.size}")
+            print(f"Iteraciones máximas: {max_iteraciones}")
+        
+        red.evaluador.registrar_error(error_cuadratico)
+        if error_cuadratico <= error_objetivo:
+            return self._marcar_convergencia(0, error_cuadratico, mostrar_progreso)
+        
+        iteracion_final = max_iteraciones
+        for iteracion in range(max_iteraciones):
+            jacobiano = self.calcular_jacobiano()
+            hessiano_aproximado = jacobiano.T @ jacobiano
+            gradiente = jacobiano.T @ residuos
+            parametros_previos = red.obtener_parametros()
+            
+            while self.amortiguamiento <= self.amortiguamiento_maximo:
+                paso = np.linalg.solve(hessiano_aproximado + self.amortiguamiento * identidad, gradiente)
+                red.establecer_parametros(parametros_previos + paso)
+                
+                residuos_nuevos = self._calcular_residuos(entradas, salidas_esperadas)
+                error_nuevo = float(np.mean(np.square(residuos_nuevos)))
+                
+                if error_nuevo < error_cuadratico:
+                    self.amortiguamiento /= self.factor_amortiguamiento
+                    residuos = residuos_nuevos
+                    error_cuadratico = error_nuevo
+                    break
+                
+                self.amortiguamiento *= self.factor_amortiguamiento
+            else:
+                red.establecer_parametros(parametros_previos)
+                iteracion_final = iteracion + 1
+                if mostrar_progreso:
+                    print(f"Amortiguamiento máximo alcanzado en la iteración {iteracion}")
+                break
+            
+            red.evaluador.registrar_error(error_cuadratico)
+            if error_cuadratico <= error_objetivo:
+                return self._marcar_convergencia(iteracion + 1, error_cuadratico, mostrar_progreso)
+            
+            if mostrar_progreso:
+                print(f"Iteración {iteracion:>4}: Error = {error_cuadratico:.6f} | "
+                      f"Amortiguamiento = {self.amortiguamiento:.2e}")
+        
+        red.convergencia_alcanzada = False
+        red.epoca_convergencia = iteracion_final
+        
+        if mostrar_progreso:
+            print(MENSAJE_NO_CONVERGENCIA)
+            print(f"Error final: {error_cuadratico:.6f}")
+        
+        return False, iteracion_final
@@ -0,0 +1,284 @@
+import numpy as np
+from multiprocessing import get_context, shared_memory
+from typing import Dict, List, Optional, Tuple
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from .perceptron_multicapa import PerceptronMulticapa
+from comun.src.callbacks_entrenamiento import CallbackEntrenamiento
+from comun.constantes.constantes_redes_neuronales import (
+    TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO, ERROR_OBJETIVO_DEFECTO,
+    INTERVALO_IMPRESION_DEFECTO, MENSAJE_CONVERGENCIA, MENSAJE_NO_CONVERGENCIA
+)
+
+def _calcular_limites_fragmento(inicio: int, fin: int, indice: int, num_procesos: int) -> Tuple[int, int]:
+    base, resto = divmod(fin - inicio, num_procesos)
+    inicio_fragmento = inicio + indice * base + min(indice, resto)
+    return inicio_fragmento, inicio_fragmento + base + (1 if indice < resto else 0)
+
+def _ejecutar_trabajador(indice: int, num_procesos: int, configuracion: dict,
+                         descriptores: Dict[str, Tuple[str, tuple, str]], conexion) -> None:
+    memorias = {nombre: shared_memory.SharedMemory(name=descriptor[0])
+                for nombre, descriptor in descriptores.items()}
+    arreglos = {nombre: np.ndarray(forma, dtype=tipo, buffer=memorias[nombre].buf)
+                for nombre, (_, forma, tipo) in descriptores.items()}
+    
+    try:
+        red = PerceptronMulticapa(configuracion['arquitectura'], configuracion['funciones_activacion'],
+                                  tipo_datos=configuracion['tipo_datos'],
+                                  funcion_perdida=configuracion['funcion_perdida'])
+        gradientes = arreglos['gradientes'][indice]
+        red._vincular_parametros(arreglos['parametros'], gradientes)
+        
+        while True:
+            comando = conexion.recv()
+            if comando is None:
+                break
+            
+            inicio, fin = _calcular_limites_fragmento(*comando, indice, num_procesos)
+            if inicio == fin:
+                gradientes.fill(0)
+                arreglos['errores'][indice] = 0.0
+                conexion.send(None)
+                continue
+            
+            indices_fragmento = arreglos['indices'][inicio:fin]
+            entradas = np.take(arreglos['entradas'], indices_fragmento, axis=0)
+            salidas_esperadas = np.take(arreglos['salidas'], indices_fragmento, axis=0)
+            
+            salidas_obtenidas = red._propagacion_adelante(entradas)
+            arreglos['errores'][indice] = red._calcular_error(salidas_esperadas,
+                                                              salidas_obtenidas) * (fin - inicio)
+            red._retropropagacion(salidas_esperadas, salidas_obtenidas)
+            
+            conexion.send(None)
+    except Exception as error:
+        conexion.send(f"{type(error).__name__}: {error}")
+    finally:
+        red = gradientes = None
+        arreglos.clear()
+        for memoria in memorias.values():
+            memoria.close()
+
+class EntrenadorParalelo:
+
+    def __init__(self, red: PerceptronMulticapa, num_procesos: Optional[int] = None,
+                 metodo_inicio: Optional[str] = None):
+        self.red = red
+        self.num_procesos = num_procesos or os.cpu_count() or 1
+        self.contexto = get_context(metodo_inicio)
+        
+        self._memorias: List[shared_memory.SharedMemory] = []
+        self._procesos = []
+        self._conexiones = []
+        self._arreglos: Dict[str, np.ndarray] = {}
+    
+    def _crear_arreglo_compartido(self, nombre: str, forma: tuple, tipo_datos) -> Tuple[str, tuple, str]:
+        tipo_datos = np.dtype(tipo_datos)
+        memoria = shared_memory.SharedMemory(
+            create=True, size=max(int(np.prod(forma)) * tipo_datos.itemsize, 1)
+        )
+        self._memorias.append(memoria)
+        self._arreglos[nombre] = np.ndarray(forma, dtype=tipo_datos, buffer=memoria.buf)
+        
+        return memoria.name, forma, tipo_datos.str
+    
+    def _iniciar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray) -> None:
+        red = self.red
+        tipo_datos = red.tipo_datos
+        
+        descriptores = {
+            'parametros': self._crear_arreglo_compartido('parametros', red.parametros.shape, tipo_datos),
+            'gradientes': self._crear_arreglo_compartido(
+                'gradientes', (self.num_procesos, red.parametros.size), tipo_datos
+            ),
+            'entradas': self._crear_arreglo_compartido('entradas', entradas.shape, tipo_datos),
+            'salidas': self._crear_arreglo_compartido('salidas', salidas_esperadas.shape, tipo_datos),
+            'indices': self._crear_arreglo_compartido('indices', (len(entradas),), np.intp),
+            'errores': self._crear_arreglo_compartido('errores', (self.num_procesos,), np.float64)
+        }
+        
+        np.copyto(self._arreglos['parametros'], red.parametros)
+        np.copyto(self._arreglos['entradas'], entradas)
+        np.copyto(self._arreglos['salidas'], salidas_esperadas)
+        self._arreglos['indices'][:] = np.arange(len(entradas))
+        red._vincular_parametros(self._arreglos['parametros'])
+        
+        configuracion = {
+            'arquitectura': red.arquitectura,
+            'funciones_activacion': [capa.nombre_funcion for capa in red.capas],
+            'tipo_datos': red.tipo_datos.name,
+            'funcion_perdida': red.funcion_perdida
+        }
+        
+        for indice in range(self.num_procesos):
+            conexion_maestro, conexion_trabajador = self.contexto.Pipe()
+            proceso = self.contexto.Process(
+                target=_ejecutar_trabajador,
+                args=(indice, self.num_procesos, configuracion, descriptores, conexion_trabajador),
+                daemon=True
+            )
+            proceso.start()
+            conexion_trabajador.close()
+            self._procesos.append(proceso)
+            self._conexiones.append(conexion_maestro)
+    
+    def _finalizar(self) -> None:
+        for conexion in self._conexiones:
+            try:
+                conexion.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proceso in self._procesos:
+            proceso.join()
+        for conexion in self._conexiones:
+            conexion.close()
+        
+        if self._arreglos and self.red.parametros is self._arreglos['parametros']:
+            self.red._vincular_parametros()
+        
+        self._arreglos.clear()
+        for memoria in self._memorias:
+            memoria.close()
+            memoria.unlink()
+        
+        self._memorias = []
+        self._procesos = []
+        self._conexiones = []
+    
+    def _calcular_lote(self, inicio: int, fin: int) -> float:
+        for conexion in self._conexiones:
+            conexion.send((inicio, fin))
+        
+        for conexion in self._conexiones:
+            respuesta = conexion.recv()
+            if respuesta is not None:
+                raise RuntimeError(f"Error en un proceso de entrenamiento: {respuesta}")
+        
+        gradientes_procesos = self._arreglos['gradientes']
+        np.copyto(self.red.gradientes, gradientes_procesos[0])
+        for gradientes in gradientes_procesos[1:]:
+            self.red.gradientes += gradientes
+        
+        errores = self._arreglos['errores']
+        suma_errores = float(errores[0])
+        for error in errores[1:]:
+            suma_errores += float(error)
+        return suma_errores
+    
+    def entrenar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                mostrar_progreso: bool = True,
+                intervalo_impresion: int = INTERVALO_IMPRESION_DEFECTO,
+                tamaño_lote: Optional[int] = None,
+                mezclar: bool = True,
+                descartar_ultimo_lote: bool = False,
+                semilla: Optional[int] = None,
+                reanudar: bool = False,
+                callbacks: Optional[List[CallbackEntrenamiento]] = None) -> Tuple[bool, int]:
+        red = self.red
+        if not reanudar:
+            red.evaluador.limpiar_historial()
+            red.optimizador.reiniciar()
+            red.epocas_entrenadas = 0
+        
+        entradas = np.asarray(entradas, dtype=red.tipo_datos)
+        salidas_esperadas = np.asarray(salidas_esperadas, dtype=red.tipo_datos)
+        
+        if entradas.ndim == 1:
+            entradas = entradas.reshape(1, -1)
+        if salidas_esperadas.ndim == 1:
+            salidas_esperadas = salidas_esperadas.reshape(-1, 1)
+        
+        num_muestras = len(entradas)
+        if tamaño_lote is None or tamaño_lote >= num_muestras:
+            tamaño_lote = num_muestras
+        elif tamaño_lote < 1:
+            raise ValueError("El tamaño de lote debe ser un entero positivo")
+        usar_mini_lotes = tamaño_lote < num_muestras
+        
+        limite = num_muestras
+        if descartar_ultimo_lote:
+            limite -= num_muestras % tamaño_lote
+        
+        generador = np.random.RandomState(semilla) if semilla is not None else np.random
+        
+        callbacks = list(callbacks) if callbacks is not None else []
+        registro = {'tasa_aprendizaje': tasa_aprendizaje, 'error': None}
+        
+        if mostrar_progreso:
+            print(f"Iniciando entrenamiento paralelo...")
+            print(f"Arquitectura: {red.arquitectura}")
+            print(f"Procesos: {self.num_procesos}")
+            print(f"Tasa de aprendizaje: {tasa_aprendizaje}")
+            print(f"Épocas máximas: {max_epocas}")
+            if usar_mini_lotes:
+                print(f"Tamaño de lote: {tamaño_lote}")
+        
+        convergencia = False
+        epoca_final = max_epocas
+        error_cuadratico = (red.evaluador.historial_errores.ultimo
+                            if red.evaluador.historial_errores else float('inf'))
+        
+        try:
+            self._iniciar(entradas, salidas_esperadas)
+            
+            for callback in callbacks:
+                callback.al_iniciar_entrenamiento(red, registro)
+            
+            for epoca in range(red.epocas_entrenadas, max_epocas):
+                if usar_mini_lotes:
+                    if mezclar:
+                        generador.shuffle(self._arreglos['indices'])
+                    
+                    suma_errores = 0.0
+                    for inicio in range(0, limite, tamaño_lote):
+                        fin = min(inicio + tamaño_lote, num_muestras)
+                        suma_errores += self._calcular_lote(inicio, fin)
+                        red._actualizar_pesos(registro['tasa_aprendizaje'])
+                    error_cuadratico = suma_errores / limite
+                else:
+                    error_cuadratico = self._calcular_lote(0, num_muestras) / num_muestras
+                
+                red.evaluador.registrar_error(error_cuadratico)
+                
+                if error_cuadratico <= error_objetivo:
+                    red.convergencia_alcanzada = True
+                    red.epoca_convergencia = epoca + 1
+                    red.epocas_entrenadas = epoca + 1
+                    convergencia = True
+                    epoca_final = red.epoca_convergencia
+                    if mostrar_progreso:
+                        print(f"{MENSAJE_CONVERGENCIA} Época: {red.epoca_convergencia}")
+                        print(f"Error final: {error_cuadratico:.6f}")
+                    break
+                
+                if not usar_mini_lotes:
+                    red._actualizar_pesos(registro['tasa_aprendizaje'])
+                
+                red.epocas_entrenadas = epoca + 1
+                
+                if mostrar_progreso and epoca % intervalo_impresion == 0:
+                    print(f"Época {epoca:>6}: Error = {error_cuadratico:.6f}")
+                
+                registro['error'] = error_cuadratico
+                if CallbackEntrenamiento.notificar_fin_epoca(callbacks, red, epoca, registro):
+                    epoca_final = epoca + 1
+                    break
+        finally:
+            self._finalizar()
+        
+        registro['error'] = error_cuadratico
+        registro['convergencia'] = convergencia
+        for callback in callbacks:
+            callback.al_finalizar_entrenamiento(red, registro)
+        
+        if mostrar_progreso and not convergencia:
+            print(registro.get('motivo_detencion', MENSAJE_NO_CONVERGENCIA))
+            print(f"Error final: {error_cuadratico:.6f}")
+        
+        return convergencia, epoca_final
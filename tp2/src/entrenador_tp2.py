@@ -1,21 +1,27 @@
 import numpy as np
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional, Sequence, Union
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from .perceptron_multicapa import PerceptronMulticapa
+from .ensemble_multicapa import EnsembleMulticapa
 from .cargador_datos_digitos import CargadorDatosDigitos
+from .optimizadores import Optimizador
 from comun.src.utilidades_matematicas import UtilidadesMatematicas
+from comun.src.evaluador_rendimiento import EvaluadorRendimiento
 from comun.constantes.constantes_redes_neuronales import (
     ARQUITECTURAS_TP2, PATRONES_XOR_ENTRADA, PATRONES_XOR_SALIDA,
     TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO, ERROR_OBJETIVO_DEFECTO,
-    PROBABILIDAD_RUIDO_DEFECTO
+    PROBABILIDAD_RUIDO_DEFECTO, EPOCAS_PERFILADO_DEFECTO, PROBABILIDADES_CURVA_RUIDO,
+    ENSAYOS_RUIDO_DEFECTO
 )
 
 class EntrenadorTP2:
 
+    SUFIJO_EXPERIMENTO = '.experimento.npz'
+    
     def __init__(self, cargador_datos: Optional[CargadorDatosDigitos] = None):
 
         self.cargador_datos = cargador_datos or CargadorDatosDigitos()
@@ -25,7 +31,8 @@ class EntrenadorTP2:
     def entrenar_problema_xor(self, arquitectura: List[int] = None,
                             tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                             max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
-                            mostrar_progreso: bool = True) -> Dict:
+                            mostrar_progreso: bool = True,
+                            optimizador: Union[str, Optimizador, None] = None) -> Dict:
 
         if arquitectura is None:
             arquitectura = [2, 4, 1]
@@ -39,7 +46,7 @@ class EntrenadorTP2:
         
         salidas_normalizadas = np.where(salidas == 1, 0.9, 0.1)
         
-        red = PerceptronMulticapa(arquitectura, ['sigmoide'] * (len(arquitectura) - 1))
+        red = PerceptronMulticapa(arquitectura, ['sigmoide'] * (len(arquitectura) - 1), optimizador)
         
         convergencia, epoca = red.entrenar(
             entradas=entradas,
@@ -85,7 +92,9 @@ class EntrenadorTP2:
                                             digitos_prueba: List[int] = None,
                                             tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                                             max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
-                                            mostrar_progreso: bool = True) -> Dict:
+                                            mostrar_progreso: bool = True,
+                                            optimizador: Union[str, Optimizador, None] = None,
+                                            semilla: Optional[int] = None) -> Dict:
 
         if arquitectura is None:
             arquitectura = ARQUITECTURAS_TP2['MINIMA']
@@ -103,7 +112,8 @@ class EntrenadorTP2:
             print(f"Dígitos prueba: {digitos_prueba}")
         
         try:
-            self.cargador_datos.cargar_datos_tp2()
+            if not self.cargador_datos.datos_cargados:
+                self.cargador_datos.cargar_datos_tp2()
         except FileNotFoundError:
             print("⚠️ Archivo de datos no encontrado. Usando datos simulados.")
             return self._crear_resultado_error("Archivo de datos no encontrado")
@@ -125,14 +135,22 @@ class EntrenadorTP2:
         salidas_train_norm = np.where(salidas_train == 1, 0.9, 0.1).reshape(-1, 1)
         salidas_test_norm = np.where(salidas_test == 1, 0.9, 0.1).reshape(-1, 1)
         
-        red = PerceptronMulticapa(arquitectura, ['sigmoide'] * (len(arquitectura) - 1))
+        estado_original = np.random.get_state()
+        try:
+            if semilla is not None:
+                np.random.seed(semilla)
+            red = PerceptronMulticapa(arquitectura, ['sigmoide'] * (len(arquitectura) - 1), optimizador)
+        finally:
+            if semilla is not None:
+                np.random.set_state(estado_original)
         
         convergencia, epoca = red.entrenar(
             entradas=entradas_train,
             salidas_esperadas=salidas_train_norm,
             tasa_aprendizaje=tasa_aprendizaje,
             max_epocas=max_epocas,
-            mostrar_progreso=mostrar_progreso
+            mostrar_progreso=mostrar_progreso,
+            semilla=semilla
         )
         
         pred_train = red.predecir(entradas_train)
@@ -150,6 +168,7 @@ class EntrenadorTP2:
             'precision_prueba': precision_test,
             'digitos_entrenamiento': digitos_entrenamiento,
             'digitos_prueba': digitos_prueba,
+            'semilla': semilla,
             'entradas_train': entradas_train,
             'salidas_train': salidas_train,
             'entradas_test': entradas_test,
@@ -168,12 +187,111 @@ class EntrenadorTP2:
         
         return resultado
     
+    def entrenar_discriminacion_pares_ensemble(self, configuraciones: List[Tuple[List[int], List[int]]],
+                                             arquitectura: List[int] = None,
+                                             num_semillas: int = 1,
+                                             semilla_base: int = 0,
+                                             tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                                             max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
+                                             error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
+                                             mostrar_progreso: bool = True,
+                                             semillas: Optional[Sequence[int]] = None) -> List[Dict]:
+
+        if arquitectura is None:
+            arquitectura = ARQUITECTURAS_TP2['MINIMA']
+        
+        if mostrar_progreso:
+            print(f"\n🔹 Entrenando Ensemble de Discriminación de Números Pares")
+            print(f"Arquitectura: {arquitectura}")
+            print(f"Configuraciones: {len(configuraciones)} | Semillas por configuración: {num_semillas}")
+        
+        try:
+            if not self.cargador_datos.datos_cargados:
+                self.cargador_datos.cargar_datos_tp2()
+        except FileNotFoundError:
+            print("⚠️ Archivo de datos no encontrado. Usando datos simulados.")
+            return [self._crear_resultado_error("Archivo de datos no encontrado")] * len(configuraciones)
+        
+        conjuntos = []
+        for digitos_entrenamiento, digitos_prueba in configuraciones:
+            entradas_train, salidas_train = self.cargador_datos.preparar_datos_clasificacion_binaria(
+                [d for d in digitos_entrenamiento if d % 2 == 0],
+                [d for d in digitos_entrenamiento if d % 2 == 1]
+            )
+            entradas_test, salidas_test = self.cargador_datos.preparar_datos_clasificacion_binaria(
+                [d for d in digitos_prueba if d % 2 == 0],
+                [d for d in digitos_prueba if d % 2 == 1]
+            )
+            conjuntos.append((entradas_train, salidas_train, entradas_test, salidas_test))
+        
+        miembros = [conjunto for conjunto in conjuntos for _ in range(num_semillas)]
+        
+        entradas_train, salidas_train, mascara_train = EnsembleMulticapa.apilar_conjuntos(
+            [conjunto[0] for conjunto in miembros],
+            [np.where(conjunto[1] == 1, 0.9, 0.1) for conjunto in miembros]
+        )
+        entradas_test, salidas_test, mascara_test = EnsembleMulticapa.apilar_conjuntos(
+            [conjunto[2] for conjunto in miembros],
+            [conjunto[3] for conjunto in miembros]
+        )
+        
+        if semillas is None:
+            semillas = semilla_base + np.arange(len(miembros))
+        
+        ensemble = EnsembleMulticapa(
+            arquitectura, len(miembros), ['sigmoide'] * (len(arquitectura) - 1),
+            semillas=semillas
+        )
+        
+        ensemble.entrenar(
+            entradas=entradas_train,
+            salidas_esperadas=salidas_train,
+            tasa_aprendizaje=tasa_aprendizaje,
+            max_epocas=max_epocas,
+            error_objetivo=error_objetivo,
+            mostrar_progreso=mostrar_progreso,
+            mascara_muestras=mascara_train
+        )
+        
+        aciertos_train = (ensemble.predecir(entradas_train)[..., 0] > 0.5) == (salidas_train[..., 0] > 0.5)
+        aciertos_test = (ensemble.predecir(entradas_test)[..., 0] > 0.5) == (salidas_test[..., 0] == 1)
+        
+        precisiones_train = np.sum(aciertos_train & mascara_train, axis=1) / np.sum(mascara_train, axis=1)
+        precisiones_test = np.sum(aciertos_test & mascara_test, axis=1) / np.sum(mascara_test, axis=1)
+        
+        resultados = []
+        for i, (digitos_entrenamiento, digitos_prueba) in enumerate(configuraciones):
+            indices = np.arange(i * num_semillas, (i + 1) * num_semillas)
+            
+            resultado = {
+                'problema': 'discriminacion_pares',
+                'arquitectura': arquitectura,
+                'convergencia': bool(np.all(ensemble.convergencia_alcanzada[indices])),
+                'epoca_convergencia': float(np.mean(ensemble.epocas_convergencia[indices])),
+                'precision_entrenamiento': float(np.mean(precisiones_train[indices])),
+                'precision_prueba': float(np.mean(precisiones_test[indices])),
+                'desviacion_precision_prueba': float(np.std(precisiones_test[indices])),
+                'precisiones_prueba': precisiones_test[indices],
+                'epocas_convergencia': ensemble.epocas_convergencia[indices],
+                'digitos_entrenamiento': digitos_entrenamiento,
+                'digitos_prueba': digitos_prueba,
+                'num_semillas': num_semillas,
+                'estadisticas_convergencia': ensemble.obtener_estadisticas_convergencia(indices)
+            }
+            resultados.append(resultado)
+        
+        self.redes_entrenadas['discriminacion_pares_ensemble'] = ensemble
+        
+        return resultados
+    
     def entrenar_clasificacion_10_clases(self, arquitectura: List[int] = None,
                                        digitos_entrenamiento: List[int] = None,
                                        digitos_prueba: List[int] = None,
                                        tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                                        max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
-                                       mostrar_progreso: bool = True) -> Dict:
+                                       mostrar_progreso: bool = True,
+                                       optimizador: Union[str, Optimizador, None] = None,
+                                       funcion_perdida: str = 'entropia_cruzada') -> Dict:
 
         if arquitectura is None:
             arquitectura = [35, 20, 15, 10]
@@ -187,6 +305,7 @@ class EntrenadorTP2:
         if mostrar_progreso:
             print(f"\n🔹 Entrenando Clasificación 10 Clases")
             print(f"Arquitectura: {arquitectura}")
+            print(f"Función de pérdida: {funcion_perdida}")
             print(f"Dígitos entrenamiento: {digitos_entrenamiento}")
             print(f"Dígitos prueba: {digitos_prueba}")
         
@@ -206,7 +325,12 @@ class EntrenadorTP2:
         for i, digito in enumerate(salidas_train):
             salidas_train_encoded[i, digito] = 1
         
-        red = PerceptronMulticapa(arquitectura, ['sigmoide'] * (len(arquitectura) - 1))
+        funciones_activacion = ['sigmoide'] * (len(arquitectura) - 1)
+        if funcion_perdida == 'entropia_cruzada':
+            funciones_activacion[-1] = 'softmax'
+        
+        red = PerceptronMulticapa(arquitectura, funciones_activacion, optimizador,
+                                  funcion_perdida=funcion_perdida)
         
         convergencia, epoca = red.entrenar(
             entradas=entradas_train,
@@ -311,6 +435,85 @@ class EntrenadorTP2:
         
         return resultado_ruido
     
+    def evaluar_curva_robustez_ruido(self, nombre_experimento: str,
+                                     probabilidades: List[float] = PROBABILIDADES_CURVA_RUIDO,
+                                     num_ensayos: int = ENSAYOS_RUIDO_DEFECTO,
+                                     semilla: Optional[int] = None,
+                                     mostrar_progreso: bool = True) -> Dict:
+
+        if nombre_experimento not in self.redes_entrenadas:
+            raise ValueError(f"Experimento '{nombre_experimento}' no encontrado")
+        
+        red = self.redes_entrenadas[nombre_experimento]
+        resultado_original = self.resultados_experimentos[nombre_experimento]
+        
+        if 'entradas_test' in resultado_original:
+            entradas_limpias = resultado_original['entradas_test']
+            salidas_esperadas = resultado_original['salidas_test']
+        else:
+            entradas_limpias = resultado_original['entradas']
+            salidas_esperadas = resultado_original['salidas_esperadas']
+        
+        evaluador = EvaluadorRendimiento()
+        if nombre_experimento == 'clasificacion_10_clases':
+            curva = evaluador.calcular_curva_robustez(
+                red, entradas_limpias, salidas_esperadas, probabilidades, num_ensayos,
+                tipo='multiclase', semilla=semilla
+            )
+        else:
+            curva = evaluador.calcular_curva_robustez(
+                red, entradas_limpias, (np.ravel(salidas_esperadas) == 1).astype(float),
+                probabilidades, num_ensayos, tipo='binaria', umbral=0.5, semilla=semilla
+            )
+        
+        curva['experimento_base'] = nombre_experimento
+        self.resultados_experimentos[f"curva_ruido_{nombre_experimento}"] = curva
+        
+        if mostrar_progreso:
+            self._mostrar_curva_robustez(curva)
+        
+        return curva
+    
+    def perfilar_arquitecturas(self, arquitecturas: Dict[str, List[int]] = None,
+                               tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
+                               max_epocas: int = EPOCAS_PERFILADO_DEFECTO,
+                               tamaño_lote: Optional[int] = None,
+                               medir_memoria: bool = False,
+                               mostrar_progreso: bool = True) -> Dict[str, dict]:
+
+        if arquitecturas is None:
+            arquitecturas = ARQUITECTURAS_TP2
+        
+        try:
+            entradas, etiquetas = self.cargador_datos.cargar_datos_tp2()
+        except FileNotFoundError:
+            print("⚠️ Archivo de datos no encontrado.")
+            return {}
+        
+        reportes = {}
+        for nombre, arquitectura in arquitecturas.items():
+            num_salidas = arquitectura[-1]
+            if num_salidas == 1:
+                salidas = np.where(etiquetas % 2 == 0, 0.9, 0.1).reshape(-1, 1)
+            else:
+                salidas = UtilidadesMatematicas.convertir_a_one_hot(etiquetas, num_salidas)
+            
+            red = PerceptronMulticapa(arquitectura, ['sigmoide'] * (len(arquitectura) - 1))
+            red.activar_perfilado(medir_memoria)
+            red.entrenar(entradas, salidas, tasa_aprendizaje=tasa_aprendizaje,
+                         max_epocas=max_epocas, error_objetivo=0.0, mostrar_progreso=False,
+                         tamaño_lote=tamaño_lote)
+            
+            if mostrar_progreso:
+                print(f"\n🔹 Perfil de la arquitectura {nombre}: {arquitectura}")
+                red.perfilador.mostrar_reporte()
+            
+            reportes[nombre] = red.desactivar_perfilado()
+        
+        self.resultados_experimentos['perfilado_arquitecturas'] = reportes
+        
+        return reportes
+    
     def _mostrar_resultados_xor(self, resultado: Dict) -> None:
 
         print(f"\n📊 RESULTADOS XOR:")
@@ -374,6 +577,17 @@ class EntrenadorTP2:
         else:
             print(f"  ⚠️ Sensibilidad al ruido detectada")
     
+    def _mostrar_curva_robustez(self, curva: Dict) -> None:
+
+        print(f"\n📊 CURVA DE ROBUSTEZ AL RUIDO - {curva['experimento_base']} "
+              f"({curva['num_ensayos']} ensayos por nivel):")
+        print(f"  Precisión sin ruido: {curva['precision_sin_ruido']*100:.1f}%")
+        
+        for i, probabilidad in enumerate(curva['probabilidades']):
+            print(f"  p={probabilidad:.3f}: {curva['precision_media'][i]*100:5.1f}% "
+                  f"± {curva['precision_desviacion'][i]*100:.1f}% "
+                  f"[{curva['banda_inferior'][i]*100:.1f}%, {curva['banda_superior'][i]*100:.1f}%]")
+    
     def _crear_resultado_error(self, mensaje_error: str) -> Dict:
 
         return {
@@ -384,6 +598,66 @@ class EntrenadorTP2:
             'precision_prueba': 0.0
         }
     
+    @staticmethod
+    def _serializar_resultado(resultado: Dict) -> Dict[str, np.ndarray]:
+
+        arreglos = {}
+        for clave, valor in resultado.items():
+            if clave == 'red' or isinstance(valor, dict) or valor is None:
+                continue
+            
+            arreglo = np.asarray(valor)
+            if arreglo.dtype != object:
+                arreglos[clave] = arreglo
+        
+        return arreglos
+    
+    def _guardar_resultado_experimento(self, ruta: str, nombre: str) -> None:
+
+        arreglos = self._serializar_resultado(self.resultados_experimentos[nombre])
+        PerceptronMulticapa._reemplazar_archivo(ruta, lambda archivo: np.savez(archivo, **arreglos))
+    
+    @staticmethod
+    def _cargar_resultado_experimento(ruta: str) -> Dict:
+
+        with np.load(ruta, allow_pickle=False) as archivo:
+            return {clave: archivo[clave].item() if archivo[clave].ndim == 0 else archivo[clave]
+                    for clave in archivo.files}
+    
+    def guardar_redes(self, directorio: str) -> Dict[str, str]:
+
+        rutas = {}
+        for nombre, red in self.redes_entrenadas.items():
+            if isinstance(red, PerceptronMulticapa):
+                rutas[nombre] = red.guardar(os.path.join(directorio, nombre))
+                if nombre in self.resultados_experimentos:
+                    self._guardar_resultado_experimento(
+                        os.path.join(directorio, nombre + self.SUFIJO_EXPERIMENTO), nombre
+                    )
+        return rutas
+    
+    def cargar_redes(self, directorio: str, nombres: List[str] = None,
+                     mmap_mode: Optional[str] = None) -> Dict[str, PerceptronMulticapa]:
+
+        if nombres is None:
+            nombres = [archivo[:-len(PerceptronMulticapa.SUFIJO_MODELO)]
+                       for archivo in sorted(os.listdir(directorio))
+                       if archivo.endswith(PerceptronMulticapa.SUFIJO_MODELO)
+                       and not archivo.endswith(self.SUFIJO_EXPERIMENTO)]
+        
+        redes = {}
+        for nombre in nombres:
+            redes[nombre] = PerceptronMulticapa.cargar(os.path.join(directorio, nombre), mmap_mode)
+            
+            ruta_experimento = os.path.join(directorio, nombre + self.SUFIJO_EXPERIMENTO)
+            if os.path.exists(ruta_experimento):
+                resultado = self._cargar_resultado_experimento(ruta_experimento)
+                resultado['red'] = redes[nombre]
+                self.resultados_experimentos[nombre] = resultado
+        
+        self.redes_entrenadas.update(redes)
+        return redes
+    
     def obtener_resultados(self, nombre_experimento: str = None) -> Dict:
 
         if nombre_experimento is None:
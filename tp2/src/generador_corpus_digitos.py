@@ -0,0 +1,233 @@
+import os
+import sys
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from comun.src.utilidades_matematicas import UtilidadesMatematicas
+from .cargador_datos_digitos import CargadorDatosDigitos
+from comun.constantes.constantes_redes_neuronales import (
+    TAMAÑO_ENTRADA_DIGITOS, FILAS_DIGITO, COLUMNAS_DIGITO, TAMAÑO_BLOQUE_CORPUS,
+    PROBABILIDAD_RUIDO_DEFECTO, TIPO_DATOS_DEFECTO
+)
+
+DESPLAZAMIENTOS_PIXEL = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+def _generar_bloque_en_archivo(configuracion: dict, ruta_entradas: str, ruta_etiquetas: str,
+                               indice_bloque: int) -> int:
+
+    entradas, etiquetas = GeneradorCorpusDigitos.generar_bloque(configuracion, indice_bloque)
+    inicio = indice_bloque * configuracion['tamaño_bloque']
+    
+    archivo_entradas = np.load(ruta_entradas, mmap_mode='r+')
+    archivo_etiquetas = np.load(ruta_etiquetas, mmap_mode='r+')
+    archivo_entradas[inicio:inicio + len(entradas)] = entradas
+    archivo_etiquetas[inicio:inicio + len(etiquetas)] = etiquetas
+    archivo_entradas.flush()
+    archivo_etiquetas.flush()
+    
+    return indice_bloque
+
+class GeneradorCorpusDigitos:
+
+    SUFIJO_ENTRADAS = '.entradas.npy'
+    SUFIJO_ETIQUETAS = '.etiquetas.npy'
+    SUFIJO_METADATOS = '.corpus.json'
+    
+    def __init__(self, cargador_datos: Optional[CargadorDatosDigitos] = None,
+                 probabilidad_ruido: float = PROBABILIDAD_RUIDO_DEFECTO,
+                 probabilidad_desplazamiento: float = 0.0,
+                 probabilidad_engrosamiento: float = 0.0,
+                 tamaño_bloque: int = TAMAÑO_BLOQUE_CORPUS,
+                 semilla: int = 0):
+
+        for nombre, probabilidad in (('ruido', probabilidad_ruido),
+                                     ('desplazamiento', probabilidad_desplazamiento),
+                                     ('engrosamiento', probabilidad_engrosamiento)):
+            if not 0.0 <= probabilidad <= 1.0:
+                raise ValueError(f"La probabilidad de {nombre} debe estar entre 0 y 1")
+        
+        if tamaño_bloque < 1:
+            raise ValueError("El tamaño de bloque debe ser un entero positivo")
+        
+        self.cargador_datos = cargador_datos or CargadorDatosDigitos()
+        self.probabilidad_ruido = probabilidad_ruido
+        self.probabilidad_desplazamiento = probabilidad_desplazamiento
+        self.probabilidad_engrosamiento = probabilidad_engrosamiento
+        self.tamaño_bloque = tamaño_bloque
+        self.semilla = semilla
+    
+    def _obtener_patrones_base(self) -> Tuple[np.ndarray, np.ndarray]:
+
+        if not self.cargador_datos.datos_cargados:
+            self.cargador_datos.cargar_datos_tp2()
+        
+        patrones = np.asarray(self.cargador_datos.datos_entrada).astype(np.uint8)
+        etiquetas = np.asarray(self.cargador_datos.datos_salida).astype(np.uint8)
+        return patrones, etiquetas
+    
+    def obtener_configuracion(self, num_muestras: int) -> dict:
+
+        patrones, etiquetas = self._obtener_patrones_base()
+        
+        return {
+            'num_muestras': int(num_muestras),
+            'tamaño_bloque': self.tamaño_bloque,
+            'semilla': self.semilla,
+            'probabilidad_ruido': self.probabilidad_ruido,
+            'probabilidad_desplazamiento': self.probabilidad_desplazamiento,
+            'probabilidad_engrosamiento': self.probabilidad_engrosamiento,
+            'patrones': patrones.tolist(),
+            'etiquetas': etiquetas.tolist()
+        }
+    
+    @staticmethod
+    def desplazar_imagenes(imagenes: np.ndarray, desplazamiento_filas: int,
+                           desplazamiento_columnas: int) -> np.ndarray:
+
+        desplazadas = np.zeros_like(imagenes)
+        filas, columnas = imagenes.shape[1:]
+        
+        origen_filas = slice(max(-desplazamiento_filas, 0), filas - max(desplazamiento_filas, 0))
+        destino_filas = slice(max(desplazamiento_filas, 0), filas - max(-desplazamiento_filas, 0))
+        origen_columnas = slice(max(-desplazamiento_columnas, 0),
+                                columnas - max(desplazamiento_columnas, 0))
+        destino_columnas = slice(max(desplazamiento_columnas, 0),
+                                 columnas - max(-desplazamiento_columnas, 0))
+        
+        desplazadas[:, destino_filas, destino_columnas] = imagenes[:, origen_filas, origen_columnas]
+        return desplazadas
+    
+    @staticmethod
+    def generar_bloque(configuracion: dict, indice_bloque: int) -> Tuple[np.ndarray, np.ndarray]:
+
+        inicio = indice_bloque * configuracion['tamaño_bloque']
+        num_muestras = min(configuracion['tamaño_bloque'], configuracion['num_muestras'] - inicio)
+        if num_muestras <= 0:
+            raise ValueError(f"Bloque {indice_bloque} fuera del corpus")
+        
+        generador = np.random.default_rng([configuracion['semilla'], indice_bloque])
+        patrones = np.asarray(configuracion['patrones'], dtype=np.uint8)
+        etiquetas_base = np.asarray(configuracion['etiquetas'], dtype=np.uint8)
+        
+        indices = generador.integers(0, len(patrones), size=num_muestras)
+        imagenes = patrones[indices].reshape(num_muestras, FILAS_DIGITO, COLUMNAS_DIGITO)
+        
+        engrosar = generador.random(num_muestras) < configuracion['probabilidad_engrosamiento']
+        imagenes[engrosar] |= GeneradorCorpusDigitos.desplazar_imagenes(imagenes[engrosar], 0, 1)
+        
+        desplazar = generador.random(num_muestras) < configuracion['probabilidad_desplazamiento']
+        direcciones = generador.integers(0, len(DESPLAZAMIENTOS_PIXEL), size=num_muestras)
+        for direccion, (filas, columnas) in enumerate(DESPLAZAMIENTOS_PIXEL):
+            seleccion = desplazar & (direcciones == direccion)
+            imagenes[seleccion] = GeneradorCorpusDigitos.desplazar_imagenes(
+                imagenes[seleccion], filas, columnas
+            )
+        
+        entradas = UtilidadesMatematicas.generar_ruido_binario(
+            imagenes.reshape(num_muestras, TAMAÑO_ENTRADA_DIGITOS),
+            configuracion['probabilidad_ruido'], generador
+        )
+        
+        return entradas, etiquetas_base[indices]
+    
+    @classmethod
+    def obtener_rutas(cls, ruta: str) -> Dict[str, str]:
+
+        return {
+            'entradas': ruta + cls.SUFIJO_ENTRADAS,
+            'etiquetas': ruta + cls.SUFIJO_ETIQUETAS,
+            'metadatos': ruta + cls.SUFIJO_METADATOS
+        }
+    
+    @staticmethod
+    def _escribir_metadatos(ruta_metadatos: str, metadatos: dict) -> None:
+
+        ruta_temporal = f"{ruta_metadatos}.{os.getpid()}.tmp"
+        with open(ruta_temporal, 'w', encoding='utf-8') as archivo:
+            json.dump(metadatos, archivo)
+        os.replace(ruta_temporal, ruta_metadatos)
+    
+    def _preparar_archivos(self, rutas: Dict[str, str], configuracion: dict,
+                           reanudar: bool) -> List[int]:
+
+        if reanudar and all(os.path.exists(ruta) for ruta in rutas.values()):
+            with open(rutas['metadatos'], 'r', encoding='utf-8') as archivo:
+                metadatos = json.load(archivo)
+            
+            if metadatos.get('configuracion') == configuracion:
+                return metadatos['bloques_completados']
+        
+        num_muestras = configuracion['num_muestras']
+        np.lib.format.open_memmap(rutas['entradas'], mode='w+', dtype=np.uint8,
+                                  shape=(num_muestras, TAMAÑO_ENTRADA_DIGITOS)).flush()
+        np.lib.format.open_memmap(rutas['etiquetas'], mode='w+', dtype=np.uint8,
+                                  shape=(num_muestras,)).flush()
+        
+        self._escribir_metadatos(rutas['metadatos'],
+                                 {'configuracion': configuracion, 'bloques_completados': []})
+        return []
+    
+    def generar(self, ruta: str, num_muestras: int, max_workers: Optional[int] = 1,
+                reanudar: bool = True, mostrar_progreso: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+
+        if num_muestras < 1:
+            raise ValueError("El número de muestras debe ser un entero positivo")
+        
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        
+        rutas = self.obtener_rutas(ruta)
+        configuracion = self.obtener_configuracion(num_muestras)
+        
+        bloques_completados = self._preparar_archivos(rutas, configuracion, reanudar)
+        total_bloques = -(-num_muestras // self.tamaño_bloque)
+        pendientes = sorted(set(range(total_bloques)) - set(bloques_completados))
+        
+        if mostrar_progreso:
+            print(f"Generando corpus de {num_muestras} muestras en {total_bloques} bloques "
+                  f"({len(pendientes)} pendientes)")
+        
+        def registrar_bloque(indice_bloque: int) -> None:
+            bloques_completados.append(indice_bloque)
+            self._escribir_metadatos(rutas['metadatos'], {'configuracion': configuracion,
+                                                          'bloques_completados': bloques_completados})
+            if mostrar_progreso:
+                print(f"Bloques completados: {len(bloques_completados)}/{total_bloques}")
+        
+        if max_workers == 1:
+            for indice_bloque in pendientes:
+                registrar_bloque(_generar_bloque_en_archivo(
+                    configuracion, rutas['entradas'], rutas['etiquetas'], indice_bloque
+                ))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(_generar_bloque_en_archivo, configuracion,
+                                           rutas['entradas'], rutas['etiquetas'], indice_bloque)
+                           for indice_bloque in pendientes]
+                
+                for future in as_completed(futures):
+                    registrar_bloque(future.result())
+        
+        return self.cargar(ruta)
+    
+    @classmethod
+    def cargar(cls, ruta: str, mmap_mode: Optional[str] = 'r') -> Tuple[np.ndarray, np.ndarray]:
+
+        rutas = cls.obtener_rutas(ruta)
+        return (np.load(rutas['entradas'], mmap_mode=mmap_mode),
+                np.load(rutas['etiquetas'], mmap_mode=mmap_mode))
+    
+    @classmethod
+    def iterar_bloques(cls, ruta: str, tamaño_bloque: int = TAMAÑO_BLOQUE_CORPUS,
+                       tipo_datos: str = TIPO_DATOS_DEFECTO) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+
+        entradas, etiquetas = cls.cargar(ruta)
+        for inicio in range(0, len(entradas), tamaño_bloque):
+            yield (np.asarray(entradas[inicio:inicio + tamaño_bloque], dtype=tipo_datos),
+                   np.asarray(etiquetas[inicio:inicio + tamaño_bloque]))
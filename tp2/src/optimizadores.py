@@ -0,0 +1,266 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Union
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from comun.constantes.constantes_redes_neuronales import (
+    MOMENTO_DEFECTO, DECAIMIENTO_RMSPROP_DEFECTO, BETA1_ADAM_DEFECTO,
+    BETA2_ADAM_DEFECTO, EPSILON_OPTIMIZADOR, PASO_INICIAL_RPROP, PASO_MINIMO_RPROP,
+    PASO_MAXIMO_RPROP, FACTOR_AUMENTO_RPROP, FACTOR_DISMINUCION_RPROP
+)
+
+class Optimizador(ABC):
+
+    nombre = 'base'
+    atributos_estado: Tuple[str, ...] = ()
+    
+    def __init__(self):
+        self.formas_parametros = None
+    
+    def _asegurar_estado(self, parametros: List[np.ndarray]) -> None:
+        formas = [parametro.shape for parametro in parametros]
+        
+        if formas != self.formas_parametros:
+            self.formas_parametros = formas
+            self.inicializar_estado(parametros)
+    
+    def inicializar_estado(self, parametros: List[np.ndarray]) -> None:
+        pass
+    
+    def reiniciar(self) -> None:
+        self.formas_parametros = None
+    
+    def actualizar(self, parametros: List[np.ndarray], gradientes: List[np.ndarray],
+                   tasa_aprendizaje: float) -> None:
+        self._asegurar_estado(parametros)
+        
+        for indice, (parametro, gradiente) in enumerate(zip(parametros, gradientes)):
+            self._actualizar_parametro(indice, parametro, gradiente, tasa_aprendizaje)
+    
+    @abstractmethod
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        pass
+    
+    def obtener_configuracion(self) -> dict:
+        return {'nombre': self.nombre}
+    
+    def obtener_estado(self) -> Dict[str, np.ndarray]:
+        if self.formas_parametros is None:
+            return {}
+        
+        estado = {}
+        for atributo in self.atributos_estado:
+            valor = getattr(self, atributo)
+            if isinstance(valor, list):
+                for indice, arreglo in enumerate(valor):
+                    estado[f"{atributo}_{indice}"] = arreglo
+            else:
+                estado[atributo] = np.asarray(valor)
+        return estado
+    
+    def establecer_estado(self, estado: Dict[str, np.ndarray], parametros: List[np.ndarray]) -> None:
+        if not estado:
+            self.reiniciar()
+            return
+        
+        self.formas_parametros = [parametro.shape for parametro in parametros]
+        
+        for atributo in self.atributos_estado:
+            if isinstance(getattr(self, atributo), list):
+                valor = [np.array(estado[f"{atributo}_{indice}"], dtype=parametro.dtype)
+                         for indice, parametro in enumerate(parametros)]
+            else:
+                valor = estado[atributo].item()
+            setattr(self, atributo, valor)
+
+class OptimizadorSGD(Optimizador):
+
+    nombre = 'sgd'
+    
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        parametro += tasa_aprendizaje * gradiente
+
+class OptimizadorMomentum(Optimizador):
+
+    nombre = 'momentum'
+    atributos_estado = ('velocidades',)
+    
+    def __init__(self, momento: float = MOMENTO_DEFECTO):
+        super().__init__()
+        self.momento = momento
+        self.velocidades: List[np.ndarray] = []
+    
+    def inicializar_estado(self, parametros: List[np.ndarray]) -> None:
+        self.velocidades = [np.zeros_like(parametro) for parametro in parametros]
+    
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        velocidad = self.velocidades[indice]
+        velocidad *= self.momento
+        velocidad += tasa_aprendizaje * gradiente
+        parametro += velocidad
+    
+    def obtener_configuracion(self) -> dict:
+        return {'nombre': self.nombre, 'momento': self.momento}
+
+class OptimizadorNesterov(OptimizadorMomentum):
+
+    nombre = 'nesterov'
+    
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        paso_gradiente = tasa_aprendizaje * gradiente
+        
+        velocidad = self.velocidades[indice]
+        velocidad *= self.momento
+        velocidad += paso_gradiente
+        
+        parametro += self.momento * velocidad
+        parametro += paso_gradiente
+
+class OptimizadorRMSprop(Optimizador):
+
+    nombre = 'rmsprop'
+    atributos_estado = ('promedios_cuadrados',)
+    
+    def __init__(self, decaimiento: float = DECAIMIENTO_RMSPROP_DEFECTO,
+                 epsilon: float = EPSILON_OPTIMIZADOR):
+        super().__init__()
+        self.decaimiento = decaimiento
+        self.epsilon = epsilon
+        self.promedios_cuadrados: List[np.ndarray] = []
+    
+    def inicializar_estado(self, parametros: List[np.ndarray]) -> None:
+        self.promedios_cuadrados = [np.zeros_like(parametro) for parametro in parametros]
+    
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        promedio = self.promedios_cuadrados[indice]
+        promedio *= self.decaimiento
+        promedio += (1 - self.decaimiento) * np.square(gradiente)
+        
+        parametro += tasa_aprendizaje * gradiente / (np.sqrt(promedio) + self.epsilon)
+    
+    def obtener_configuracion(self) -> dict:
+        return {'nombre': self.nombre, 'decaimiento': self.decaimiento, 'epsilon': self.epsilon}
+
+class OptimizadorAdam(Optimizador):
+
+    nombre = 'adam'
+    atributos_estado = ('primeros_momentos', 'segundos_momentos', 'paso')
+    
+    def __init__(self, beta1: float = BETA1_ADAM_DEFECTO, beta2: float = BETA2_ADAM_DEFECTO,
+                 epsilon: float = EPSILON_OPTIMIZADOR):
+        super().__init__()
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+        self.primeros_momentos: List[np.ndarray] = []
+        self.segundos_momentos: List[np.ndarray] = []
+        self.paso = 0
+    
+    def inicializar_estado(self, parametros: List[np.ndarray]) -> None:
+        self.primeros_momentos = [np.zeros_like(parametro) for parametro in parametros]
+        self.segundos_momentos = [np.zeros_like(parametro) for parametro in parametros]
+        self.paso = 0
+    
+    def actualizar(self, parametros: List[np.ndarray], gradientes: List[np.ndarray],
+                   tasa_aprendizaje: float) -> None:
+        self._asegurar_estado(parametros)
+        self.paso += 1
+        
+        correccion = np.sqrt(1 - self.beta2 ** self.paso) / (1 - self.beta1 ** self.paso)
+        tasa_corregida = tasa_aprendizaje * correccion
+        
+        for indice, (parametro, gradiente) in enumerate(zip(parametros, gradientes)):
+            self._actualizar_parametro(indice, parametro, gradiente, tasa_corregida)
+    
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        primer_momento = self.primeros_momentos[indice]
+        primer_momento *= self.beta1
+        primer_momento += (1 - self.beta1) * gradiente
+        
+        segundo_momento = self.segundos_momentos[indice]
+        segundo_momento *= self.beta2
+        segundo_momento += (1 - self.beta2) * np.square(gradiente)
+        
+        parametro += tasa_aprendizaje * primer_momento / (np.sqrt(segundo_momento) + self.epsilon)
+    
+    def obtener_configuracion(self) -> dict:
+        return {'nombre': self.nombre, 'beta1': self.beta1, 'beta2': self.beta2,
+                'epsilon': self.epsilon}
+
+class OptimizadorRprop(Optimizador):
+
+    nombre = 'rprop'
+    atributos_estado = ('pasos', 'gradientes_previos')
+    
+    def __init__(self, paso_inicial: float = PASO_INICIAL_RPROP,
+                 paso_minimo: float = PASO_MINIMO_RPROP,
+                 paso_maximo: float = PASO_MAXIMO_RPROP,
+                 factor_aumento: float = FACTOR_AUMENTO_RPROP,
+                 factor_disminucion: float = FACTOR_DISMINUCION_RPROP):
+        super().__init__()
+        self.paso_inicial = paso_inicial
+        self.paso_minimo = paso_minimo
+        self.paso_maximo = paso_maximo
+        self.factor_aumento = factor_aumento
+        self.factor_disminucion = factor_disminucion
+        self.pasos: List[np.ndarray] = []
+        self.gradientes_previos: List[np.ndarray] = []
+    
+    def inicializar_estado(self, parametros: List[np.ndarray]) -> None:
+        self.pasos = [np.full_like(parametro, self.paso_inicial) for parametro in parametros]
+        self.gradientes_previos = [np.zeros_like(parametro) for parametro in parametros]
+    
+    def _actualizar_parametro(self, indice: int, parametro: np.ndarray,
+                              gradiente: np.ndarray, tasa_aprendizaje: float) -> None:
+        pasos = self.pasos[indice]
+        gradiente_previo = self.gradientes_previos[indice]
+        
+        cambio_signo = gradiente * gradiente_previo
+        mismo_signo = cambio_signo > 0
+        signo_invertido = cambio_signo < 0
+        
+        pasos[mismo_signo] = np.minimum(pasos[mismo_signo] * self.factor_aumento, self.paso_maximo)
+        pasos[signo_invertido] = np.maximum(pasos[signo_invertido] * self.factor_disminucion,
+                                            self.paso_minimo)
+        
+        np.copyto(gradiente_previo, gradiente)
+        gradiente_previo[signo_invertido] = 0
+        
+        parametro += np.sign(gradiente_previo) * pasos
+    
+    def obtener_configuracion(self) -> dict:
+        return {'nombre': self.nombre, 'paso_inicial': self.paso_inicial,
+                'paso_minimo': self.paso_minimo, 'paso_maximo': self.paso_maximo,
+                'factor_aumento': self.factor_aumento,
+                'factor_disminucion': self.factor_disminucion}
+
+OPTIMIZADORES_DISPONIBLES = {
+    'sgd': OptimizadorSGD,
+    'momentum': OptimizadorMomentum,
+    'nesterov': OptimizadorNesterov,
+    'rmsprop': OptimizadorRMSprop,
+    'adam': OptimizadorAdam,
+    'rprop': OptimizadorRprop
+}
+
+def crear_optimizador(optimizador: Union[str, Optimizador, None] = None, **parametros) -> Optimizador:
+    if optimizador is None:
+        return OptimizadorSGD()
+    
+    if isinstance(optimizador, Optimizador):
+        return optimizador
+    
+    if optimizador not in OPTIMIZADORES_DISPONIBLES:
+        raise ValueError(f"Optimizador '{optimizador}' no disponible. "
+                       f"Opciones: {list(OPTIMIZADORES_DISPONIBLES.keys())}")
+    
+    return OPTIMIZADORES_DISPONIBLES[optimizador](**parametros)
@@ -1,5 +1,6 @@
+import json
 import numpy as np
-from typing import List, Tuple, Optional, Callable
+from typing import List, Tuple, Optional, Callable, Union, Iterable, Iterator
 import sys
 import os
 
@@ -8,48 +9,119 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from comun.src.funciones_activacion import FuncionesActivacion
 from comun.src.utilidades_matematicas import UtilidadesMatematicas
 from comun.src.evaluador_rendimiento import EvaluadorRendimiento
+from .optimizadores import Optimizador, crear_optimizador
+from .perfilador_red import PerfiladorRed
+from comun.src.callbacks_entrenamiento import CallbackEntrenamiento
 from comun.constantes.constantes_redes_neuronales import (
     TASA_APRENDIZAJE_DEFECTO, EPOCAS_MAXIMAS_DEFECTO, ERROR_OBJETIVO_DEFECTO,
-    INTERVALO_IMPRESION_DEFECTO, MENSAJE_CONVERGENCIA, MENSAJE_NO_CONVERGENCIA
+    INTERVALO_IMPRESION_DEFECTO, INTERVALO_ERROR_DEFECTO,
+    MENSAJE_CONVERGENCIA, MENSAJE_NO_CONVERGENCIA,
+    TIPOS_DATOS_DISPONIBLES, TIPO_DATOS_DEFECTO, TAMAÑO_BLOQUE_DEFECTO,
+    FUNCIONES_PERDIDA, ACTIVACIONES_SALIDA_ENTROPIA_CRUZADA
 )
 
 class CapaRed:
     
     def __init__(self, num_entradas: int, num_neuronas: int, 
-                 funcion_activacion: str = 'sigmoide'):
+                 funcion_activacion: str = 'sigmoide',
+                 tipo_datos: str = TIPO_DATOS_DEFECTO):
         self.num_entradas = num_entradas
         self.num_neuronas = num_neuronas
         
         self.pesos = UtilidadesMatematicas.inicializar_pesos_xavier(
-            num_entradas, num_neuronas
+            num_entradas, num_neuronas, tipo_datos
         )
-        self.sesgos = np.zeros((1, num_neuronas))
+        self.sesgos = np.zeros((1, num_neuronas), dtype=tipo_datos)
         
+        self.nombre_funcion = funcion_activacion
         self.funcion_activacion, self.derivada_activacion = (
             FuncionesActivacion.obtener_funcion_y_derivada(funcion_activacion)
         )
         
+        self.gradientes_pesos = np.zeros_like(self.pesos)
+        self.gradientes_sesgos = np.zeros_like(self.sesgos)
+        self.gradiente_combinado = False
+        
+        self.capacidad_lote = 0
+        self.tipo_espacio_trabajo = None
         self.ultima_entrada = None
         self.ultima_salida_neta = None
         self.ultima_salida_activada = None
     
+    @property
+    def num_parametros(self) -> int:
+        return self.pesos.size + self.sesgos.size
+    
+    def vincular_buffers(self, parametros: np.ndarray, gradientes: np.ndarray,
+                         copiar_valores: bool = True) -> None:
+        corte = self.pesos.size
+        
+        pesos = parametros[:corte].reshape(self.pesos.shape)
+        sesgos = parametros[corte:].reshape(self.sesgos.shape)
+        if copiar_valores:
+            pesos[...] = self.pesos
+            sesgos[...] = self.sesgos
+        
+        self.pesos = pesos
+        self.sesgos = sesgos
+        self.gradientes_pesos = gradientes[:corte].reshape(self.pesos.shape)
+        self.gradientes_sesgos = gradientes[corte:].reshape(self.sesgos.shape)
+    
+    def _asegurar_espacio_trabajo(self, num_muestras: int, tipo_datos: np.dtype) -> None:
+        if num_muestras > self.capacidad_lote or tipo_datos != self.tipo_espacio_trabajo:
+            self.capacidad_lote = num_muestras
+            self.tipo_espacio_trabajo = tipo_datos
+            self._salida_neta = np.empty((num_muestras, self.num_neuronas), dtype=tipo_datos)
+            self._salida_activada = np.empty((num_muestras, self.num_neuronas), dtype=tipo_datos)
+            self._delta = np.empty((num_muestras, self.num_neuronas), dtype=tipo_datos)
+            self._error_anterior = np.empty((num_muestras, self.num_entradas), dtype=tipo_datos)
+    
     def propagacion_adelante(self, entradas: np.ndarray) -> np.ndarray:
+        num_muestras = len(entradas)
+        self._asegurar_espacio_trabajo(num_muestras, np.result_type(entradas, self.pesos))
+        
         self.ultima_entrada = entradas
         
-        self.ultima_salida_neta = np.dot(entradas, self.pesos) + self.sesgos
+        self.ultima_salida_neta = self._salida_neta[:num_muestras]
+        np.dot(entradas, self.pesos, out=self.ultima_salida_neta)
+        self.ultima_salida_neta += self.sesgos
         
-        self.ultima_salida_activada = self.funcion_activacion(self.ultima_salida_neta)
+        self.ultima_salida_activada = self.funcion_activacion(
+            self.ultima_salida_neta, salida=self._salida_activada[:num_muestras]
+        )
         
         return self.ultima_salida_activada
     
-    def calcular_gradientes(self, error_siguiente_capa: np.ndarray) -> np.ndarray:
-        derivada = self.derivada_activacion(self.ultima_salida_activada)
-        delta = error_siguiente_capa * derivada
+    def inferir(self, entradas: np.ndarray, salida: Optional[np.ndarray] = None) -> np.ndarray:
+        if salida is None:
+            salida = np.empty((len(entradas), self.num_neuronas),
+                              dtype=np.result_type(entradas, self.pesos))
+        
+        np.dot(entradas, self.pesos, out=salida)
+        salida += self.sesgos
+        
+        return self.funcion_activacion(salida, salida=salida)
+    
+    def calcular_gradientes(self, error_siguiente_capa: np.ndarray,
+                            propagar_error: bool = True) -> Optional[np.ndarray]:
+        num_muestras = len(error_siguiente_capa)
+        
+        if self.gradiente_combinado:
+            delta = error_siguiente_capa
+        else:
+            delta = self.derivada_activacion(
+                self.ultima_salida_activada, salida=self._delta[:num_muestras]
+            )
+            np.multiply(delta, error_siguiente_capa, out=delta)
+        
+        np.dot(self.ultima_entrada.T, delta, out=self.gradientes_pesos)
+        np.sum(delta, axis=0, keepdims=True, out=self.gradientes_sesgos)
         
-        self.gradientes_pesos = np.dot(self.ultima_entrada.T, delta)
-        self.gradientes_sesgos = np.sum(delta, axis=0, keepdims=True)
+        if not propagar_error:
+            return None
         
-        error_anterior = np.dot(delta, self.pesos.T)
+        error_anterior = self._error_anterior[:num_muestras]
+        np.dot(delta, self.pesos.T, out=error_anterior)
         
         return error_anterior
     
@@ -59,11 +131,27 @@ class CapaRed:
 
 class PerceptronMulticapa:
     
+    SUFIJO_MODELO = '.npz'
+    SUFIJO_PARAMETROS = '.parametros.npy'
+    PREFIJO_ESTADO_OPTIMIZADOR = 'optimizador_'
+    
     def __init__(self, arquitectura: List[int], 
-                 funciones_activacion: List[str] = None):
+                 funciones_activacion: List[str] = None,
+                 optimizador: Union[str, Optimizador, None] = None,
+                 tipo_datos: str = TIPO_DATOS_DEFECTO,
+                 funcion_perdida: str = 'error_cuadratico_medio'):
         if len(arquitectura) < 2:
             raise ValueError("La arquitectura debe tener al menos 2 capas (entrada y salida)")
         
+        if funcion_perdida not in FUNCIONES_PERDIDA:
+            raise ValueError(f"Función de pérdida '{funcion_perdida}' no válida. "
+                           f"Opciones: {list(FUNCIONES_PERDIDA)}")
+        
+        if np.dtype(tipo_datos).name not in TIPOS_DATOS_DISPONIBLES:
+            raise ValueError(f"Tipo de datos '{tipo_datos}' no válido. "
+                           f"Opciones: {list(TIPOS_DATOS_DISPONIBLES)}")
+        
+        self.tipo_datos = np.dtype(tipo_datos)
         self.arquitectura = arquitectura
         self.num_capas = len(arquitectura) - 1
         
@@ -73,18 +161,59 @@ class PerceptronMulticapa:
         if len(funciones_activacion) != self.num_capas:
             raise ValueError("Número de funciones de activación debe coincidir con número de capas")
         
+        if 'softmax' in funciones_activacion[:-1]:
+            raise ValueError("La función softmax solo puede usarse en la capa de salida")
+        
+        if funcion_perdida == 'entropia_cruzada':
+            if funciones_activacion[-1] not in ACTIVACIONES_SALIDA_ENTROPIA_CRUZADA:
+                raise ValueError(f"La entropía cruzada requiere una salida "
+                               f"{list(ACTIVACIONES_SALIDA_ENTROPIA_CRUZADA)}")
+        elif funciones_activacion[-1] == 'softmax':
+            raise ValueError("La salida softmax requiere la función de pérdida 'entropia_cruzada'")
+        
+        self.funcion_perdida = funcion_perdida
+        
         self.capas = []
         for i in range(self.num_capas):
             capa = CapaRed(
                 num_entradas=arquitectura[i],
                 num_neuronas=arquitectura[i + 1],
-                funcion_activacion=funciones_activacion[i]
+                funcion_activacion=funciones_activacion[i],
+                tipo_datos=self.tipo_datos
             )
             self.capas.append(capa)
         
+        self.capas[-1].gradiente_combinado = funcion_perdida == 'entropia_cruzada'
+        
+        self._vincular_parametros()
+        
+        self.optimizador = crear_optimizador(optimizador)
+        
+        self.error_salida = np.empty((0, arquitectura[-1]), dtype=self.tipo_datos)
+        
         self.evaluador = EvaluadorRendimiento()
         self.convergencia_alcanzada = False
         self.epoca_convergencia = 0
+        self.epocas_entrenadas = 0
+        self.perfilador: Optional[PerfiladorRed] = None
+    
+    def activar_perfilado(self, medir_memoria: bool = False) -> PerfiladorRed:
+        self.desactivar_perfilado()
+        
+        self.perfilador = PerfiladorRed(medir_memoria)
+        self.perfilador.instalar(self)
+        
+        return self.perfilador
+    
+    def desactivar_perfilado(self) -> Optional[dict]:
+        if self.perfilador is None:
+            return None
+        
+        reporte = self.perfilador.obtener_reporte()
+        self.perfilador.desinstalar()
+        self.perfilador = None
+        
+        return reporte
     
     def _propagacion_adelante(self, entradas: np.ndarray) -> np.ndarray:
         salida_actual = entradas
@@ -96,69 +225,407 @@ class PerceptronMulticapa:
     
     def _retropropagacion(self, salidas_esperadas: np.ndarray, 
                          salidas_obtenidas: np.ndarray) -> None:
-        error_actual = salidas_esperadas - salidas_obtenidas
+        num_muestras = len(salidas_obtenidas)
+        if num_muestras > len(self.error_salida) or self.error_salida.dtype != salidas_obtenidas.dtype:
+            self.error_salida = np.empty_like(salidas_obtenidas)
+        
+        error_actual = self.error_salida[:num_muestras]
+        np.subtract(salidas_esperadas, salidas_obtenidas, out=error_actual)
         
         for i in reversed(range(self.num_capas)):
-            error_actual = self.capas[i].calcular_gradientes(error_actual)
+            error_actual = self.capas[i].calcular_gradientes(error_actual, propagar_error=i > 0)
     
-    def _actualizar_pesos(self, tasa_aprendizaje: float) -> None:
+    def _calcular_error(self, salidas_esperadas: np.ndarray, salidas_obtenidas: np.ndarray) -> float:
+        if self.funcion_perdida == 'entropia_cruzada':
+            capa_salida = self.capas[-1]
+            return UtilidadesMatematicas.calcular_entropia_cruzada(
+                salidas_esperadas, capa_salida.ultima_salida_neta, capa_salida.nombre_funcion
+            )
+        
+        return UtilidadesMatematicas.calcular_error_cuadratico_medio(
+            salidas_esperadas, salidas_obtenidas
+        )
+    
+    def _vincular_parametros(self, parametros: Optional[np.ndarray] = None,
+                             gradientes: Optional[np.ndarray] = None) -> None:
+        total_parametros = sum(capa.num_parametros for capa in self.capas)
+        
+        copiar_valores = parametros is None
+        if parametros is None:
+            parametros = np.empty(total_parametros, dtype=self.tipo_datos)
+        elif parametros.shape != (total_parametros,) or parametros.dtype != self.tipo_datos:
+            raise ValueError(f"Se esperaba un buffer {self.tipo_datos.name} de "
+                           f"{total_parametros} parámetros")
+        
+        if gradientes is None:
+            gradientes = np.zeros(total_parametros, dtype=self.tipo_datos)
+        elif gradientes.shape != (total_parametros,) or gradientes.dtype != self.tipo_datos:
+            raise ValueError(f"Se esperaba un buffer {self.tipo_datos.name} de "
+                           f"{total_parametros} gradientes")
+        
+        self.parametros = parametros
+        self.gradientes = gradientes
+        
+        inicio = 0
         for capa in self.capas:
-            capa.actualizar_pesos(tasa_aprendizaje)
+            fin = inicio + capa.num_parametros
+            capa.vincular_buffers(self.parametros[inicio:fin], self.gradientes[inicio:fin],
+                                  copiar_valores)
+            inicio = fin
+    
+    def _actualizar_pesos(self, tasa_aprendizaje: float) -> None:
+        self.optimizador.actualizar([self.parametros], [self.gradientes], tasa_aprendizaje)
+    
+    def obtener_parametros(self) -> np.ndarray:
+        return self.parametros.copy()
+    
+    def establecer_parametros(self, parametros: np.ndarray) -> None:
+        if np.shape(parametros) != self.parametros.shape:
+            raise ValueError(f"Se esperaban {self.parametros.size} parámetros, "
+                           f"se recibieron {np.size(parametros)}")
+        
+        np.copyto(self.parametros, parametros)
+    
+    def calcular_norma_gradiente(self) -> float:
+        return float(np.sqrt(np.dot(self.gradientes, self.gradientes)))
+    
+    def _ejecutar_epoca_mini_lotes(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
+                                   indices: np.ndarray, lote_entradas: np.ndarray,
+                                   lote_salidas: np.ndarray, tasa_aprendizaje: float,
+                                   descartar_ultimo_lote: bool,
+                                   calcular_error: bool = True) -> Optional[float]:
+        num_muestras = len(indices)
+        tamaño_lote = len(lote_entradas)
+        
+        limite = num_muestras
+        if descartar_ultimo_lote:
+            limite -= num_muestras % tamaño_lote
+        
+        suma_errores = 0.0
+        muestras_vistas = 0
+        
+        for inicio in range(0, limite, tamaño_lote):
+            indices_lote = indices[inicio:inicio + tamaño_lote]
+            tamaño_actual = len(indices_lote)
+            
+            entradas_lote = lote_entradas[:tamaño_actual]
+            salidas_lote = lote_salidas[:tamaño_actual]
+            np.take(entradas, indices_lote, axis=0, out=entradas_lote)
+            np.take(salidas_esperadas, indices_lote, axis=0, out=salidas_lote)
+            
+            salidas_obtenidas = self._propagacion_adelante(entradas_lote)
+            
+            if calcular_error:
+                suma_errores += self._calcular_error(salidas_lote, salidas_obtenidas) * tamaño_actual
+                muestras_vistas += tamaño_actual
+            
+            self._retropropagacion(salidas_lote, salidas_obtenidas)
+            self._actualizar_pesos(tasa_aprendizaje)
+        
+        return suma_errores / muestras_vistas if calcular_error else None
+    
+    def _inferir(self, entradas: np.ndarray, buffers: Optional[List[np.ndarray]] = None,
+                 salida: Optional[np.ndarray] = None) -> np.ndarray:
+        salida_actual = entradas
+        num_muestras = len(entradas)
+        
+        for i, capa in enumerate(self.capas):
+            if i == self.num_capas - 1:
+                buffer = salida
+            else:
+                buffer = buffers[i][:num_muestras] if buffers is not None else None
+            salida_actual = capa.inferir(salida_actual, buffer)
+        
+        return salida_actual
     
     def predecir(self, entradas: np.ndarray) -> np.ndarray:
+        entradas = np.asarray(entradas, dtype=self.tipo_datos)
         if entradas.ndim == 1:
             entradas = entradas.reshape(1, -1)
         
-        return self._propagacion_adelante(entradas)
+        return self._inferir(entradas)
+    
+    @staticmethod
+    def _iterar_bloques(datos: Union[np.ndarray, Iterable[np.ndarray]],
+                        tamaño_lote: int) -> Iterator[np.ndarray]:
+        if isinstance(datos, np.ndarray):
+            for inicio in range(0, len(datos), tamaño_lote):
+                yield datos[inicio:inicio + tamaño_lote]
+            return
+        
+        for bloque in datos:
+            bloque = np.atleast_2d(bloque)
+            for inicio in range(0, len(bloque), tamaño_lote):
+                yield bloque[inicio:inicio + tamaño_lote]
+    
+    def predecir_por_lotes(self, datos: Union[np.ndarray, Iterable[np.ndarray]],
+                           tamaño_lote: int = TAMAÑO_BLOQUE_DEFECTO,
+                           salida: Optional[np.ndarray] = None) -> np.ndarray:
+        if tamaño_lote < 1:
+            raise ValueError("El tamaño de lote debe ser un entero positivo")
+        
+        num_salidas = self.arquitectura[-1]
+        
+        if salida is None and isinstance(datos, np.ndarray):
+            salida = np.empty((len(datos), num_salidas), dtype=self.tipo_datos)
+        
+        if salida is not None and (salida.dtype != self.tipo_datos or salida.ndim != 2
+                                   or salida.shape[1] != num_salidas):
+            raise ValueError(f"La salida debe ser un arreglo {self.tipo_datos.name} "
+                           f"de forma (n, {num_salidas})")
+        
+        buffers = [np.empty((tamaño_lote, capa.num_neuronas), dtype=self.tipo_datos)
+                   for capa in self.capas[:-1]]
+        bloque_salida = np.empty((tamaño_lote, num_salidas), dtype=self.tipo_datos)
+        resultados = []
+        escritos = 0
+        
+        for bloque in self._iterar_bloques(datos, tamaño_lote):
+            bloque = np.asarray(bloque, dtype=self.tipo_datos)
+            num_muestras = len(bloque)
+            
+            if salida is None:
+                resultados.append(self._inferir(bloque, buffers, bloque_salida[:num_muestras]).copy())
+            else:
+                if escritos + num_muestras > len(salida):
+                    raise ValueError(f"La salida tiene capacidad para {len(salida)} muestras "
+                                   f"y se recibieron más")
+                
+                destino = salida[escritos:escritos + num_muestras]
+                if destino.flags.c_contiguous:
+                    self._inferir(bloque, buffers, destino)
+                else:
+                    destino[...] = self._inferir(bloque, buffers, bloque_salida[:num_muestras])
+            
+            escritos += num_muestras
+        
+        if salida is None:
+            if not resultados:
+                return np.empty((0, num_salidas), dtype=self.tipo_datos)
+            return np.concatenate(resultados)
+        
+        return salida[:escritos]
     
     def entrenar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
                 tasa_aprendizaje: float = TASA_APRENDIZAJE_DEFECTO,
                 max_epocas: int = EPOCAS_MAXIMAS_DEFECTO,
                 error_objetivo: float = ERROR_OBJETIVO_DEFECTO,
                 mostrar_progreso: bool = True,
-                intervalo_impresion: int = INTERVALO_IMPRESION_DEFECTO) -> Tuple[bool, int]:
-        self.evaluador.limpiar_historial()
+                intervalo_impresion: int = INTERVALO_IMPRESION_DEFECTO,
+                tamaño_lote: Optional[int] = None,
+                mezclar: bool = True,
+                descartar_ultimo_lote: bool = False,
+                semilla: Optional[int] = None,
+                reanudar: bool = False,
+                ruta_checkpoint: Optional[str] = None,
+                intervalo_checkpoint: int = INTERVALO_IMPRESION_DEFECTO,
+                callbacks: Optional[List[CallbackEntrenamiento]] = None,
+                intervalo_error: int = INTERVALO_ERROR_DEFECTO) -> Tuple[bool, int]:
+        if not reanudar:
+            self.evaluador.limpiar_historial()
+            self.optimizador.reiniciar()
+            self.epocas_entrenadas = 0
+        
+        epoca_inicial = self.epocas_entrenadas
+        error_cuadratico = (self.evaluador.historial_errores.ultimo
+                            if self.evaluador.historial_errores else float('inf'))
+        
+        entradas = np.asarray(entradas, dtype=self.tipo_datos)
+        salidas_esperadas = np.asarray(salidas_esperadas, dtype=self.tipo_datos)
         
         if entradas.ndim == 1:
             entradas = entradas.reshape(1, -1)
         if salidas_esperadas.ndim == 1:
             salidas_esperadas = salidas_esperadas.reshape(-1, 1)
         
+        num_muestras = len(entradas)
+        usar_mini_lotes = tamaño_lote is not None and tamaño_lote < num_muestras
+        
+        if usar_mini_lotes:
+            if tamaño_lote < 1:
+                raise ValueError("El tamaño de lote debe ser un entero positivo")
+            
+            generador = np.random.RandomState(semilla) if semilla is not None else np.random
+            indices = np.arange(num_muestras)
+            lote_entradas = np.empty((tamaño_lote,) + entradas.shape[1:], dtype=entradas.dtype)
+            lote_salidas = np.empty((tamaño_lote,) + salidas_esperadas.shape[1:],
+                                    dtype=salidas_esperadas.dtype)
+        
+        callbacks = list(callbacks) if callbacks is not None else []
+        registro = {'tasa_aprendizaje': tasa_aprendizaje, 'error': None}
+        
         if mostrar_progreso:
             print(f"Iniciando entrenamiento...")
             print(f"Arquitectura: {self.arquitectura}")
             print(f"Tasa de aprendizaje: {tasa_aprendizaje}")
             print(f"Épocas máximas: {max_epocas}")
+            if epoca_inicial > 0:
+                print(f"Reanudando desde la época: {epoca_inicial}")
+            if usar_mini_lotes:
+                print(f"Tamaño de lote: {tamaño_lote}")
         
-        for epoca in range(max_epocas):
-            salidas_obtenidas = self._propagacion_adelante(entradas)
-            
-            error_cuadratico = UtilidadesMatematicas.calcular_error_cuadratico_medio(
-                salidas_esperadas, salidas_obtenidas
-            )
+        for callback in callbacks:
+            callback.al_iniciar_entrenamiento(self, registro)
+        
+        convergencia = False
+        epoca_final = max_epocas
+        
+        for epoca in range(epoca_inicial, max_epocas):
+            imprimir = mostrar_progreso and epoca % intervalo_impresion == 0
+            calcular_error = (imprimir or epoca % intervalo_error == 0
+                              or any(callback.requiere_error(epoca) for callback in callbacks))
             
-            self.evaluador.registrar_error(error_cuadratico)
+            if usar_mini_lotes:
+                if mezclar:
+                    generador.shuffle(indices)
+                
+                error_epoca = self._ejecutar_epoca_mini_lotes(
+                    entradas, salidas_esperadas, indices, lote_entradas, lote_salidas,
+                    registro['tasa_aprendizaje'], descartar_ultimo_lote, calcular_error
+                )
+            else:
+                salidas_obtenidas = self._propagacion_adelante(entradas)
+                
+                error_epoca = (self._calcular_error(salidas_esperadas, salidas_obtenidas)
+                               if calcular_error else None)
             
-            if error_cuadratico <= error_objetivo:
-                self.convergencia_alcanzada = True
-                self.epoca_convergencia = epoca + 1
-                if mostrar_progreso:
-                    print(f"{MENSAJE_CONVERGENCIA} Época: {self.epoca_convergencia}")
-                    print(f"Error final: {error_cuadratico:.6f}")
-                return True, self.epoca_convergencia
+            if error_epoca is not None:
+                error_cuadratico = error_epoca
+                self.evaluador.registrar_error(error_cuadratico)
+                
+                if error_cuadratico <= error_objetivo:
+                    self.convergencia_alcanzada = True
+                    self.epoca_convergencia = epoca + 1
+                    self.epocas_entrenadas = epoca + 1
+                    convergencia = True
+                    epoca_final = self.epoca_convergencia
+                    if mostrar_progreso:
+                        print(f"{MENSAJE_CONVERGENCIA} Época: {self.epoca_convergencia}")
+                        print(f"Error final: {error_cuadratico:.6f}")
+                    break
             
-            self._retropropagacion(salidas_esperadas, salidas_obtenidas)
+            if not usar_mini_lotes:
+                self._retropropagacion(salidas_esperadas, salidas_obtenidas)
+                
+                self._actualizar_pesos(registro['tasa_aprendizaje'])
             
-            self._actualizar_pesos(tasa_aprendizaje)
+            self.epocas_entrenadas = epoca + 1
             
-            if mostrar_progreso and epoca % intervalo_impresion == 0:
+            if imprimir:
                 print(f"Época {epoca:>6}: Error = {error_cuadratico:.6f}")
+            
+            if ruta_checkpoint is not None and (epoca + 1) % intervalo_checkpoint == 0:
+                self.guardar(ruta_checkpoint)
+            
+            registro['error'] = error_epoca
+            if CallbackEntrenamiento.notificar_fin_epoca(callbacks, self, epoca, registro):
+                epoca_final = epoca + 1
+                break
         
-        if mostrar_progreso:
-            print(MENSAJE_NO_CONVERGENCIA)
+        registro['error'] = error_cuadratico
+        registro['convergencia'] = convergencia
+        for callback in callbacks:
+            callback.al_finalizar_entrenamiento(self, registro)
+        
+        if mostrar_progreso and not convergencia:
+            print(registro.get('motivo_detencion', MENSAJE_NO_CONVERGENCIA))
             print(f"Error final: {error_cuadratico:.6f}")
         
-        return False, max_epocas
+        return convergencia, epoca_final
+    
+    def calcular_error_conjunto(self, entradas: np.ndarray, salidas_esperadas: np.ndarray) -> float:
+        entradas = np.asarray(entradas, dtype=self.tipo_datos)
+        salidas_esperadas = np.asarray(salidas_esperadas, dtype=self.tipo_datos)
+        
+        if entradas.ndim == 1:
+            entradas = entradas.reshape(1, -1)
+        if salidas_esperadas.ndim == 1:
+            salidas_esperadas = salidas_esperadas.reshape(-1, 1)
+        
+        return float(self._calcular_error(salidas_esperadas, self._propagacion_adelante(entradas)))
+    
+    @classmethod
+    def _obtener_rutas_modelo(cls, ruta: str) -> Tuple[str, str]:
+        if ruta.endswith(cls.SUFIJO_MODELO):
+            ruta = ruta[:-len(cls.SUFIJO_MODELO)]
+        return ruta + cls.SUFIJO_MODELO, ruta + cls.SUFIJO_PARAMETROS
+    
+    @staticmethod
+    def _reemplazar_archivo(ruta: str, escribir: Callable) -> None:
+        ruta_temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(ruta_temporal, 'wb') as archivo:
+            escribir(archivo)
+        os.replace(ruta_temporal, ruta)
+    
+    def guardar(self, ruta: str) -> str:
+        ruta_modelo, ruta_parametros = self._obtener_rutas_modelo(ruta)
+        
+        directorio = os.path.dirname(ruta_modelo)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        
+        metadatos = {
+            'arquitectura': list(self.arquitectura),
+            'funciones_activacion': [capa.nombre_funcion for capa in self.capas],
+            'tipo_datos': self.tipo_datos.name,
+            'funcion_perdida': self.funcion_perdida,
+            'optimizador': self.optimizador.obtener_configuracion(),
+            'convergencia_alcanzada': bool(self.convergencia_alcanzada),
+            'epoca_convergencia': int(self.epoca_convergencia),
+            'epocas_entrenadas': int(self.epocas_entrenadas)
+        }
+        
+        estado_optimizador = {
+            self.PREFIJO_ESTADO_OPTIMIZADOR + nombre: arreglo
+            for nombre, arreglo in self.optimizador.obtener_estado().items()
+        }
+        
+        self._reemplazar_archivo(ruta_parametros, lambda archivo: np.save(archivo, self.parametros))
+        self._reemplazar_archivo(ruta_modelo, lambda archivo: np.savez(
+            archivo,
+            metadatos=np.array(json.dumps(metadatos)),
+            historial_errores=np.asarray(self.evaluador.historial_errores, dtype=float),
+            historial_precision=np.asarray(self.evaluador.historial_precision, dtype=float),
+            **estado_optimizador
+        ))
+        
+        return ruta_modelo
+    
+    @classmethod
+    def cargar(cls, ruta: str, mmap_mode: Optional[str] = None) -> 'PerceptronMulticapa':
+        ruta_modelo, ruta_parametros = cls._obtener_rutas_modelo(ruta)
+        
+        with np.load(ruta_modelo) as archivo:
+            metadatos = json.loads(str(archivo['metadatos']))
+            historial_errores = archivo['historial_errores']
+            historial_precision = archivo['historial_precision']
+            estado_optimizador = {
+                nombre[len(cls.PREFIJO_ESTADO_OPTIMIZADOR):]: archivo[nombre]
+                for nombre in archivo.files if nombre.startswith(cls.PREFIJO_ESTADO_OPTIMIZADOR)
+            }
+        
+        configuracion_optimizador = dict(metadatos['optimizador'])
+        optimizador = crear_optimizador(configuracion_optimizador.pop('nombre'),
+                                        **configuracion_optimizador)
+        
+        red = cls(metadatos['arquitectura'], metadatos['funciones_activacion'],
+                  optimizador, metadatos['tipo_datos'],
+                  metadatos.get('funcion_perdida', 'error_cuadratico_medio'))
+        
+        parametros = np.load(ruta_parametros, mmap_mode=mmap_mode)
+        if mmap_mode is None:
+            red.establecer_parametros(parametros)
+        else:
+            red._vincular_parametros(parametros)
+        
+        red.optimizador.establecer_estado(estado_optimizador, [red.parametros])
+        red.evaluador.historial_errores.extender(historial_errores)
+        red.evaluador.historial_precision.extender(historial_precision)
+        red.convergencia_alcanzada = metadatos['convergencia_alcanzada']
+        red.epoca_convergencia = metadatos['epoca_convergencia']
+        red.epocas_entrenadas = metadatos.get('epocas_entrenadas', len(historial_errores))
+        
+        return red
     
     def evaluar(self, entradas: np.ndarray, salidas_esperadas: np.ndarray,
                tipo_problema: str = 'regresion') -> dict:
@@ -178,14 +645,13 @@ class PerceptronMulticapa:
             }
     
     def obtener_informacion_red(self) -> dict:
-        total_parametros = 0
-        for capa in self.capas:
-            total_parametros += capa.pesos.size + capa.sesgos.size
-        
         info = {
             'arquitectura': self.arquitectura,
             'num_capas': self.num_capas,
-            'total_parametros': total_parametros,
+            'total_parametros': self.parametros.size,
+            'tipo_datos': self.tipo_datos.name,
+            'funcion_perdida': self.funcion_perdida,
+            'optimizador': self.optimizador.obtener_configuracion(),
             'convergencia_alcanzada': self.convergencia_alcanzada,
             'epoca_convergencia': self.epoca_convergencia
         }
@@ -193,6 +659,9 @@ class PerceptronMulticapa:
         estadisticas = self.evaluador.obtener_estadisticas_entrenamiento()
         info.update(estadisticas)
         
+        if self.perfilador is not None:
+            info['perfil'] = self.perfilador.obtener_reporte()
+        
         return info
     
     def obtener_pesos_por_capa(self) -> List[Tuple[np.ndarray, np.ndarray]]:
@@ -0,0 +1,174 @@
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+class PerfiladorRed:
+
+    METODOS_CAPA = ('propagacion_adelante', 'calcular_gradientes')
+    METODOS_RED = ('_calcular_error', '_actualizar_pesos')
+    
+    def __init__(self, medir_memoria: bool = False):
+        self.medir_memoria = medir_memoria
+        self.red = None
+        self._inicio_tracemalloc = False
+        self.reiniciar()
+    
+    @staticmethod
+    def _crear_registro() -> Dict[str, float]:
+        return {'llamadas': 0, 'tiempo': 0.0, 'bytes': 0, 'flops': 0}
+    
+    def reiniciar(self) -> None:
+        num_capas = len(self.red.capas) if self.red is not None else 0
+        self.registros_adelante = [self._crear_registro() for _ in range(num_capas)]
+        self.registros_atras = [self._crear_registro() for _ in range(num_capas)]
+        self.registro_perdida = self._crear_registro()
+        self.registro_actualizacion = self._crear_registro()
+    
+    @staticmethod
+    def calcular_flops_adelante(capa, num_muestras: int) -> int:
+        return num_muestras * capa.num_neuronas * (2 * capa.num_entradas + 2)
+    
+    @staticmethod
+    def calcular_flops_atras(capa, num_muestras: int, propagar_error: bool) -> int:
+        flops = num_muestras * capa.num_neuronas * (2 * capa.num_entradas + 1)
+        if not capa.gradiente_combinado:
+            flops += 2 * num_muestras * capa.num_neuronas
+        if propagar_error:
+            flops += 2 * num_muestras * capa.num_neuronas * capa.num_entradas
+        return flops
+    
+    def _medir(self, registro: Dict[str, float], flops: int, funcion: Callable, *args, **kwargs):
+        if self.medir_memoria:
+            memoria_inicial = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        
+        inicio = time.perf_counter()
+        resultado = funcion(*args, **kwargs)
+        registro['tiempo'] += time.perf_counter() - inicio
+        
+        if self.medir_memoria:
+            registro['bytes'] += tracemalloc.get_traced_memory()[1] - memoria_inicial
+        
+        registro['llamadas'] += 1
+        registro['flops'] += flops
+        return resultado
+    
+    def _envolver_capa(self, indice: int, capa) -> None:
+        propagacion_original = capa.propagacion_adelante
+        gradientes_original = capa.calcular_gradientes
+        
+        def propagacion_adelante(entradas):
+            flops = self.calcular_flops_adelante(capa, len(entradas))
+            return self._medir(self.registros_adelante[indice], flops,
+                               propagacion_original, entradas)
+        
+        def calcular_gradientes(error_siguiente_capa, propagar_error=True):
+            flops = self.calcular_flops_atras(capa, len(error_siguiente_capa), propagar_error)
+            return self._medir(self.registros_atras[indice], flops,
+                               gradientes_original, error_siguiente_capa, propagar_error)
+        
+        capa.propagacion_adelante = propagacion_adelante
+        capa.calcular_gradientes = calcular_gradientes
+    
+    def _envolver_red(self, red) -> None:
+        error_original = red._calcular_error
+        actualizacion_original = red._actualizar_pesos
+        
+        def calcular_error(salidas_esperadas, salidas_obtenidas):
+            flops = 3 * salidas_obtenidas.size
+            return self._medir(self.registro_perdida, flops, error_original,
+                               salidas_esperadas, salidas_obtenidas)
+        
+        def actualizar_pesos(tasa_aprendizaje):
+            flops = 2 * red.parametros.size
+            return self._medir(self.registro_actualizacion, flops, actualizacion_original,
+                               tasa_aprendizaje)
+        
+        red._calcular_error = calcular_error
+        red._actualizar_pesos = actualizar_pesos
+    
+    def instalar(self, red) -> None:
+        if self.red is not None:
+            raise ValueError("El perfilador ya está instalado en una red")
+        
+        self.red = red
+        self.reiniciar()
+        
+        for indice, capa in enumerate(red.capas):
+            self._envolver_capa(indice, capa)
+        self._envolver_red(red)
+        
+        if self.medir_memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._inicio_tracemalloc = True
+    
+    def desinstalar(self) -> None:
+        if self.red is None:
+            return
+        
+        for capa in self.red.capas:
+            for metodo in self.METODOS_CAPA:
+                capa.__dict__.pop(metodo, None)
+        for metodo in self.METODOS_RED:
+            self.red.__dict__.pop(metodo, None)
+        
+        if self._inicio_tracemalloc:
+            tracemalloc.stop()
+            self._inicio_tracemalloc = False
+        
+        self.red = None
+    
+    @staticmethod
+    def _resumir_registro(registro: Dict[str, float]) -> Dict[str, float]:
+        resumen = dict(registro)
+        resumen['gflops_por_segundo'] = (registro['flops'] / registro['tiempo'] / 1e9
+                                         if registro['tiempo'] > 0 else 0.0)
+        return resumen
+    
+    def obtener_reporte(self) -> dict:
+        capas: List[dict] = []
+        for indice, (adelante, atras) in enumerate(zip(self.registros_adelante, self.registros_atras)):
+            capa = self.red.capas[indice] if self.red is not None else None
+            capas.append({
+                'capa': indice,
+                'forma': (capa.num_entradas, capa.num_neuronas) if capa is not None else None,
+                'funcion_activacion': capa.nombre_funcion if capa is not None else None,
+                'adelante': self._resumir_registro(adelante),
+                'atras': self._resumir_registro(atras)
+            })
+        
+        registros = (self.registros_adelante + self.registros_atras
+                     + [self.registro_perdida, self.registro_actualizacion])
+        
+        return {
+            'capas': capas,
+            'perdida': self._resumir_registro(self.registro_perdida),
+            'actualizacion': self._resumir_registro(self.registro_actualizacion),
+            'tiempo_total': sum(registro['tiempo'] for registro in registros),
+            'flops_totales': sum(registro['flops'] for registro in registros),
+            'bytes_totales': sum(registro['bytes'] for registro in registros),
+            'memoria_medida': self.medir_memoria
+        }
+    
+    def mostrar_reporte(self) -> None:
+        reporte = self.obtener_reporte()
+        tiempo_total = reporte['tiempo_total'] or 1.0
+        
+        print(f"{'Etapa':<22} {'Llamadas':>9} {'Tiempo (ms)':>12} {'%':>6} "
+              f"{'MFLOP':>10} {'GFLOP/s':>8} {'KiB':>10}")
+        
+        filas = []
+        for capa in reporte['capas']:
+            forma = f"{capa['forma'][0]}x{capa['forma'][1]}" if capa['forma'] else ''
+            filas.append((f"Capa {capa['capa']} {forma} adelante", capa['adelante']))
+            filas.append((f"Capa {capa['capa']} {forma} atrás", capa['atras']))
+        filas.append(("Pérdida", reporte['perdida']))
+        filas.append(("Actualización", reporte['actualizacion']))
+        
+        for nombre, registro in filas:
+            print(f"{nombre:<22} {registro['llamadas']:>9} {registro['tiempo'] * 1e3:>12.3f} "
+                  f"{100 * registro['tiempo'] / tiempo_total:>6.1f} {registro['flops'] / 1e6:>10.2f} "
+                  f"{registro['gflops_por_segundo']:>8.2f} {registro['bytes'] / 1024:>10.1f}")
+        
+        print(f"{'Total':<22} {'':>9} {reporte['tiempo_total'] * 1e3:>12.3f} {100.0:>6.1f} "
+              f"{reporte['flops_totales'] / 1e6:>10.2f}")